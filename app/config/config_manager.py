@@ -11,12 +11,86 @@ Version: 1.0.0
 """
 
 import os
+import re
 import configparser
 import logging
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Callable, Optional, Tuple, Union
 from pathlib import Path
 
 
+# Sentinel for cache misses (None is a valid cached value)
+_MISSING = object()
+
+# Line patterns for the INI reader
+_SECTION = re.compile(r'^\[([^\]\r\n]+)\][ \t]*\r?$', re.M)
+_KV = re.compile(r'^([^;#=\s\[][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*\r?$', re.M)
+
+# Lines outside that subset (indented continuations, bare keys, ':' before the
+# first '=', lines starting with '=', a [DEFAULT] section, '[' lines that are
+# not a plain header such as "[Display] ; comment", or keys before the first
+# section header)
+_UNSUPPORTED = re.compile(
+    r'^(?:[ \t]+[^\s;#]|[^;#\[\s=][^=\r\n]*(?:\r?$|:)|='
+    r'|\[DEFAULT\][ \t]*\r?$|\[(?![^\]\r\n]+\][ \t]*\r?$))'
+    r'|\A(?:[ \t\r]*(?:[;#][^\n]*)?\n)*[^\s;#\[]',
+    re.M,
+)
+
+
+def _to_bool(value: str) -> bool:
+    """Convert a config string to a boolean"""
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+def _converter_for(default: Any) -> Callable[[str], Any]:
+    """Get the string converter matching a default value's type"""
+    if isinstance(default, bool):
+        return _to_bool
+    elif isinstance(default, int):
+        return int
+    elif isinstance(default, float):
+        return float
+    else:
+        return str
+
+
+def _new_parser() -> configparser.ConfigParser:
+    """Create a ConfigParser without interpolation or multi-line values"""
+    return configparser.ConfigParser(interpolation=None, empty_lines_in_values=False, strict=False)
+
+
+def _fast_parse(path: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Parse a simple INI file into raw string values
+    
+    Handles the subset of INI used by this application: [section] headers,
+    key = value lines and full-line ';' / '#' comments. Keys are lower-cased
+    like configparser does. Files using anything else are handed to
+    configparser's read_string on the already-read text.
+    
+    Args:
+        path: Path to the INI file
+        
+    Returns:
+        Dictionary of sections mapping keys to raw string values
+    """
+    text = path.read_text(encoding='utf-8')
+    if _UNSUPPORTED.search(text):
+        parser = _new_parser()
+        parser.read_string(text, source=str(path))
+        return {section: dict(parser.items(section, raw=True)) for section in parser.sections()}
+    
+    headers = list(_SECTION.finditer(text))
+    
+    sections: Dict[str, Dict[str, str]] = {}
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(text)
+        values = sections.setdefault(header.group(1), {})
+        for match in _KV.finditer(text, header.end(), end):
+            values[match.group(1).strip().lower()] = match.group(2)
+    return sections
+
+
 class ConfigManager:
     """
     Advanced configuration management system
@@ -27,6 +101,9 @@ class ConfigManager:
     - Type conversion and validation
     - Default value management
     - Configuration hot-reloading
+    
+    The configuration file is loaded lazily on first access, and typed
+    values are cached per (section, key) until they are set or reloaded.
     """
     
     def __init__(self, config_file: str = "config.ini"):
@@ -37,15 +114,21 @@ class ConfigManager:
             config_file: Path to the configuration file
         """
         self.config_file = config_file
-        self.config = configparser.ConfigParser()
+        self._sections: Dict[str, Dict[str, str]] = {}
         self._defaults: Dict[str, Dict[str, Any]] = {}
+        self._converters: Dict[Tuple[str, str], Callable[[str], Any]] = {}
+        self._cache: Dict[Tuple[str, str], Any] = {}
         self._loaded = False
+        self._file_mtime_ns: Optional[int] = None
+        self._file_size: Optional[int] = None
         
         # Set up logging
         self.logger = logging.getLogger(__name__)
-        
-        # Load configuration
-        self.load_config()
+    
+    def _ensure_loaded(self) -> None:
+        """Load the configuration file on first use"""
+        if not self._loaded:
+            self.load_config()
     
     def load_config(self) -> bool:
         """
@@ -62,16 +145,21 @@ class ConfigManager:
                 self.logger.warning(f"Configuration file not found: {config_path}")
                 self._create_default_config(config_path)
             
-            # Read the configuration file
-            self.config.read(config_path, encoding='utf-8')
-            
             # Set up default values
             self._setup_defaults()
             
+            # Read the configuration file and cache typed values
+            self._cache.clear()
+            self._sections = _fast_parse(config_path)
+            for section, values in self._sections.items():
+                for key, value in values.items():
+                    self._cache_value(section, key, value)
+            
             # Override with environment variables
             self._apply_environment_overrides()
             
             self._loaded = True
+            self._remember_file_stamp(config_path)
             self.logger.info(f"Configuration loaded successfully from {config_path}")
             return True
             
@@ -80,11 +168,25 @@ class ConfigManager:
             self._setup_defaults()
             return False
     
+    def _remember_file_stamp(self, config_path: Path) -> None:
+        """Record the file's mtime and size for reload checks"""
+        st = config_path.stat()
+        self._file_mtime_ns = st.st_mtime_ns
+        self._file_size = st.st_size
+    
+    def _file_unchanged(self, config_path: Path) -> bool:
+        """Check whether the file matches the last loaded/saved version"""
+        try:
+            st = config_path.stat()
+        except OSError:
+            return False
+        return (st.st_mtime_ns, st.st_size) == (self._file_mtime_ns, self._file_size)
+    
     def _create_default_config(self, config_path: Path) -> None:
         """Create a default configuration file"""
         try:
             # Create default configuration
-            default_config = configparser.ConfigParser()
+            default_config = _new_parser()
             
             # Display settings
             default_config['Display'] = {
@@ -206,6 +308,13 @@ class ConfigManager:
                 'log_file': 'demo.log'
             }
         }
+        
+        # Resolve each key's converter once instead of per access
+        self._converters = {
+            (section, key): _converter_for(default)
+            for section, values in self._defaults.items()
+            for key, default in values.items()
+        }
     
     def _apply_environment_overrides(self) -> None:
         """Apply environment variable overrides to configuration"""
@@ -228,20 +337,23 @@ class ConfigManager:
             if env_var in os.environ:
                 value = os.environ[env_var]
                 # Convert value to appropriate type
-                converted_value = self._convert_value(value, self._defaults[section][key])
-                self.set(section, key, converted_value)
+                converted_value = self._converters[(section, key)](value)
+                self._set_value(section, key, converted_value)
                 self.logger.debug(f"Applied environment override: {env_var}={value}")
     
     def _convert_value(self, value: str, target_type: Any) -> Any:
         """Convert string value to appropriate type"""
-        if isinstance(target_type, bool):
-            return value.lower() in ('true', '1', 'yes', 'on')
-        elif isinstance(target_type, int):
-            return int(value)
-        elif isinstance(target_type, float):
-            return float(value)
-        else:
+        return _converter_for(target_type)(value)
+    
+    def _cache_value(self, section: str, key: str, value: str) -> Any:
+        """Convert a raw value based on defaults and cache it"""
+        try:
+            value = self._converters.get((section, key), str)(value)
+        except ValueError:
+            # Leave invalid values uncached so get() reports them
             return value
+        self._cache[(section, key)] = value
+        return value
     
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """
@@ -256,15 +368,20 @@ class ConfigManager:
             Configuration value
         """
         try:
-            if not self._loaded:
-                self.load_config()
+            # Keys are stored lower-cased, so cache them the same way
+            cache_key = (section, key.lower())
+            hit = self._cache.get(cache_key, _MISSING)
+            if hit is not _MISSING:
+                return hit
+            
+            self._ensure_loaded()
             
             # Try to get from config file
-            if self.config.has_section(section) and self.config.has_option(section, key):
-                value = self.config.get(section, key)
+            values = self._sections.get(section)
+            if values is not None and cache_key[1] in values:
                 # Convert to appropriate type based on defaults
-                if section in self._defaults and key in self._defaults[section]:
-                    return self._convert_value(value, self._defaults[section][key])
+                value = self._converters.get(cache_key, str)(values[cache_key[1]])
+                self._cache[cache_key] = value
                 return value
             
             # Return default value
@@ -293,11 +410,15 @@ class ConfigManager:
         Returns:
             True if successful, False otherwise
         """
+        self._ensure_loaded()
+        return self._set_value(section, key, value)
+    
+    def _set_value(self, section: str, key: str, value: Any) -> bool:
+        """Store a value without triggering a lazy load"""
         try:
-            if not self.config.has_section(section):
-                self.config.add_section(section)
-            
-            self.config.set(section, key, str(value))
+            key = key.lower()
+            self._sections.setdefault(section, {})[key] = str(value)
+            self._cache.pop((section, key), None)
             return True
             
         except Exception as e:
@@ -314,10 +435,10 @@ class ConfigManager:
         Returns:
             Dictionary of section values
         """
+        self._ensure_loaded()
         result = {}
-        if self.config.has_section(section):
-            for key in self.config.options(section):
-                result[key] = self.get(section, key)
+        for key in self._sections.get(section, {}):
+            result[key] = self.get(section, key)
         return result
     
     def save_config(self) -> bool:
@@ -328,9 +449,13 @@ class ConfigManager:
             True if successful, False otherwise
         """
         try:
+            self._ensure_loaded()
             config_path = Path(__file__).parent / self.config_file
+            parser = _new_parser()
+            parser.read_dict(self._sections)
             with open(config_path, 'w', encoding='utf-8') as f:
-                self.config.write(f)
+                parser.write(f)
+            self._remember_file_stamp(config_path)
             
             self.logger.info(f"Configuration saved to {config_path}")
             return True
@@ -343,10 +468,18 @@ class ConfigManager:
         """
         Reload configuration from file
         
+        The reload is skipped when the file's mtime and size are unchanged
+        since it was last loaded or saved.
+        
         Returns:
             True if successful, False otherwise
         """
+        config_path = Path(__file__).parent / self.config_file
+        if self._loaded and self._file_unchanged(config_path):
+            return True
+        
         self._loaded = False
+        self._cache.clear()
         return self.load_config()
     
     def get_all_config(self) -> Dict[str, Dict[str, Any]]:
@@ -356,37 +489,36 @@ class ConfigManager:
         Returns:
             Dictionary of all configuration sections and values
         """
+        self._ensure_loaded()
         result = {}
-        for section in self.config.sections():
+        for section in self._sections:
             result[section] = self.get_section(section)
         return result
 
 
 # Global configuration manager instance
-_config_manager: Optional[ConfigManager] = None
+# Created at import; construction is cheap since the file loads lazily
+_config_manager: ConfigManager = ConfigManager()
 
 
 def get_config_manager() -> ConfigManager:
     """Get the global configuration manager instance"""
-    global _config_manager
-    if _config_manager is None:
-        _config_manager = ConfigManager()
     return _config_manager
 
 
 def get_config(section: str, key: str, default: Any = None) -> Any:
     """Get a configuration value"""
-    return get_config_manager().get(section, key, default)
+    return _config_manager.get(section, key, default)
 
 
 def set_config(section: str, key: str, value: Any) -> bool:
     """Set a configuration value"""
-    return get_config_manager().set(section, key, value)
+    return _config_manager.set(section, key, value)
 
 
 def get_config_section(section: str) -> Dict[str, Any]:
     """Get all values from a configuration section"""
-    return get_config_manager().get_section(section)
+    return _config_manager.get_section(section)
 
 
 if __name__ == "__main__":
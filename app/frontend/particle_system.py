@@ -12,13 +12,17 @@ Version: 1.0.0
 import pygame
 import random
 import math
-from typing import List, Tuple, Optional, Callable
-from dataclasses import dataclass
+import numpy as np
+from collections import deque
+from functools import lru_cache
+from typing import Deque, List, Tuple, Optional, Callable, Iterator
+from dataclasses import dataclass, field
 
 # Use absolute imports for better compatibility
 try:
     from app.utils.math_utils import clamp, lerp, random_range, distance
     from app.utils.color_utils import Color, random_color, random_bright_color
+    from app.utils.jit import njit, prange, NUMBA_AVAILABLE
 except ImportError:
     # Fallback for direct script execution
     import sys
@@ -26,9 +30,129 @@ except ImportError:
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from app.utils.math_utils import clamp, lerp, random_range, distance
     from app.utils.color_utils import Color, random_color, random_bright_color
+    from app.utils.jit import njit, prange, NUMBA_AVAILABLE
 
 
-@dataclass
+# Particle counts above this use the multi-threaded update kernel; below it
+# the thread start-up cost outweighs the work being split
+PARALLEL_UPDATE_THRESHOLD = 4096
+
+# Frames with at least this many particles are rasterized straight into the
+# surface's pixels by a Numba kernel; smaller counts use sprite blits
+SPLAT_THRESHOLD = 256
+
+# Shared generator for batched emission
+_rng = np.random.default_rng()
+
+
+def _update_particles(x, y, vx, vy, life, max_life, alpha, rotation, rotation_speed,
+                      gravity, friction, dt, n):
+    """
+    Fused per-particle physics step over the first n slots of a buffer
+    
+    Updates position, velocity, rotation, life and alpha in place in a
+    single pass and returns the number of particles still alive.
+    """
+    alive = 0
+    for i in prange(n):
+        x[i] += vx[i] * dt
+        y[i] += vy[i] * dt
+        vy[i] += gravity[i] * dt
+        vx[i] *= friction[i]
+        vy[i] *= friction[i]
+        rotation[i] += rotation_speed[i] * dt
+        life[i] -= dt
+        alpha[i] = 255.0 * life[i] / max_life[i]
+        if life[i] > 0:
+            alive += 1
+    return alive
+
+
+def _update_trails(trail_x, trail_y, trail_count, x, y, n):
+    """
+    Shift each particle's trail by one and append its current position
+    
+    Trails are stored oldest first, so the shift moves every row left in
+    place and the newest position goes in the last column.
+    """
+    trail_length = trail_x.shape[1]
+    for i in prange(n):
+        for j in range(trail_length - 1):
+            trail_x[i, j] = trail_x[i, j + 1]
+            trail_y[i, j] = trail_y[i, j + 1]
+        trail_x[i, trail_length - 1] = x[i]
+        trail_y[i, trail_length - 1] = y[i]
+        if trail_count[i] < trail_length:
+            trail_count[i] += 1
+
+
+def _splat_disk(pixels, cx, cy, radius, a, r, g, b):
+    """Alpha-blend one filled disk into an (x, y, rgb) pixel array"""
+    width = pixels.shape[0]
+    height = pixels.shape[1]
+    left = cx - radius
+    top = cy - radius
+    radius_sq = radius * radius
+    for px in range(max(left, 0), min(cx + radius, width)):
+        dx = px - cx
+        for py in range(max(top, 0), min(cy + radius, height)):
+            dy = py - cy
+            if dx * dx + dy * dy <= radius_sq:
+                red = pixels[px, py, 0]
+                green = pixels[px, py, 1]
+                blue = pixels[px, py, 2]
+                pixels[px, py, 0] = np.uint8(red + (r - red) * a + 0.5)
+                pixels[px, py, 1] = np.uint8(green + (g - green) * a + 0.5)
+                pixels[px, py, 2] = np.uint8(blue + (b - blue) * a + 0.5)
+
+
+def _splat_particles(pixels, x, y, size, alpha, r, g, b, trail_x, trail_y, trail_count, n):
+    """
+    Rasterize the first n particles of a buffer, each above its own trail
+    
+    Runs serially so overlapping disks blend in the same order as the
+    sprite blits path.
+    """
+    trail_length = trail_x.shape[1]
+    for i in range(n):
+        radius = size[i]
+        if radius <= 0:
+            continue
+        red = np.float32(r[i])
+        green = np.float32(g[i])
+        blue = np.float32(b[i])
+        
+        count = trail_count[i]
+        start = trail_length - count
+        for j in range(count):
+            a = np.float32(j / count)
+            if a > 0:
+                _splat_disk(pixels, int(trail_x[i, start + j]), int(trail_y[i, start + j]), radius, a, red, green, blue)
+        
+        a = min(max(alpha[i] / np.float32(255.0), np.float32(0.0)), np.float32(1.0))
+        if a > 0:
+            _splat_disk(pixels, int(x[i]), int(y[i]), radius, a, red, green, blue)
+
+
+# Explicit signatures compile the kernels at import (or load them from the
+# on-disk cache) instead of stalling the first frame that updates particles
+_UPDATE_SIGNATURE = 'int64(' + ', '.join(['float32[::1]'] * 11) + ', float64, int64)'
+_TRAIL_SIGNATURE = 'void(float32[:, ::1], float32[:, ::1], int32[::1], float32[::1], float32[::1], int64)'
+
+_update_kernel = njit(_UPDATE_SIGNATURE, fastmath=True, cache=True)(_update_particles)
+_update_kernel_parallel = njit(_UPDATE_SIGNATURE, parallel=True, fastmath=True, cache=True)(_update_particles)
+_trail_kernel = njit(_TRAIL_SIGNATURE, cache=True)(_update_trails)
+_trail_kernel_parallel = njit(_TRAIL_SIGNATURE, parallel=True, cache=True)(_update_trails)
+_splat_disk = njit(
+    'void(uint8[:, :, :], int64, int64, int64, float32, float32, float32, float32)', cache=True
+)(_splat_disk)
+_splat_kernel = njit(
+    'void(uint8[:, :, :], float32[::1], float32[::1], int32[::1], float32[::1], uint8[::1], uint8[::1], '
+    'uint8[::1], float32[:, ::1], float32[:, ::1], int32[::1], int64)', cache=True
+)(_splat_particles)
+
+
+@dataclass(slots=True)
 class Particle:
     """Individual particle data"""
     x: float
@@ -45,12 +169,18 @@ class Particle:
     gravity: float = 0.0
     friction: float = 0.98
     trail_length: int = 0
-    trail_positions: List[Tuple[float, float]] = None
+    trail_positions: Deque[Tuple[float, float]] = None
+    int_size: int = field(init=False, repr=False)
+    dim: int = field(init=False, repr=False)
     
     def __post_init__(self):
         """Initialize particle after creation"""
-        if self.trail_positions is None:
-            self.trail_positions = []
+        # Integer radius and sprite dimension, computed once at emission
+        self.int_size = int(self.size)
+        self.dim = self.int_size * 2
+        
+        # Rolling buffer that drops the oldest position on append
+        self.trail_positions = deque(self.trail_positions or (), maxlen=max(0, self.trail_length))
     
     def update(self, dt: float) -> bool:
         """
@@ -62,40 +192,315 @@ class Particle:
         Returns:
             True if particle is still alive
         """
-        # Update position
-        self.x += self.vx * dt
-        self.y += self.vy * dt
+        friction = self.friction
+        vx = self.vx
+        vy = self.vy
         
-        # Apply gravity
-        self.vy += self.gravity * dt
+        # Update position
+        x = self.x + vx * dt
+        y = self.y + vy * dt
         
-        # Apply friction
-        self.vx *= self.friction
-        self.vy *= self.friction
+        # Apply gravity, then friction
+        vy += self.gravity * dt
+        self.vx = vx * friction
+        self.vy = vy * friction
+        self.x = x
+        self.y = y
         
         # Update rotation
         self.rotation += self.rotation_speed * dt
         
-        # Update life
-        self.life -= dt
-        
-        # Update alpha based on life
-        life_ratio = self.life / self.max_life
-        self.alpha = 255.0 * life_ratio
+        # Update life and alpha based on life
+        life = self.life - dt
+        self.life = life
+        self.alpha = 255.0 * (life / self.max_life)
         
         # Update trail
         if self.trail_length > 0:
-            self.trail_positions.append((self.x, self.y))
-            if len(self.trail_positions) > self.trail_length:
-                self.trail_positions.pop(0)
+            self.trail_positions.append((x, y))
         
-        return self.life > 0
+        return life > 0
     
     def get_color_with_alpha(self) -> Tuple[int, int, int, int]:
         """Get color with current alpha"""
         return (self.color.r, self.color.g, self.color.b, int(self.alpha))
 
 
+class ParticleBuffer:
+    """
+    Structure-of-arrays particle storage
+    
+    Particles are stored as preallocated NumPy columns instead of a list of
+    Particle objects, so a whole emitter can be updated with a handful of
+    vectorized operations per frame.
+    """
+    
+    FLOAT_FIELDS = (
+        'x', 'y', 'vx', 'vy', 'life', 'max_life', 'size', 'alpha',
+        'rotation', 'rotation_speed', 'gravity', 'friction'
+    )
+    COLOR_FIELDS = ('r', 'g', 'b')
+    INT_FIELDS = ('int_size',)
+    
+    def __init__(self, capacity: int = 64, trail_length: int = 0):
+        """
+        Initialize particle buffer
+        
+        Args:
+            capacity: Initial number of particle slots
+            trail_length: Number of trail positions kept per particle
+        """
+        self.count = 0
+        self.capacity = 0
+        self.trail_length = max(0, trail_length)
+        self._allocate(max(1, capacity))
+    
+    def _allocate(self, capacity: int) -> None:
+        """Allocate (or grow) the column arrays, keeping live particles"""
+        n = self.count
+        for name in self.FLOAT_FIELDS:
+            column = np.zeros(capacity, dtype=np.float32)
+            if n:
+                column[:n] = getattr(self, name)[:n]
+            setattr(self, name, column)
+        for name in self.COLOR_FIELDS:
+            column = np.zeros(capacity, dtype=np.uint8)
+            if n:
+                column[:n] = getattr(self, name)[:n]
+            setattr(self, name, column)
+        for name in self.INT_FIELDS:
+            column = np.zeros(capacity, dtype=np.int32)
+            if n:
+                column[:n] = getattr(self, name)[:n]
+            setattr(self, name, column)
+        
+        # Trail history, oldest position first, newest in the last column
+        trail_x = np.zeros((capacity, self.trail_length), dtype=np.float32)
+        trail_y = np.zeros((capacity, self.trail_length), dtype=np.float32)
+        trail_count = np.zeros(capacity, dtype=np.int32)
+        if n and self.capacity:
+            trail_x[:n] = self.trail_x[:n]
+            trail_y[:n] = self.trail_y[:n]
+            trail_count[:n] = self.trail_count[:n]
+        self.trail_x = trail_x
+        self.trail_y = trail_y
+        self.trail_count = trail_count
+        
+        self.capacity = capacity
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __iter__(self) -> Iterator[Particle]:
+        """Iterate over live particles as Particle snapshots"""
+        for i in range(self.count):
+            yield self.get_particle(i)
+    
+    def get_particle(self, index: int) -> Particle:
+        """Build a Particle snapshot of the particle at index"""
+        count = int(self.trail_count[index])
+        start = self.trail_length - count
+        trail = list(zip(self.trail_x[index, start:].tolist(), self.trail_y[index, start:].tolist()))
+        return Particle(
+            x=float(self.x[index]),
+            y=float(self.y[index]),
+            vx=float(self.vx[index]),
+            vy=float(self.vy[index]),
+            life=float(self.life[index]),
+            max_life=float(self.max_life[index]),
+            size=float(self.size[index]),
+            color=Color(int(self.r[index]), int(self.g[index]), int(self.b[index])),
+            alpha=float(self.alpha[index]),
+            rotation=float(self.rotation[index]),
+            rotation_speed=float(self.rotation_speed[index]),
+            gravity=float(self.gravity[index]),
+            friction=float(self.friction[index]),
+            trail_length=self.trail_length,
+            trail_positions=trail
+        )
+    
+    def append(self, particle: Particle) -> None:
+        """Append a particle to the buffer"""
+        if self.count >= self.capacity:
+            self._allocate(self.capacity * 2)
+        
+        i = self.count
+        self.x[i] = particle.x
+        self.y[i] = particle.y
+        self.vx[i] = particle.vx
+        self.vy[i] = particle.vy
+        self.life[i] = particle.life
+        self.max_life[i] = particle.max_life
+        self.size[i] = particle.size
+        self.int_size[i] = particle.int_size
+        self.alpha[i] = particle.alpha
+        self.rotation[i] = particle.rotation
+        self.rotation_speed[i] = particle.rotation_speed
+        self.gravity[i] = particle.gravity
+        self.friction[i] = particle.friction
+        self.r[i] = particle.color.r
+        self.g[i] = particle.color.g
+        self.b[i] = particle.color.b
+        self.trail_count[i] = 0
+        self.count = i + 1
+    
+    def append_batch(self, x: float, y: float, vx: np.ndarray, vy: np.ndarray,
+                     life: np.ndarray, size: np.ndarray, rgb: np.ndarray,
+                     gravity: float = 0.0, friction: float = 0.98) -> None:
+        """
+        Append a batch of particles given as arrays
+        
+        Args:
+            x: Spawn X position (shared by the batch)
+            y: Spawn Y position (shared by the batch)
+            vx: X velocities
+            vy: Y velocities
+            life: Lifetimes (also used as max life)
+            size: Particle sizes
+            rgb: Colors as an (n, 3) array or a single RGB triple
+            gravity: Gravity applied to the batch
+            friction: Friction applied to the batch
+        """
+        k = len(vx)
+        start = self.count
+        end = start + k
+        if end > self.capacity:
+            capacity = self.capacity
+            while capacity < end:
+                capacity *= 2
+            self._allocate(capacity)
+        
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = vx
+        self.vy[start:end] = vy
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.size[start:end] = size
+        self.int_size[start:end] = self.size[start:end]
+        self.alpha[start:end] = 255.0
+        self.rotation[start:end] = 0.0
+        self.rotation_speed[start:end] = 0.0
+        self.gravity[start:end] = gravity
+        self.friction[start:end] = friction
+        rgb = np.asarray(rgb)
+        self.r[start:end] = rgb[..., 0]
+        self.g[start:end] = rgb[..., 1]
+        self.b[start:end] = rgb[..., 2]
+        self.trail_count[start:end] = 0
+        self.count = end
+    
+    def set_trail_length(self, trail_length: int) -> None:
+        """Change the trail length (existing trail history is discarded)"""
+        trail_length = max(0, trail_length)
+        if trail_length == self.trail_length:
+            return
+        self.trail_length = trail_length
+        self.trail_x = np.zeros((self.capacity, trail_length), dtype=np.float32)
+        self.trail_y = np.zeros((self.capacity, trail_length), dtype=np.float32)
+        self.trail_count = np.zeros(self.capacity, dtype=np.int32)
+    
+    def update(self, dt: float) -> None:
+        """
+        Update all particles and drop the dead ones
+        
+        Args:
+            dt: Delta time
+        """
+        n = self.count
+        if n == 0:
+            return
+        
+        if NUMBA_AVAILABLE:
+            parallel = n >= PARALLEL_UPDATE_THRESHOLD
+            kernel = _update_kernel_parallel if parallel else _update_kernel
+            alive_count = kernel(
+                self.x, self.y, self.vx, self.vy, self.life, self.max_life, self.alpha,
+                self.rotation, self.rotation_speed, self.gravity, self.friction, dt, n
+            )
+            
+            # Update trail
+            if self.trail_length > 0:
+                trail_kernel = _trail_kernel_parallel if parallel else _trail_kernel
+                trail_kernel(self.trail_x, self.trail_y, self.trail_count, self.x, self.y, n)
+        else:
+            alive_count = self._update_vectorized(dt)
+            
+            # Update trail
+            if self.trail_length > 0:
+                self._update_trails_vectorized()
+        
+        # Compact dead particles once per frame
+        if alive_count < n:
+            self._compact(self.life[:n] > 0)
+    
+    def _update_trails_vectorized(self) -> None:
+        """NumPy trail shift, used when Numba is not available"""
+        n = self.count
+        trail_x = self.trail_x[:n]
+        trail_y = self.trail_y[:n]
+        trail_x[:, :-1] = trail_x[:, 1:]
+        trail_y[:, :-1] = trail_y[:, 1:]
+        trail_x[:, -1] = self.x[:n]
+        trail_y[:, -1] = self.y[:n]
+        np.minimum(self.trail_count[:n] + 1, self.trail_length, out=self.trail_count[:n])
+    
+    def _update_vectorized(self, dt: float) -> int:
+        """NumPy physics step, used when Numba is not available"""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        vx = self.vx[:n]
+        vy = self.vy[:n]
+        friction = self.friction[:n]
+        life = self.life[:n]
+        
+        # Update position
+        x += vx * dt
+        y += vy * dt
+        
+        # Apply gravity
+        vy += self.gravity[:n] * dt
+        
+        # Apply friction
+        vx *= friction
+        vy *= friction
+        
+        # Update rotation
+        self.rotation[:n] += self.rotation_speed[:n] * dt
+        
+        # Update life and alpha based on life
+        life -= dt
+        np.multiply(life / self.max_life[:n], 255.0, out=self.alpha[:n])
+        
+        return int(np.count_nonzero(life > 0))
+    
+    def _compact(self, alive: np.ndarray) -> None:
+        """
+        Keep only the particles flagged in the alive mask
+        
+        Dead slots inside the surviving prefix are filled in place with the
+        survivors from the tail, so only O(dead) particles are moved and no
+        per-column copies are allocated. Particle order is not preserved.
+        """
+        k = int(np.count_nonzero(alive))
+        holes = np.flatnonzero(~alive[:k])
+        if len(holes):
+            movers = k + np.flatnonzero(alive[k:])
+            for name in self.FLOAT_FIELDS + self.COLOR_FIELDS + self.INT_FIELDS:
+                column = getattr(self, name)
+                column[holes] = column[movers]
+            self.trail_count[holes] = self.trail_count[movers]
+            if self.trail_length > 0:
+                self.trail_x[holes] = self.trail_x[movers]
+                self.trail_y[holes] = self.trail_y[movers]
+        self.count = k
+    
+    def clear(self) -> None:
+        """Remove all particles"""
+        self.count = 0
+
+
 class ParticleEmitter:
     """
     Particle emitter that creates and manages particles
@@ -114,7 +519,6 @@ class ParticleEmitter:
         """
         self.x = x
         self.y = y
-        self.particles: List[Particle] = []
         self.emission_rate = 10.0  # particles per second
         self.emission_timer = 0.0
         self.active = True
@@ -139,6 +543,9 @@ class ParticleEmitter:
         self.trail_enabled = False
         self.trail_length = 10
         
+        # Particle storage
+        self.particles = ParticleBuffer()
+        
         # Burst settings
         self.burst_mode = False
         self.burst_count = 10
@@ -189,29 +596,38 @@ class ParticleEmitter:
                     self.emission_timer -= emission_interval
         
         # Update particles
-        self.particles = [p for p in self.particles if p.update(dt)]
+        self.particles.update(dt)
     
     def emit_particle(self) -> None:
         """Emit a single particle"""
+        cos = math.cos
+        sin = math.sin
+        rr = random_range
+        
         # Calculate emission angle
-        angle_rad = math.radians(self.emission_angle + random_range(-self.emission_angle_spread/2, self.emission_angle_spread/2))
+        half_spread = self.emission_angle_spread / 2
+        angle_rad = math.radians(self.emission_angle + rr(-half_spread, half_spread))
         
         # Calculate velocity
-        speed = self.particle_speed * (1.0 + random_range(-self.speed_variation, self.speed_variation))
-        vx = math.cos(angle_rad) * speed
-        vy = math.sin(angle_rad) * speed
+        speed_variation = self.speed_variation
+        speed = self.particle_speed * (1.0 + rr(-speed_variation, speed_variation))
+        vx = cos(angle_rad) * speed
+        vy = sin(angle_rad) * speed
         
         # Calculate particle properties
-        life = self.particle_life * (1.0 + random_range(-self.life_variation, self.life_variation))
-        size = self.particle_size * (1.0 + random_range(-self.size_variation, self.size_variation))
+        life_variation = self.life_variation
+        size_variation = self.size_variation
+        life = self.particle_life * (1.0 + rr(-life_variation, life_variation))
+        size = self.particle_size * (1.0 + rr(-size_variation, size_variation))
         
         # Calculate color
         color = self.particle_color
-        if self.color_variation > 0:
+        color_variation = self.color_variation
+        if color_variation > 0:
             color = Color(
-                clamp(color.r + random_range(-self.color_variation, self.color_variation), 0, 255),
-                clamp(color.g + random_range(-self.color_variation, self.color_variation), 0, 255),
-                clamp(color.b + random_range(-self.color_variation, self.color_variation), 0, 255)
+                clamp(color.r + rr(-color_variation, color_variation), 0, 255),
+                clamp(color.g + rr(-color_variation, color_variation), 0, 255),
+                clamp(color.b + rr(-color_variation, color_variation), 0, 255)
             )
         
         # Create particle
@@ -233,8 +649,66 @@ class ParticleEmitter:
     
     def emit_burst(self) -> None:
         """Emit a burst of particles"""
-        for _ in range(self.burst_count):
-            self.emit_particle()
+        self.emit_burst_vectorized(self.burst_count)
+    
+    def emit_burst_vectorized(self, n: int) -> None:
+        """
+        Emit n particles at once, writing straight into the particle buffer
+        
+        Args:
+            n: Number of particles to emit
+        """
+        if n <= 0:
+            return
+        
+        # Draw every jitter value for the batch in one pass: angle, speed,
+        # life, size, then one column per color channel
+        jitter = _rng.uniform(-1.0, 1.0, size=(7, n))
+        
+        # Calculate emission angles and velocities
+        angles = np.radians(self.emission_angle + jitter[0] * (self.emission_angle_spread / 2))
+        speeds = self.particle_speed * (1.0 + jitter[1] * self.speed_variation)
+        vx = np.cos(angles) * speeds
+        vy = np.sin(angles) * speeds
+        
+        # Calculate particle properties
+        life = self.particle_life * (1.0 + jitter[2] * self.life_variation)
+        size = self.particle_size * (1.0 + jitter[3] * self.size_variation)
+        
+        # Calculate colors
+        color = self.particle_color
+        rgb = np.array([color.r, color.g, color.b], dtype=np.float64)
+        if self.color_variation > 0:
+            rgb = np.clip(rgb + jitter[4:].T * self.color_variation, 0, 255)
+        
+        self.particles.append_batch(
+            self.x, self.y, vx, vy, life, size, rgb.astype(np.uint8),
+            gravity=self.gravity, friction=self.friction
+        )
+    
+    def clone_at(self, x: float, y: float) -> 'ParticleEmitter':
+        """
+        Create a fresh emitter at (x, y) with this emitter's settings
+        
+        Args:
+            x: Emitter X position
+            y: Emitter Y position
+            
+        Returns:
+            New emitter with no particles and reset timers
+        """
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.x = x
+        clone.y = y
+        clone.emission_timer = 0.0
+        clone.active = True
+        clone.particles = ParticleBuffer(trail_length=self.particles.trail_length)
+        clone.burst_timer = 0.0
+        clone.emitter_age = 0.0
+        clone.fade_out_timer = 0.0
+        clone.is_fading_out = False
+        return clone
     
     def set_position(self, x: float, y: float) -> None:
         """Set emitter position"""
@@ -278,6 +752,7 @@ class ParticleEmitter:
         """Enable/disable particle trails"""
         self.trail_enabled = enabled
         self.trail_length = length
+        self.particles.set_trail_length(length if enabled else 0)
     
     def set_burst_mode(self, enabled: bool, count: int = 10, interval: float = 1.0) -> None:
         """Set burst emission mode"""
@@ -309,6 +784,31 @@ class ParticleEmitter:
         return len(self.particles)
 
 
+@lru_cache(maxsize=4096)
+def _get_particle_sprite(size: int, r: int, g: int, b: int, alpha_bucket: int) -> pygame.Surface:
+    """
+    Get a pre-rendered particle circle sprite
+    
+    Args:
+        size: Particle radius in pixels
+        r: Red level (0-31)
+        g: Green level (0-31)
+        b: Blue level (0-31)
+        alpha_bucket: Alpha level (0-15)
+        
+    Returns:
+        Cached sprite surface of size (size * 2, size * 2)
+    """
+    color = (r * 255 // 31, g * 255 // 31, b * 255 // 31, alpha_bucket * 17)
+    sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, color, (size, size), size)
+    
+    # Match the display's pixel format so blits take SDL's fast path
+    if pygame.display.get_surface() is not None:
+        sprite = sprite.convert_alpha()
+    return sprite
+
+
 class ParticleSystem:
     """
     Main particle system manager
@@ -320,13 +820,32 @@ class ParticleSystem:
     def __init__(self):
         """Initialize particle system"""
         self.emitters: List[ParticleEmitter] = []
-        self.particles: List[Particle] = []
         self.active = True
     
     def add_emitter(self, emitter: ParticleEmitter) -> None:
         """Add particle emitter"""
         self.emitters.append(emitter)
     
+    def add_emitters_bulk(self, template: ParticleEmitter, positions: np.ndarray, delay: float = 0.0) -> List[ParticleEmitter]:
+        """
+        Add one emitter per position, all configured like a template
+        
+        Args:
+            template: Configured emitter whose settings are copied
+            positions: (N, 2) array of emitter positions
+            delay: Seconds before the new emitters start emitting
+            
+        Returns:
+            The added emitters
+        """
+        clone_at = template.clone_at
+        emitters = [clone_at(x, y) for x, y in np.asarray(positions).tolist()]
+        if delay:
+            for emitter in emitters:
+                emitter.emission_timer = -delay
+        self.emitters.extend(emitters)
+        return emitters
+    
     def remove_emitter(self, emitter: ParticleEmitter) -> None:
         """Remove particle emitter"""
         if emitter in self.emitters:
@@ -353,40 +872,108 @@ class ParticleSystem:
         # Remove finished emitters
         for emitter in finished_emitters:
             self.emitters.remove(emitter)
+    
+    @property
+    def buffers(self) -> List[ParticleBuffer]:
+        """Particle buffers of all emitters"""
+        return [emitter.particles for emitter in self.emitters]
+    
+    @property
+    def particles(self) -> List[Particle]:
+        """
+        All live particles as Particle objects
         
-        # Collect all particles
-        self.particles = []
-        for emitter in self.emitters:
-            self.particles.extend(emitter.particles)
+        The list is built from the emitters' buffers on each access, so
+        it is a snapshot: changing a Particle does not affect the system.
+        """
+        return [particle for emitter in self.emitters for particle in emitter.particles]
     
     def render(self, surface: pygame.Surface) -> None:
         """Render all particles"""
-        for particle in self.particles:
-            # Render trail
-            if particle.trail_positions:
-                for i, (trail_x, trail_y) in enumerate(particle.trail_positions):
-                    alpha = int(255 * (i / len(particle.trail_positions)))
-                    trail_color = (particle.color.r, particle.color.g, particle.color.b, alpha)
-                    trail_surface = pygame.Surface((particle.size * 2, particle.size * 2), pygame.SRCALPHA)
-                    pygame.draw.circle(trail_surface, trail_color, (particle.size, particle.size), particle.size)
-                    surface.blit(trail_surface, (trail_x - particle.size, trail_y - particle.size))
+        if NUMBA_AVAILABLE and surface.get_bitsize() >= 24 and self.get_total_particles() >= SPLAT_THRESHOLD:
+            self._render_splat(surface)
+            return
+        
+        blits = []
+        add_blit = blits.append
+        
+        # Pick the trail or no-trail loop once per buffer, not per particle
+        for emitter in self.emitters:
+            buffer = emitter.particles
+            if buffer.count == 0:
+                continue
+            if buffer.trail_length > 0:
+                self._queue_trail_particles(buffer, add_blit)
+            else:
+                self._queue_particles(buffer, add_blit)
+        
+        # Draw everything in a single C call
+        if blits:
+            surface.blits(blits, doreturn=False)
+    
+    @staticmethod
+    def _queue_particles(buffer: ParticleBuffer, add_blit: Callable) -> None:
+        """Queue sprite blits for a buffer without trails"""
+        n = buffer.count
+        get_sprite = _get_particle_sprite
+        
+        # Color is quantized to 5 bits per channel so sprites are shared
+        for x, y, size, alpha, r, g, b in zip(
+            buffer.x[:n].tolist(), buffer.y[:n].tolist(), buffer.int_size[:n].tolist(),
+            buffer.alpha[:n].tolist(), buffer.r[:n].tolist(), buffer.g[:n].tolist(),
+            buffer.b[:n].tolist()
+        ):
+            add_blit((get_sprite(size, r >> 3, g >> 3, b >> 3, int(alpha) >> 4), (x - size, y - size)))
+    
+    @staticmethod
+    def _queue_trail_particles(buffer: ParticleBuffer, add_blit: Callable) -> None:
+        """Queue sprite blits for a buffer with trails, each trail under its particle"""
+        n = buffer.count
+        get_sprite = _get_particle_sprite
+        trail_length = buffer.trail_length
+        trail_x = buffer.trail_x
+        trail_y = buffer.trail_y
+        
+        for i, (x, y, size, alpha, r, g, b, trail_count) in enumerate(zip(
+            buffer.x[:n].tolist(), buffer.y[:n].tolist(), buffer.int_size[:n].tolist(),
+            buffer.alpha[:n].tolist(), buffer.r[:n].tolist(), buffer.g[:n].tolist(),
+            buffer.b[:n].tolist(), buffer.trail_count[:n].tolist()
+        )):
+            r, g, b = r >> 3, g >> 3, b >> 3
             
-            # Render particle
-            if particle.alpha > 0:
-                particle_surface = pygame.Surface((particle.size * 2, particle.size * 2), pygame.SRCALPHA)
-                particle_color = particle.get_color_with_alpha()
-                pygame.draw.circle(particle_surface, particle_color, (particle.size, particle.size), particle.size)
-                surface.blit(particle_surface, (particle.x - particle.size, particle.y - particle.size))
+            # Queue trail
+            start = trail_length - trail_count
+            for j, (trail_px, trail_py) in enumerate(zip(trail_x[i, start:].tolist(), trail_y[i, start:].tolist())):
+                trail_alpha = int(255 * (j / trail_count))
+                add_blit((get_sprite(size, r, g, b, trail_alpha >> 4), (trail_px - size, trail_py - size)))
+            
+            # Queue particle
+            add_blit((get_sprite(size, r, g, b, int(alpha) >> 4), (x - size, y - size)))
+    
+    def _render_splat(self, surface: pygame.Surface) -> None:
+        """Rasterize all particles directly into the surface's pixels"""
+        pixels = pygame.surfarray.pixels3d(surface)
+        try:
+            for emitter in self.emitters:
+                buffer = emitter.particles
+                if buffer.count:
+                    _splat_kernel(
+                        pixels, buffer.x, buffer.y, buffer.int_size, buffer.alpha,
+                        buffer.r, buffer.g, buffer.b,
+                        buffer.trail_x, buffer.trail_y, buffer.trail_count, buffer.count
+                    )
+        finally:
+            # Release the surface lock
+            del pixels
     
     def clear_all(self) -> None:
         """Clear all emitters and particles"""
         for emitter in self.emitters:
             emitter.clear_particles()
-        self.particles.clear()
     
     def get_total_particles(self) -> int:
         """Get total particle count"""
-        return len(self.particles)
+        return sum(len(emitter.particles) for emitter in self.emitters)
     
     def set_active(self, active: bool) -> None:
         """Set system active state"""
@@ -11,11 +11,14 @@ Version: 1.0.0
 """
 
 import pygame
+import numpy as np
 import sys
 import time
 import threading
 import signal
-from typing import Dict, Any, Optional, List
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
 
 # Import our custom modules
@@ -23,12 +26,30 @@ from system.platform_detector import get_platform_detector, get_optimization_set
 from config.config_manager import get_config_manager, get_config
 from utils.logger import setup_logging, get_logger, log_demo_event
 from utils.performance import get_performance_monitor, PerformanceProfiler
-from utils.math_utils import clamp, lerp, random_range, ease_in_out
+from utils.math_utils import random_range, ease_in_out
 from utils.color_utils import Color, random_color, rainbow_colors, color_gradient
 from frontend.particle_system import ParticleSystem, create_fire_effect, create_explosion_effect, create_sparkle_effect
 from plugins import get_plugin_manager
 
 
+# RGB tuples for scene text, shared instead of building Color objects per line
+_WHITE = (255, 255, 255)
+_GRAY = (200, 200, 200)
+_DARK_GRAY = (150, 150, 150)
+_YELLOW = (255, 255, 0)
+_GREEN = (100, 255, 100)
+_RED = (255, 100, 100)
+
+# High-volume event types the demo never reads, blocked at the queue. Window,
+# resize and focus events stay allowed so the resizable window keeps working.
+_BLOCKED_EVENTS = (
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION, pygame.MULTIGESTURE,
+    pygame.TEXTINPUT, pygame.TEXTEDITING,
+)
+
+
 class CursorDemoApp:
     """
     Main Cursor IDE Demo Application
@@ -68,9 +89,8 @@ class CursorDemoApp:
         self.demo_time = 0.0
         self.demo_duration = get_config("Demo", "demo_duration", 30)
         
-        # Performance monitoring
+        # Performance monitoring; sampled from the main loop via poll()
         self.performance_monitor = get_performance_monitor()
-        self.performance_monitor.start()
         
         # Failsafe timeout
         self.failsafe_timer = 0.0
@@ -149,17 +169,32 @@ class CursorDemoApp:
             flags = pygame.RESIZABLE | pygame.DOUBLEBUF
             if self.fullscreen:
                 flags |= pygame.FULLSCREEN
-            if self.vsync:
-                flags |= pygame.HWSURFACE
             
-            # Create display
-            self.screen = pygame.display.set_mode((self.width, self.height), flags)
+            # Create display, paced by vsync when the driver supports it.
+            # SDL only honours vsync for renderer-backed displays (SCALED).
+            self.vsync_active = False
+            if self.vsync:
+                try:
+                    self.screen = pygame.display.set_mode(
+                        (self.width, self.height), flags | pygame.SCALED, vsync=1
+                    )
+                    self.vsync_active = self._vsync_blocks()
+                    if not self.vsync_active:
+                        self.logger.warning("VSync not honoured by the display driver, using the frame rate limiter")
+                except pygame.error as e:
+                    self.logger.warning(f"VSync unavailable ({e}), using the frame rate limiter")
+            if not self.vsync_active:
+                self.screen = pygame.display.set_mode((self.width, self.height), flags)
             pygame.display.set_caption("Cursor IDE Demo - Cross-Platform Pygame Application")
             
+            # Keep high-volume input the demo ignores out of the queue
+            pygame.event.set_blocked(_BLOCKED_EVENTS)
+            
             # Screen will be set in app_context after initialization
             
-            # Set up clock
+            # Set up clock; with vsync the display flip already waits for vblank
             self.clock = pygame.time.Clock()
+            self.frame_rate_limit = 0 if self.vsync_active else self.target_fps
             
             # Initialize fonts
             self.fonts = {
@@ -168,9 +203,21 @@ class CursorDemoApp:
                 'large': pygame.font.Font(None, 48),
                 'title': pygame.font.Font(None, 72)
             }
+            
+            # Rasterized text is cached per (font, text, color)
+            self._render_text = lru_cache(maxsize=1024)(self._rasterize_text)
         
         self.logger.info("✅ Pygame initialized successfully!")
     
+    @staticmethod
+    def _vsync_blocks(samples: int = 3) -> bool:
+        """Check whether display flips actually wait for vblank"""
+        start = time.perf_counter()
+        for _ in range(samples):
+            pygame.display.flip()
+        # Even a 240 Hz display takes ~4 ms per flip; non-blocking flips are far faster
+        return (time.perf_counter() - start) / samples > 0.002
+    
     def _init_demo_components(self) -> None:
         """Initialize demo-specific components"""
         self.logger.info("🎨 Initializing demo components...")
@@ -199,8 +246,23 @@ class CursorDemoApp:
         self.animation_time = 0.0
         self.background_color = Color(20, 20, 40)
         self.text_color = Color(255, 255, 255)
+        self.text_rgb = self.text_color.to_rgb_tuple()
+        
+        # Static background gradient, pre-rendered once, plus a copy tinted
+        # with the current animation offset
+        self._bg_surface = self._build_background()
+        self._tinted_bg = self._bg_surface.copy()
+        self._last_anim_offset = 0
+        
+        # Mouse trail history and one pre-drawn white circle per trail radius
+        self.mouse_trail = deque(maxlen=20)
+        self._trail_atlas = self._build_trail_atlas()
         
-        # Scene management
+        # Static text, pre-rendered once
+        self._controls_block = self._build_controls()
+        
+        # Scene management: one renderer per scene, plus updaters for the
+        # scenes that keep state between frames
         self.scenes = [
             self._scene_platform_demo,
             self._scene_particle_demo,
@@ -208,6 +270,11 @@ class CursorDemoApp:
             self._scene_performance_demo,
             self._scene_cursor_features_demo
         ]
+        self.scene_updaters = {
+            self.scenes.index(self._scene_interactive_demo): self._update_interactive_demo
+        }
+        self._scene_static = self._precompile_scenes()
+        self._scene_titles = self._precompile_titles()
         
         self.logger.info("✅ Demo components initialized!")
     
@@ -237,14 +304,17 @@ class CursorDemoApp:
                 if not self.paused:
                     self._update_demo()
                 
+                # Sample CPU/memory metrics, also while paused
+                self.performance_monitor.poll()
+                
                 # Render frame
                 self._render_frame()
                 
                 # Update display
                 pygame.display.flip()
                 
-                # Cap frame rate
-                self.clock.tick(self.target_fps)
+                # Measure frame time (and cap frame rate without vsync)
+                self.clock.tick(self.frame_rate_limit)
                 
                 # Check failsafe timeout
                 self._check_failsafe()
@@ -348,9 +418,10 @@ class CursorDemoApp:
             self._next_scene()
             self.scene_timer = 0.0
         
-        # Update current scene
-        if self.current_scene < len(self.scenes):
-            self.scenes[self.current_scene](dt)
+        # Update current scene state (rendering happens in _render_frame)
+        updater = self.scene_updaters.get(self.current_scene)
+        if updater is not None:
+            updater(dt)
     
     def _render_frame(self) -> None:
         """Render the current frame"""
@@ -359,7 +430,7 @@ class CursorDemoApp:
         
         # Render current scene
         if self.current_scene < len(self.scenes):
-            self.scenes[self.current_scene](0.0)  # 0.0 for render-only
+            self.scenes[self.current_scene]()
         
         # Render particle system
         self.particle_system.render(self.screen)
@@ -370,204 +441,272 @@ class CursorDemoApp:
         # Render UI
         self._render_ui()
     
+    def _build_background(self) -> pygame.Surface:
+        """Pre-render the static background gradient"""
+        surface = pygame.Surface((self.width, self.height)).convert()
+        
+        # One color per row, computed for all rows at once
+        ratio = np.arange(self.height) / self.height
+        rows = np.stack([20 + 20 * ratio, 20 + 10 * ratio, 40 + 20 * ratio], axis=1).astype(np.uint8)
+        
+        # surfarray is indexed (x, y), so repeat the row colors along x
+        if surface.get_bitsize() >= 24:
+            # Broadcast straight into the surface pixels (the view is released on return)
+            pygame.surfarray.pixels3d(surface)[:] = rows[None, :, :]
+        else:
+            pygame.surfarray.blit_array(surface, np.broadcast_to(rows[None, :, :], (self.width, self.height, 3)))
+        return surface
+    
     def _render_background(self) -> None:
         """Render animated background"""
-        # Create gradient background
-        for y in range(self.height):
-            ratio = y / self.height
-            r = int(lerp(20, 40, ratio))
-            g = int(lerp(20, 30, ratio))
-            b = int(lerp(40, 60, ratio))
+        # Subtle animation: the offset only takes 11 values, so re-tint the
+        # cached background when it changes rather than every frame
+        anim_offset = int(10 * ease_in_out((self.animation_time * 0.5) % 1.0))
+        if anim_offset != self._last_anim_offset:
+            self._tinted_bg.blit(self._bg_surface, (0, 0))
+            if anim_offset:
+                self._tinted_bg.fill((anim_offset, anim_offset, anim_offset), special_flags=pygame.BLEND_RGB_ADD)
+            self._last_anim_offset = anim_offset
+        
+        self.screen.blit(self._tinted_bg, (0, 0))
+    
+    def _build_trail_atlas(self) -> List[pygame.Surface]:
+        """
+        Pre-draw the mouse trail circles, indexed by radius
+        
+        The circles are hard-edged, so they are kept as opaque colorkeyed
+        surfaces; the fade comes from surface alpha rather than per-pixel alpha.
+        """
+        atlas = []
+        for size in range(6):
+            surface = pygame.Surface((size * 2, size * 2)).convert()
+            pygame.draw.circle(surface, _WHITE, (size, size), size)
+            surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+            atlas.append(surface)
+        return atlas
+    
+    def _rasterize_text(self, font_key: str, text: str, rgb: Tuple[int, int, int]) -> pygame.Surface:
+        """Render antialiased text with one of the app fonts (cached as _render_text)"""
+        return self.fonts[font_key].render(text, True, rgb).convert_alpha()
+    
+    @staticmethod
+    def _compose_text(items: List[Tuple[pygame.Surface, Any]], size: Tuple[int, int]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Composite rendered text into one transparent surface
+        
+        Args:
+            items: (text surface, destination) pairs
+            size: Size of the area the destinations refer to
             
-            # Add subtle animation
-            anim_offset = int(10 * ease_in_out((self.animation_time * 0.5) % 1.0))
-            r = clamp(r + anim_offset, 0, 255)
-            g = clamp(g + anim_offset, 0, 255)
-            b = clamp(b + anim_offset, 0, 255)
+        Returns:
+            Surface cropped to the drawn pixels and its offset in that area
+        """
+        block = pygame.Surface(size, pygame.SRCALPHA)
+        for text, dest in items:
+            # Copy pixels as-is so alpha isn't applied twice when the block is blitted
+            block.blit(text, dest, special_flags=pygame.BLEND_RGBA_MAX)
+        rect = block.get_bounding_rect()
+        return block.subsurface(rect).convert_alpha(), rect.topleft
+    
+    def _build_controls(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Pre-render the controls list"""
+        controls = [
+            "Controls:",
+            "ESC - Exit",
+            "SPACE - Pause/Resume",
+            "R - Reset",
+            "N/P - Next/Previous Scene",
+            "E - Explosion",
+            "Click - Explosion"
+        ]
+        
+        items = []
+        for i, control in enumerate(controls):
+            color = _GRAY if i == 0 else _DARK_GRAY
+            text = self.fonts['small'].render(control, True, color)
+            items.append((text, (self.width - 200, 10 + i * 25)))
+        return self._compose_text(items, (self.width, self.height))
+    
+    def _build_text_block(self, lines: List[str], colors: List[Tuple[int, int, int]]) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Pre-render centered info lines into one block
+        
+        Args:
+            lines: Text lines, centered at 200 + i * 40
+            colors: RGB color per line
             
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (self.width, y))
+        Returns:
+            Block surface and its screen position
+        """
+        font = self.fonts['medium']
+        items = []
+        for i, (line, color) in enumerate(zip(lines, colors)):
+            text = font.render(line, True, color)
+            items.append((text, text.get_rect(center=(self.width // 2, 200 + i * 40))))
+        return self._compose_text(items, (self.width, self.height))
+    
+    def _precompile_scenes(self) -> Dict[str, Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Pre-render the static info text of every scene"""
+        hardware_info = self.hardware_info
+        settings = self.optimization_settings
+        platform_lines = [
+            f"Platform: {hardware_info.platform.value.title()}",
+            f"Architecture: {hardware_info.architecture.value.upper()}",
+            f"CPU Cores: {hardware_info.cpu_count}",
+            f"CPU Frequency: {hardware_info.cpu_frequency:.1f} MHz",
+            f"Memory: {hardware_info.memory_total // (1024**3):.1f} GB",
+            f"High Performance: {hardware_info.is_high_performance}",
+            "",
+            "Optimization Settings:",
+            f"Target FPS: {settings.get('target_fps', 'N/A')}",
+            f"Particle Count: {settings.get('particle_count', 'N/A')}",
+            f"Hardware Acceleration: {settings.get('hardware_acceleration', 'N/A')}",
+            f"Multithreading: {settings.get('multithreading', 'N/A')}"
+        ]
+        particle_lines = [
+            "Advanced Particle System Features:",
+            "• Multiple particle emitters",
+            "• Physics simulation (gravity, friction)",
+            "• Color and size variation",
+            "• Particle trails and effects",
+            "• Performance optimized rendering",
+            "",
+            "Click anywhere to create explosions!",
+            "Press 'E' for more explosions"
+        ]
+        interactive_lines = [
+            "Interactive Features:",
+            "• Mouse tracking and clicking",
+            "• Keyboard input handling",
+            "• Real-time particle creation",
+            "• Scene navigation",
+            "• Performance monitoring",
+            "",
+            "Move your mouse and click!",
+            "Try different keys for effects"
+        ]
+        features_lines = [
+            "Why Choose Cursor IDE?",
+            "• AI-powered code completion",
+            "• Advanced refactoring tools",
+            "• Intelligent debugging",
+            "• Cross-platform development",
+            "• Performance optimization",
+            "• Professional code structure",
+            "",
+            "This demo showcases:",
+            "• Clean, maintainable code",
+            "• Platform-specific optimizations",
+            "• Real-time performance monitoring",
+            "• Interactive graphics and effects"
+        ]
+        features_colors = [_YELLOW] + [_WHITE] * 6 + [_GRAY, _GREEN] + [_GRAY] * 4
+        
+        return {
+            'platform_demo': self._build_text_block(platform_lines, [_WHITE] * 6 + [_GRAY] * 6),
+            'particle_demo': self._build_text_block(particle_lines, [_WHITE] + [_GRAY] * 8),
+            'interactive_demo': self._build_text_block(interactive_lines, [_WHITE] + [_GRAY] * 8),
+            'cursor_features_demo': self._build_text_block(features_lines, features_colors)
+        }
+    
+    def _precompile_titles(self) -> Dict[str, Tuple[pygame.Surface, pygame.Rect]]:
+        """Pre-render every scene title with its centered rect"""
+        rgb = self.text_rgb
+        titles = {
+            'platform_demo': "Platform Detection Demo",
+            'particle_demo': "Particle System Demo",
+            'interactive_demo': "Interactive Demo",
+            'performance_demo': "Performance Monitoring",
+            'cursor_features_demo': "Cursor IDE Features"
+        }
+        center = (self.width // 2, 100)
+        compiled = {}
+        for key, text in titles.items():
+            title = self._rasterize_text('title', text, rgb)
+            compiled[key] = (title, title.get_rect(center=center))
+        return compiled
     
     def _render_ui(self) -> None:
         """Render user interface elements"""
+        # Bind per-frame invariants once
+        rgb = self.text_rgb
+        render_text = self._render_text
+        blit = self.screen.blit
+        
         # Render FPS counter
         if self.show_fps:
             fps = self.performance_monitor.get_current_metrics().fps
-            fps_text = self.fonts['small'].render(f"FPS: {fps:.1f}", True, self.text_color.to_rgb_tuple())
-            self.screen.blit(fps_text, (10, 10))
+            blit(render_text('small', f"FPS: {fps:.1f}", rgb), (10, 10))
         
         # Render platform info
         if self.show_platform_info:
-            platform_text = self.fonts['small'].render(
-                f"Platform: {self.hardware_info.platform.value.title()}", 
-                True, self.text_color.to_rgb_tuple()
-            )
-            self.screen.blit(platform_text, (10, 40))
-            
-            arch_text = self.fonts['small'].render(
-                f"Arch: {self.hardware_info.architecture.value.upper()}", 
-                True, self.text_color.to_rgb_tuple()
-            )
-            self.screen.blit(arch_text, (10, 70))
+            hardware_info = self.hardware_info
+            blit(render_text('small', f"Platform: {hardware_info.platform.value.title()}", rgb), (10, 40))
+            blit(render_text('small', f"Arch: {hardware_info.architecture.value.upper()}", rgb), (10, 70))
         
         # Render demo info
-        demo_text = self.fonts['small'].render(
-            f"Demo Time: {self.demo_time:.1f}s / {self.demo_duration}s", 
-            True, self.text_color.to_rgb_tuple()
-        )
-        self.screen.blit(demo_text, (10, 100))
+        blit(render_text('small', f"Demo Time: {self.demo_time:.1f}s / {self.demo_duration}s", rgb), (10, 100))
         
         # Render scene info
-        scene_text = self.fonts['small'].render(
-            f"Scene: {self.current_scene + 1}/{len(self.scenes)}", 
-            True, self.text_color.to_rgb_tuple()
-        )
-        self.screen.blit(scene_text, (10, 130))
+        blit(render_text('small', f"Scene: {self.current_scene + 1}/{len(self.scenes)}", rgb), (10, 130))
         
         # Render controls
-        controls = [
-            "Controls:",
-            "ESC - Exit",
-            "SPACE - Pause/Resume",
-            "R - Reset",
-            "N/P - Next/Previous Scene",
-            "E - Explosion",
-            "Click - Explosion"
-        ]
-        
-        for i, control in enumerate(controls):
-            color = Color(200, 200, 200) if i == 0 else Color(150, 150, 150)
-            control_text = self.fonts['small'].render(control, True, color.to_rgb_tuple())
-            self.screen.blit(control_text, (self.width - 200, 10 + i * 25))
+        blit(*self._controls_block)
         
         # Render particle count
         particle_count = self.particle_system.get_total_particles()
-        particle_text = self.fonts['small'].render(
-            f"Particles: {particle_count}", 
-            True, self.text_color.to_rgb_tuple()
-        )
-        self.screen.blit(particle_text, (10, 160))
+        blit(render_text('small', f"Particles: {particle_count}", rgb), (10, 160))
         
         # Render plugin info
         plugin_count = len(self.plugin_manager.get_plugin_list())
-        plugin_text = self.fonts['small'].render(
-            f"Plugins: {plugin_count}", 
-            True, self.text_color.to_rgb_tuple()
-        )
-        self.screen.blit(plugin_text, (10, 190))
+        blit(render_text('small', f"Plugins: {plugin_count}", rgb), (10, 190))
         
         # Show plugin hint if plugins are loaded
         if plugin_count > 0:
-            plugin_hint = self.fonts['small'].render(
-                "Right-click for k00gar spell!", 
-                True, Color(255, 255, 0).to_rgb_tuple()
-            )
-            self.screen.blit(plugin_hint, (10, 220))
+            blit(render_text('small', "Right-click for k00gar spell!", _YELLOW), (10, 220))
     
-    def _scene_platform_demo(self, dt: float) -> None:
+    def _scene_platform_demo(self) -> None:
         """Platform detection and optimization demo scene"""
         # Render title
-        title = self.fonts['title'].render("Platform Detection Demo", True, self.text_color.to_rgb_tuple())
-        title_rect = title.get_rect(center=(self.width // 2, 100))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(*self._scene_titles['platform_demo'])
         
         # Render platform information
-        info_lines = [
-            f"Platform: {self.hardware_info.platform.value.title()}",
-            f"Architecture: {self.hardware_info.architecture.value.upper()}",
-            f"CPU Cores: {self.hardware_info.cpu_count}",
-            f"CPU Frequency: {self.hardware_info.cpu_frequency:.1f} MHz",
-            f"Memory: {self.hardware_info.memory_total // (1024**3):.1f} GB",
-            f"High Performance: {self.hardware_info.is_high_performance}",
-            "",
-            "Optimization Settings:",
-            f"Target FPS: {self.optimization_settings.get('target_fps', 'N/A')}",
-            f"Particle Count: {self.optimization_settings.get('particle_count', 'N/A')}",
-            f"Hardware Acceleration: {self.optimization_settings.get('hardware_acceleration', 'N/A')}",
-            f"Multithreading: {self.optimization_settings.get('multithreading', 'N/A')}"
-        ]
-        
-        for i, line in enumerate(info_lines):
-            color = Color(255, 255, 255) if i < 6 else Color(200, 200, 200)
-            text = self.fonts['medium'].render(line, True, color.to_rgb_tuple())
-            text_rect = text.get_rect(center=(self.width // 2, 200 + i * 40))
-            self.screen.blit(text, text_rect)
+        self.screen.blit(*self._scene_static['platform_demo'])
     
-    def _scene_particle_demo(self, dt: float) -> None:
+    def _scene_particle_demo(self) -> None:
         """Particle system demo scene"""
         # Render title
-        title = self.fonts['title'].render("Particle System Demo", True, self.text_color.to_rgb_tuple())
-        title_rect = title.get_rect(center=(self.width // 2, 100))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(*self._scene_titles['particle_demo'])
         
         # Render particle system info
-        info_lines = [
-            "Advanced Particle System Features:",
-            "• Multiple particle emitters",
-            "• Physics simulation (gravity, friction)",
-            "• Color and size variation",
-            "• Particle trails and effects",
-            "• Performance optimized rendering",
-            "",
-            "Click anywhere to create explosions!",
-            "Press 'E' for more explosions"
-        ]
-        
-        for i, line in enumerate(info_lines):
-            color = Color(255, 255, 255) if i == 0 else Color(200, 200, 200)
-            text = self.fonts['medium'].render(line, True, color.to_rgb_tuple())
-            text_rect = text.get_rect(center=(self.width // 2, 200 + i * 40))
-            self.screen.blit(text, text_rect)
+        self.screen.blit(*self._scene_static['particle_demo'])
     
-    def _scene_interactive_demo(self, dt: float) -> None:
+    def _scene_interactive_demo(self) -> None:
         """Interactive features demo scene"""
         # Render title
-        title = self.fonts['title'].render("Interactive Demo", True, self.text_color.to_rgb_tuple())
-        title_rect = title.get_rect(center=(self.width // 2, 100))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(*self._scene_titles['interactive_demo'])
         
         # Render interactive elements
-        info_lines = [
-            "Interactive Features:",
-            "• Mouse tracking and clicking",
-            "• Keyboard input handling",
-            "• Real-time particle creation",
-            "• Scene navigation",
-            "• Performance monitoring",
-            "",
-            "Move your mouse and click!",
-            "Try different keys for effects"
-        ]
+        self.screen.blit(*self._scene_static['interactive_demo'])
         
-        for i, line in enumerate(info_lines):
-            color = Color(255, 255, 255) if i == 0 else Color(200, 200, 200)
-            text = self.fonts['medium'].render(line, True, color.to_rgb_tuple())
-            text_rect = text.get_rect(center=(self.width // 2, 200 + i * 40))
-            self.screen.blit(text, text_rect)
-        
-        # Draw mouse cursor trail
-        if hasattr(self, 'mouse_trail'):
-            self.mouse_trail.append(self.mouse_pos)
-            if len(self.mouse_trail) > 20:
-                self.mouse_trail.pop(0)
-        else:
-            self.mouse_trail = [self.mouse_pos]
-        
-        # Render mouse trail
+        # Render mouse trail, fading each atlas circle with its surface alpha
+        atlas = self._trail_atlas
         for i, pos in enumerate(self.mouse_trail):
             alpha = int(255 * (i / len(self.mouse_trail)))
             size = int(5 * (i / len(self.mouse_trail)))
-            color = Color(255, 255, 255, alpha)
             
-            trail_surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(trail_surface, color.to_tuple(), (size, size), size)
+            trail_surface = atlas[size]
+            trail_surface.set_alpha(alpha)
             self.screen.blit(trail_surface, (pos[0] - size, pos[1] - size))
     
-    def _scene_performance_demo(self, dt: float) -> None:
+    def _update_interactive_demo(self, dt: float) -> None:
+        """Record the mouse position for the interactive scene's trail"""
+        self.mouse_trail.append(self.mouse_pos)
+    
+    def _scene_performance_demo(self) -> None:
         """Performance monitoring demo scene"""
         # Render title
-        title = self.fonts['title'].render("Performance Monitoring", True, self.text_color.to_rgb_tuple())
-        title_rect = title.get_rect(center=(self.width // 2, 100))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(*self._scene_titles['performance_demo'])
         
         # Get performance metrics
         metrics = self.performance_monitor.get_current_metrics()
@@ -590,60 +729,30 @@ class CursorDemoApp:
         
         for i, line in enumerate(info_lines):
             if i < 6:
-                color = Color(255, 255, 255)
+                color = _WHITE
             elif i == 6:
-                color = Color(255, 255, 0)
+                color = _YELLOW
             else:
                 # Safely extract alert key from line
                 parts = line.split(': ')
                 if len(parts) >= 2:
                     alert_key = parts[1].lower()
                     alert = summary['alerts'].get(alert_key, False)
-                    color = Color(255, 100, 100) if alert else Color(100, 255, 100)
+                    color = _RED if alert else _GREEN
                 else:
-                    color = Color(100, 255, 100)  # Default to green if parsing fails
+                    color = _GREEN  # Default to green if parsing fails
             
-            text = self.fonts['medium'].render(line, True, color.to_rgb_tuple())
+            text = self._render_text('medium', line, color)
             text_rect = text.get_rect(center=(self.width // 2, 200 + i * 40))
             self.screen.blit(text, text_rect)
     
-    def _scene_cursor_features_demo(self, dt: float) -> None:
+    def _scene_cursor_features_demo(self) -> None:
         """Cursor IDE features demo scene"""
         # Render title
-        title = self.fonts['title'].render("Cursor IDE Features", True, self.text_color.to_rgb_tuple())
-        title_rect = title.get_rect(center=(self.width // 2, 100))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(*self._scene_titles['cursor_features_demo'])
         
         # Render Cursor IDE features
-        info_lines = [
-            "Why Choose Cursor IDE?",
-            "• AI-powered code completion",
-            "• Advanced refactoring tools",
-            "• Intelligent debugging",
-            "• Cross-platform development",
-            "• Performance optimization",
-            "• Professional code structure",
-            "",
-            "This demo showcases:",
-            "• Clean, maintainable code",
-            "• Platform-specific optimizations",
-            "• Real-time performance monitoring",
-            "• Interactive graphics and effects"
-        ]
-        
-        for i, line in enumerate(info_lines):
-            if i == 0:
-                color = Color(255, 255, 0)
-            elif i < 7:
-                color = Color(255, 255, 255)
-            elif i == 8:
-                color = Color(100, 255, 100)
-            else:
-                color = Color(200, 200, 200)
-            
-            text = self.fonts['medium'].render(line, True, color.to_rgb_tuple())
-            text_rect = text.get_rect(center=(self.width // 2, 200 + i * 40))
-            self.screen.blit(text, text_rect)
+        self.screen.blit(*self._scene_static['cursor_features_demo'])
     
     def _next_scene(self) -> None:
         """Move to next scene"""
@@ -677,7 +786,7 @@ class CursorDemoApp:
         """Clean up resources"""
         self.logger.info("🧹 Cleaning up demo application...")
         
-        # Stop performance monitoring
+        # Stop performance monitoring, if anything started it
         if hasattr(self, 'performance_monitor'):
             self.performance_monitor.stop()
         
@@ -11,6 +11,6 @@ Version: 1.0.0
 """
 
 from .plugin_manager import PluginManager, get_plugin_manager
-from .base_plugin import BasePlugin
+from .base_plugin import BasePlugin, on
 
-__all__ = ['PluginManager', 'get_plugin_manager', 'BasePlugin'] 
\ No newline at end of file
+__all__ = ['PluginManager', 'get_plugin_manager', 'BasePlugin', 'on'] 
\ No newline at end of file
@@ -12,18 +12,44 @@ Version: 1.0.0
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, Type, ClassVar, FrozenSet, Callable
 from dataclasses import dataclass
 
 
-@dataclass
+def on(event_name: str) -> Callable[[Callable], Callable]:
+    """
+    Mark a plugin method as the handler of an application event
+    
+    The method is called with the event data and returns True if it
+    handled the event.
+    
+    Args:
+        event_name: Name of the event to handle
+        
+    Returns:
+        Decorator that tags the method
+    """
+    def decorator(method: Callable) -> Callable:
+        method._plugin_event = event_name
+        return method
+    return decorator
+
+
+@dataclass(frozen=True, slots=True)
 class PluginInfo:
-    """Plugin information and metadata"""
+    """Plugin information and metadata (immutable and hashable)"""
     name: str
     version: str
     author: str
     description: str
-    events: List[str]  # List of events this plugin handles
+    events: Tuple[str, ...]  # Events this plugin handles
+    mouse_buttons: Optional[FrozenSet[int]] = None  # Buttons on_mouse_click wants, None for all
+    
+    def __post_init__(self):
+        """Store the event names as a tuple so the info stays hashable"""
+        object.__setattr__(self, 'events', tuple(self.events))
+        if self.mouse_buttons is not None:
+            object.__setattr__(self, 'mouse_buttons', frozenset(self.mouse_buttons))
 
 
 class BasePlugin(ABC):
@@ -34,12 +60,38 @@ class BasePlugin(ABC):
     Plugins can handle various events and extend application functionality.
     """
     
+    __slots__ = ('logger', 'enabled', 'app_context', 'particle_system', 'info')
+    
+    # Every subclass in definition order, so loaders can find new plugin
+    # classes without scanning module attributes
+    _registry: ClassVar[List[Type['BasePlugin']]] = []
+    
+    # Names of the methods tagged with @on, per event name
+    _event_handlers: ClassVar[Dict[str, Tuple[str, ...]]] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        """Register each plugin class as it is defined and collect its @on handlers"""
+        super().__init_subclass__(**kwargs)
+        BasePlugin._registry.append(cls)
+        
+        handlers: Dict[str, List[str]] = {}
+        for name in dir(cls):
+            event_name = getattr(getattr(cls, name, None), '_plugin_event', None)
+            if event_name is not None:
+                handlers.setdefault(event_name, []).append(name)
+        cls._event_handlers = {event_name: tuple(names) for event_name, names in handlers.items()}
+    
     def __init__(self):
         """Initialize the plugin"""
         self.logger = logging.getLogger(f"Plugin.{self.__class__.__name__}")
         self.enabled = True
+        
+        # Shared application objects, bound once in on_load
+        self.app_context: Dict[str, Any] = {}
+        self.particle_system = None
+        
         self.info = self.get_plugin_info()
-        self.logger.info(f"Plugin '{self.info.name}' v{self.info.version} initialized")
+        self.logger.info("Plugin '%s' v%s initialized", self.info.name, self.info.version)
     
     @abstractmethod
     def get_plugin_info(self) -> PluginInfo:
@@ -61,6 +113,8 @@ class BasePlugin(ABC):
         Returns:
             True if plugin loaded successfully, False otherwise
         """
+        self.app_context = app_context
+        self.particle_system = app_context.get('particle_system')
         self.logger.info(f"Plugin '{self.info.name}' loaded")
         return True
     
@@ -113,14 +167,13 @@ class BasePlugin(ABC):
         # Default implementation - plugins should override this
         return False
     
-    def on_mouse_click(self, button: int, pos: Tuple[int, int], app_context: Dict[str, Any]) -> bool:
+    def on_mouse_click(self, button: int, pos: Tuple[int, int]) -> bool:
         """
         Handle mouse click events
         
         Args:
             button: Mouse button (1=left, 2=middle, 3=right)
             pos: Mouse position (x, y)
-            app_context: Application context
             
         Returns:
             True if event was handled, False otherwise
@@ -131,13 +184,12 @@ class BasePlugin(ABC):
         # Default implementation - plugins should override this
         return False
     
-    def on_key_press(self, key: int, app_context: Dict[str, Any]) -> bool:
+    def on_key_press(self, key: int) -> bool:
         """
         Handle key press events
         
         Args:
             key: Key code
-            app_context: Application context
             
         Returns:
             True if event was handled, False otherwise
@@ -148,13 +200,12 @@ class BasePlugin(ABC):
         # Default implementation - plugins should override this
         return False
     
-    def on_update(self, dt: float, app_context: Dict[str, Any]) -> bool:
+    def on_update(self, dt: float) -> bool:
         """
         Called every frame for plugin updates
         
         Args:
             dt: Delta time
-            app_context: Application context
             
         Returns:
             True if update was handled, False otherwise
@@ -165,13 +216,12 @@ class BasePlugin(ABC):
         # Default implementation - plugins should override this
         return False
     
-    def on_render(self, surface, app_context: Dict[str, Any]) -> bool:
+    def on_render(self, surface) -> bool:
         """
         Called every frame for plugin rendering
         
         Args:
             surface: Pygame surface to render on
-            app_context: Application context
             
         Returns:
             True if rendering was handled, False otherwise
@@ -12,6 +12,9 @@ Version: 1.0.0
 
 import pygame
 import math
+import colorsys
+import numpy as np
+from functools import lru_cache
 from typing import Dict, Any, List, Tuple
 from .base_plugin import BasePlugin, PluginInfo
 
@@ -20,6 +23,7 @@ try:
     from app.frontend.particle_system import ParticleEmitter, Particle
     from app.utils.color_utils import Color
     from app.utils.math_utils import random_range
+    from app.utils.jit import njit, NUMBA_AVAILABLE
 except ImportError:
     # Fallback for direct script execution
     import sys
@@ -28,6 +32,73 @@ except ImportError:
     from app.frontend.particle_system import ParticleEmitter, Particle
     from app.utils.color_utils import Color
     from app.utils.math_utils import random_range
+    from app.utils.jit import njit, NUMBA_AVAILABLE
+
+
+@njit('int64(float64[::1], float64[::1], int32[:, ::1], int64[::1], float64)', cache=True)
+def _advance_spells(times, durations, positions, kept, dt):
+    """
+    Advance spell timers and compact the unfinished spells to the front
+    
+    Args:
+        times: Elapsed time per spell, advanced in place
+        durations: Duration per spell
+        positions: (N, 2) spell positions
+        kept: Receives the original index of each surviving spell
+        dt: Delta time
+        
+    Returns:
+        Number of surviving spells
+    """
+    write = 0
+    for i in range(times.shape[0]):
+        t = times[i] + dt
+        if t < durations[i]:
+            times[write] = t
+            durations[write] = durations[i]
+            positions[write, 0] = positions[i, 0]
+            positions[write, 1] = positions[i, 1]
+            kept[write] = i
+            write += 1
+    return write
+
+
+# Letter shapes (simplified pixel art) as point offsets from the letter origin
+_LETTER_SHAPES = {
+    char: np.array(points, dtype=np.int32)
+    for char, points in {
+        'k': [
+            (0, -8), (0, -6), (0, -4), (0, -2), (0, 0), (0, 2), (0, 4), (0, 6), (0, 8),  # Vertical line
+            (2, 4), (4, 2), (6, 0), (8, -2), (10, -4),  # Upper diagonal
+            (2, -4), (4, -2), (6, 0), (8, 2), (10, 4),  # Lower diagonal
+        ],
+        '0': [
+            (0, -6), (2, -8), (4, -8), (6, -8), (8, -6),  # Top
+            (8, -4), (8, -2), (8, 0), (8, 2), (8, 4), (8, 6),  # Right
+            (6, 8), (4, 8), (2, 8), (0, 6),  # Bottom
+            (0, 4), (0, 2), (0, 0), (0, -2), (0, -4),  # Left
+        ],
+        'g': [
+            (0, -6), (2, -8), (4, -8), (6, -8), (8, -6),  # Top
+            (8, -4), (8, -2), (8, 0), (8, 2), (8, 4), (8, 6),  # Right
+            (6, 8), (4, 8), (2, 8), (0, 6),  # Bottom
+            (0, 4), (0, 2), (0, 0), (0, -2), (0, -4),  # Left
+            (2, 0), (4, 0), (6, 0), (8, 0),  # Middle line
+        ],
+        'a': [
+            (0, -6), (2, -8), (4, -8), (6, -8), (8, -6),  # Top
+            (8, -4), (8, -2), (8, 0), (8, 2), (8, 4), (8, 6),  # Right
+            (6, 8), (4, 8), (2, 8), (0, 6),  # Bottom
+            (0, 4), (0, 2), (0, 0), (0, -2), (0, -4),  # Left
+            (2, 0), (4, 0), (6, 0),  # Middle line
+        ],
+        'r': [
+            (0, -8), (0, -6), (0, -4), (0, -2), (0, 0), (0, 2), (0, 4), (0, 6), (0, 8),  # Vertical line
+            (2, 6), (4, 4), (6, 2), (8, 0),  # Diagonal
+        ]
+    }.items()
+}
+_DEFAULT_SHAPE = np.zeros((1, 2), dtype=np.int32)  # Center point for unknown characters
 
 
 class K00garSpellPlugin(BasePlugin):
@@ -49,33 +120,69 @@ class K00garSpellPlugin(BasePlugin):
         self.text = "k00gar"
         
         # Character positions (relative to click position)
-        self.char_positions = [
+        self.char_positions = (
             (-120, -20),  # k
             (-80, -20),   # 0
             (-40, -20),   # 0
             (0, -20),     # g
             (40, -20),    # a
             (80, -20),    # r
-        ]
+        )
         
         # Character colors (rainbow effect)
-        self.char_colors = [
+        self.char_colors = (
             Color(255, 0, 0),    # Red
             Color(255, 165, 0),  # Orange
             Color(255, 255, 0),  # Yellow
             Color(0, 255, 0),    # Green
             Color(0, 0, 255),    # Blue
             Color(128, 0, 128),  # Purple
-        ]
+        )
         
-        # Active spell effects
-        self.active_spells: List[Dict[str, Any]] = []
+        # Emitters of each active spell; the spell arrays, letter layout and
+        # indicator surfaces are built by _init_resources on the first spell
+        self._spell_emitters: List[List[ParticleEmitter]] = []
+        self._ready = False
         
         # Spell configuration
         self.spell_duration = 3.0
         self.particles_per_char = 50  # Increased for better letter formation
         self.spell_radius = 15  # Smaller radius for tighter formation
         
+    def _init_resources(self) -> None:
+        """Build the spell state and render resources, deferred until first use"""
+        # Active spell effects as parallel arrays (one row per spell), with
+        # each spell's emitters kept in _spell_emitters
+        self._spell_times = np.empty(0, dtype=np.float64)
+        self._spell_durations = np.empty(0, dtype=np.float64)
+        self._spell_positions = np.empty((0, 2), dtype=np.int32)
+        self._spell_kept = np.empty(0, dtype=np.int64)  # Scratch for _advance_spells
+        
+        # Letter points and emitter templates, reused by every spell
+        self._rebuild_char_spec()
+        
+        # Spell indicator, drawn once; faded copies are cached per alpha so a
+        # frame's indicators can be blitted in one batch
+        self._indicator = self._build_indicator()
+        self._faded_indicator = lru_cache(maxsize=256)(self._fade_indicator)
+        self._ready = True
+    
+    @staticmethod
+    def _build_indicator() -> pygame.Surface:
+        """Pre-draw the hard-edged white spell indicator circle"""
+        indicator = pygame.Surface((20, 20))
+        if pygame.display.get_surface() is not None:
+            indicator = indicator.convert()
+        pygame.draw.circle(indicator, (255, 255, 255), (10, 10), 10)
+        indicator.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        return indicator
+    
+    def _fade_indicator(self, alpha: int) -> pygame.Surface:
+        """Copy the indicator with a fixed surface alpha (cached as _faded_indicator)"""
+        faded = self._indicator.copy()
+        faded.set_alpha(alpha)
+        return faded
+    
     def get_plugin_info(self) -> PluginInfo:
         """Get plugin information"""
         return PluginInfo(
@@ -83,152 +190,94 @@ class K00garSpellPlugin(BasePlugin):
             version="1.0.0",
             author="Cursor IDE Demo",
             description="Spells out 'k00gar' with particles on right-click",
-            events=["mouse_click", "update", "render"]
+            events=("mouse_click", "update", "render"),
+            mouse_buttons=frozenset({3})
         )
     
-    def on_mouse_click(self, button: int, pos: Tuple[int, int], app_context: Dict[str, Any]) -> bool:
+    def on_mouse_click(self, button: int, pos: Tuple[int, int]) -> bool:
         """
         Handle mouse click events
         
         Args:
             button: Mouse button (1=left, 2=middle, 3=right)
             pos: Mouse position (x, y)
-            app_context: Application context
             
         Returns:
             True if event was handled, False otherwise
         """
         if button == 3:  # Right mouse button
-            self._create_spell_effect(pos, app_context)
+            if not self._ready:
+                self._init_resources()
+            self._create_spell_effect(pos)
             return True
         
         return False
     
-    def _create_spell_effect(self, pos: Tuple[int, int], app_context: Dict[str, Any]) -> None:
+    def _create_spell_effect(self, pos: Tuple[int, int]) -> None:
         """
         Create a spell effect at the given position
         
         Args:
             pos: Position to create the spell
-            app_context: Application context
         """
         try:
-            particle_system = app_context.get('particle_system')
+            particle_system = self.particle_system
             if not particle_system:
                 self.logger.warning("Particle system not found in app context")
                 return
             
-            # Create spell effect data
-            spell_effect = {
-                'pos': pos,
-                'start_time': 0.0,
-                'duration': self.spell_duration,
-                'char_emitters': [],
-                'active': True
-            }
+            origin = np.asarray(pos, dtype=np.int32)
+            add_emitters_bulk = particle_system.add_emitters_bulk
+            char_emitters = []
             
-            # Create particle emitters for each character
-            for i, (char, char_pos, char_color) in enumerate(zip(self.text, self.char_positions, self.char_colors)):
-                # Calculate character position
-                char_x = pos[0] + char_pos[0]
-                char_y = pos[1] + char_pos[1]
-                
-                # Create multiple emitters for each character to form letter shape
-                char_emitters = self._create_letter_emitters(char_x, char_y, char, char_color, i * 0.1)
-                
-                for emitter in char_emitters:
-                    particle_system.add_emitter(emitter)
-                    spell_effect['char_emitters'].append(emitter)
+            # Clone each letter's cached template at every point of its shape
+            for i, (points, template) in enumerate(self._char_spec):
+                char_emitters.extend(add_emitters_bulk(template, points + origin, delay=i * 0.1))
             
             # Add to active spells
-            self.active_spells.append(spell_effect)
+            self._spell_times = np.append(self._spell_times, 0.0)
+            self._spell_durations = np.append(self._spell_durations, self.spell_duration)
+            self._spell_positions = np.append(self._spell_positions, origin[None, :], axis=0)
+            self._spell_emitters.append(char_emitters)
+            self._spell_kept = np.empty(len(self._spell_emitters), dtype=np.int64)
             
-            self.logger.info(f"Created k00gar spell effect at {pos}")
+            self.logger.info("Created k00gar spell effect at %s", pos)
             
         except Exception as e:
             self.logger.error(f"Error creating spell effect: {e}")
     
-    def _create_letter_emitters(self, x: float, y: float, char: str, color: Color, delay: float) -> List[ParticleEmitter]:
+    def _create_letter_template(self, color: Color) -> ParticleEmitter:
         """
-        Create multiple emitters to form a letter shape
+        Create the emitter configuration shared by every point of a letter
         
         Args:
-            x: X position
-            y: Y position
-            char: Character to form
             color: Character color
-            delay: Delay before starting emission
             
         Returns:
-            List of particle emitters
+            Configured emitter to clone at each letter point
         """
-        emitters = []
-        
-        # Define letter shapes (simplified pixel art)
-        letter_shapes = {
-            'k': [
-                (0, -8), (0, -6), (0, -4), (0, -2), (0, 0), (0, 2), (0, 4), (0, 6), (0, 8),  # Vertical line
-                (2, 4), (4, 2), (6, 0), (8, -2), (10, -4),  # Upper diagonal
-                (2, -4), (4, -2), (6, 0), (8, 2), (10, 4),  # Lower diagonal
-            ],
-            '0': [
-                (0, -6), (2, -8), (4, -8), (6, -8), (8, -6),  # Top
-                (8, -4), (8, -2), (8, 0), (8, 2), (8, 4), (8, 6),  # Right
-                (6, 8), (4, 8), (2, 8), (0, 6),  # Bottom
-                (0, 4), (0, 2), (0, 0), (0, -2), (0, -4),  # Left
-            ],
-            'g': [
-                (0, -6), (2, -8), (4, -8), (6, -8), (8, -6),  # Top
-                (8, -4), (8, -2), (8, 0), (8, 2), (8, 4), (8, 6),  # Right
-                (6, 8), (4, 8), (2, 8), (0, 6),  # Bottom
-                (0, 4), (0, 2), (0, 0), (0, -2), (0, -4),  # Left
-                (2, 0), (4, 0), (6, 0), (8, 0),  # Middle line
-            ],
-            'a': [
-                (0, -6), (2, -8), (4, -8), (6, -8), (8, -6),  # Top
-                (8, -4), (8, -2), (8, 0), (8, 2), (8, 4), (8, 6),  # Right
-                (6, 8), (4, 8), (2, 8), (0, 6),  # Bottom
-                (0, 4), (0, 2), (0, 0), (0, -2), (0, -4),  # Left
-                (2, 0), (4, 0), (6, 0),  # Middle line
-            ],
-            'r': [
-                (0, -8), (0, -6), (0, -4), (0, -2), (0, 0), (0, 2), (0, 4), (0, 6), (0, 8),  # Vertical line
-                (2, 6), (4, 4), (6, 2), (8, 0),  # Diagonal
-            ]
-        }
+        emitter = ParticleEmitter(0, 0)
         
-        # Get the shape for this character
-        shape = letter_shapes.get(char, [(0, 0)])  # Default to center if char not found
+        # Configure emitter for letter formation
+        emitter.set_emission_rate(15.0)  # Lower rate for each point
+        emitter.set_particle_life(2.5)
+        emitter.set_particle_speed(10.0)  # Very slow for tight formation
+        emitter.set_particle_size(1.5)    # Small particles
+        emitter.set_particle_color(color)
+        emitter.set_emission_angle(0, 360)
+        emitter.set_gravity(0.0)
+        emitter.set_friction(0.98)  # High friction to stay in place
         
-        # Create an emitter for each point in the letter shape
-        for point_x, point_y in shape:
-            emitter = ParticleEmitter(x + point_x, y + point_y)
-            
-            # Configure emitter for letter formation
-            emitter.set_emission_rate(15.0)  # Lower rate for each point
-            emitter.set_particle_life(2.5)
-            emitter.set_particle_speed(10.0)  # Very slow for tight formation
-            emitter.set_particle_size(1.5)    # Small particles
-            emitter.set_particle_color(color)
-            emitter.set_emission_angle(0, 360)
-            emitter.set_gravity(0.0)
-            emitter.set_friction(0.98)  # High friction to stay in place
-            
-            # Minimal variation for clear letter formation
-            emitter.color_variation = 10.0
-            emitter.size_variation = 0.2
-            emitter.speed_variation = 0.1
-            emitter.life_variation = 0.2
-            
-            # Set lifetime
-            emitter.set_emitter_lifetime(1.8, 0.6)
-            
-            # Add delay
-            emitter.emission_timer = -delay
-            
-            emitters.append(emitter)
+        # Minimal variation for clear letter formation
+        emitter.color_variation = 10.0
+        emitter.size_variation = 0.2
+        emitter.speed_variation = 0.1
+        emitter.life_variation = 0.2
         
-        return emitters
+        # Set lifetime
+        emitter.set_emitter_lifetime(1.8, 0.6)
+        
+        return emitter
     
     def _create_char_emitter(self, x: float, y: float, color: Color, delay: float) -> ParticleEmitter:
         """
@@ -269,52 +318,75 @@ class K00garSpellPlugin(BasePlugin):
         
         return emitter
     
-    def on_update(self, dt: float, app_context: Dict[str, Any]) -> bool:
+    def on_update(self, dt: float) -> bool:
         """
         Update plugin state
         
         Args:
             dt: Delta time
-            app_context: Application context
             
         Returns:
             True if update was handled, False otherwise
         """
-        # Update active spells
-        for spell_effect in list(self.active_spells):
-            spell_effect['start_time'] += dt
-            
-            # Check if spell is finished
-            if spell_effect['start_time'] >= spell_effect['duration']:
-                spell_effect['active'] = False
-                self.active_spells.remove(spell_effect)
+        if not self._spell_emitters:
+            return True
+        
+        count = len(self._spell_emitters)
+        if NUMBA_AVAILABLE:
+            # Advance and compact in one fused pass without temporaries
+            kept = self._spell_kept
+            alive_count = _advance_spells(self._spell_times, self._spell_durations, self._spell_positions, kept, dt)
+            if alive_count < count:
+                self._spell_times = self._spell_times[:alive_count]
+                self._spell_durations = self._spell_durations[:alive_count]
+                self._spell_positions = self._spell_positions[:alive_count]
+                self._spell_kept = kept[:alive_count]
+                emitters = self._spell_emitters
+                self._spell_emitters = [emitters[i] for i in kept[:alive_count].tolist()]
                 self.logger.debug("Spell effect finished")
+            return True
+        
+        # Advance all active spells at once
+        self._spell_times += dt
+        
+        # Drop finished spells only when one has expired
+        alive = self._spell_times < self._spell_durations
+        if not alive.all():
+            self._spell_times = self._spell_times[alive]
+            self._spell_durations = self._spell_durations[alive]
+            self._spell_positions = self._spell_positions[alive]
+            self._spell_emitters = [emitters for emitters, keep in zip(self._spell_emitters, alive.tolist()) if keep]
+            self.logger.debug("Spell effect finished")
         
         return True
     
-    def on_render(self, surface, app_context: Dict[str, Any]) -> bool:
+    def on_render(self, surface) -> bool:
         """
         Render plugin elements
         
         Args:
             surface: Pygame surface to render on
-            app_context: Application context
             
         Returns:
             True if rendering was handled, False otherwise
         """
-        # Render active spell indicators (optional)
-        for spell_effect in self.active_spells:
-            if spell_effect['active']:
-                pos = spell_effect['pos']
-                progress = spell_effect['start_time'] / spell_effect['duration']
-                
-                # Draw a subtle indicator
-                alpha = int(255 * (1.0 - progress))
-                if alpha > 0:
-                    indicator_surface = pygame.Surface((20, 20), pygame.SRCALPHA)
-                    pygame.draw.circle(indicator_surface, (255, 255, 255, alpha), (10, 10), 10)
-                    surface.blit(indicator_surface, (pos[0] - 10, pos[1] - 10))
+        if not self._spell_emitters:
+            return True
+        
+        # Render active spell indicators (optional), fading out over each spell
+        alphas = (255 * (1.0 - self._spell_times / self._spell_durations)).astype(np.int32)
+        
+        # Skip faded-out indicators and the ones entirely outside the surface
+        width, height = surface.get_size()
+        x = self._spell_positions[:, 0]
+        y = self._spell_positions[:, 1]
+        visible = (alphas > 0) & (x > -10) & (x < width + 10) & (y > -10) & (y < height + 10)
+        if not visible.any():
+            return True
+        
+        faded = self._faded_indicator
+        corners = (self._spell_positions[visible] - 10).tolist()
+        surface.blits([(faded(alpha), corner) for alpha, corner in zip(alphas[visible].tolist(), corners)], doreturn=False)
         
         return True
     
@@ -353,15 +425,31 @@ class K00garSpellPlugin(BasePlugin):
     def _update_char_positions(self) -> None:
         """Update character positions based on current text"""
         char_width = 40
-        start_x = -(len(self.text) - 1) * char_width // 2
+        count = len(self.text)
+        start_x = -(count - 1) * char_width // 2
         
-        self.char_positions = []
-        for i in range(len(self.text)):
-            x = start_x + i * char_width
-            self.char_positions.append((x, -20))
+        offsets = np.stack([
+            start_x + np.arange(count, dtype=np.int32) * char_width,
+            np.full(count, -20, dtype=np.int32)
+        ], axis=1)
+        self.char_positions = tuple(tuple(offset) for offset in offsets.tolist())
         
         # Update colors if needed
-        while len(self.char_colors) < len(self.text):
+        colors = list(self.char_colors)
+        while len(colors) < len(self.text):
             # Add more rainbow colors
-            hue = (len(self.char_colors) * 60) % 360
-            self.char_colors.append(Color.from_hsv(hue, 100, 100)) 
\ No newline at end of file
+            hue = (len(colors) * 60) % 360
+            r, g, b = colorsys.hsv_to_rgb(hue / 360.0, 1.0, 1.0)
+            colors.append(Color(int(r * 255), int(g * 255), int(b * 255)))
+        self.char_colors = tuple(colors)
+        
+        if self._ready:
+            self._rebuild_char_spec()
+    
+    def _rebuild_char_spec(self) -> None:
+        """Precompute each character's letter points (relative to the click) and emitter template"""
+        offsets = np.asarray(self.char_positions, dtype=np.int32)
+        self._char_spec = tuple(
+            (_LETTER_SHAPES.get(char, _DEFAULT_SHAPE) + offset, self._create_letter_template(color))
+            for char, offset, color in zip(self.text, offsets, self.char_colors)
+        ) 
\ No newline at end of file
@@ -14,12 +14,27 @@ import os
 import sys
 import importlib
 import importlib.util
+import inspect
 import logging
+import pkgutil
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Type
+from typing import Dict, Any, List, Optional, Set, Type, Tuple, Callable
 from .base_plugin import BasePlugin, PluginInfo
 
 
+# Dispatched events and the BasePlugin handler each one calls
+_EVENT_HANDLERS = {
+    'mouse_click': 'on_mouse_click',
+    'key_press': 'on_key_press',
+    'update': 'on_update',
+    'render': 'on_render',
+    'event': 'on_event'
+}
+
+# Per-frame events; a plugin whose handler raises is dropped from these
+_FRAME_EVENTS = ('update', 'render')
+
+
 class PluginManager:
     """
     Plugin management system
@@ -47,6 +62,23 @@ class PluginManager:
             self.logger.setLevel(logging.INFO)
         self.app_context: Dict[str, Any] = {}
         
+        # Plugin classes of each executed plugin file with the file's mtime,
+        # so reloading skips files that have not changed
+        self._module_cache: Dict[Path, Tuple[float, List[Type[BasePlugin]]]] = {}
+        
+        # Per-event (plugin name, bound handler) pairs of enabled plugins that
+        # override the handler, rebuilt whenever the plugin set changes
+        self._subs: Dict[str, Tuple[Tuple[str, Callable], ...]] = {event: () for event in _EVENT_HANDLERS}
+        
+        # @on handlers of enabled plugins, per application event name
+        self._event_index: Dict[str, Tuple[Tuple[str, Callable], ...]] = {}
+        
+        # Mouse click subscribers per button, filled in on first use of a button
+        self._mouse_subs: Dict[int, Tuple[Tuple[str, Callable], ...]] = {}
+        
+        # Plugins that raised during a per-frame handler
+        self._quarantined: Set[str] = set()
+        
         # Create plugins directory if it doesn't exist
         if not self.plugins_dir.exists():
             self.plugins_dir.mkdir(parents=True, exist_ok=True)
@@ -66,8 +98,12 @@ class PluginManager:
         self.logger.info(f"Loading plugins from: {self.plugins_dir}")
         
         try:
-            # Get all Python files in the plugins directory
-            plugin_files = list(self.plugins_dir.glob("*.py"))
+            # Get all Python modules in the plugins directory
+            plugin_files = [
+                self.plugins_dir / f"{module_info.name}.py"
+                for module_info in pkgutil.iter_modules([str(self.plugins_dir)])
+                if not module_info.ispkg
+            ]
             
             self.logger.info(f"Found {len(plugin_files)} Python files in plugins directory")
             for file in plugin_files:
@@ -95,6 +131,9 @@ class PluginManager:
         except Exception as e:
             self.logger.error(f"Error loading plugins: {e}")
             return False
+        
+        finally:
+            self._rebuild_subscriptions()
     
     def _load_plugin(self, plugin_file: Path) -> bool:
         """
@@ -107,22 +146,7 @@ class PluginManager:
             True if plugin loaded successfully, False otherwise
         """
         try:
-            # Load the module
-            spec = importlib.util.spec_from_file_location(
-                f"plugins.{plugin_file.stem}", 
-                plugin_file
-            )
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Find plugin classes (classes that inherit from BasePlugin)
-            plugin_classes = []
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (isinstance(attr, type) and 
-                    issubclass(attr, BasePlugin) and 
-                    attr != BasePlugin):
-                    plugin_classes.append(attr)
+            plugin_classes = self._load_plugin_classes(plugin_file)
             
             if not plugin_classes:
                 self.logger.warning(f"No plugin classes found in {plugin_file}")
@@ -155,6 +179,50 @@ class PluginManager:
             self.logger.error(f"Error loading plugin from {plugin_file}: {e}")
             return False
     
+    def _load_plugin_classes(self, plugin_file: Path) -> List[Type[BasePlugin]]:
+        """
+        Execute a plugin file and return the plugin classes it defines
+        
+        Files that are unchanged since they were last executed are not
+        executed again; their previously defined classes are returned.
+        
+        Args:
+            plugin_file: Path to the plugin file
+            
+        Returns:
+            Concrete BasePlugin subclasses defined by the file
+        """
+        mtime = os.stat(plugin_file).st_mtime
+        cached = self._module_cache.get(plugin_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        # Load the module
+        spec = importlib.util.spec_from_file_location(
+            f"plugins.{plugin_file.stem}", 
+            plugin_file
+        )
+        module = importlib.util.module_from_spec(spec)
+        
+        # Register the module first so imports of it by name (e.g. when Numba
+        # compiles its kernels) find this instance instead of executing it again
+        sys.modules[spec.name] = module
+        
+        # Plugin classes register themselves on BasePlugin as they are defined
+        registered = len(BasePlugin._registry)
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(spec.name, None)
+            raise
+        plugin_classes = [
+            cls for cls in BasePlugin._registry[registered:]
+            if not inspect.isabstract(cls)
+        ]
+        
+        self._module_cache[plugin_file] = (mtime, plugin_classes)
+        return plugin_classes
+    
     def unload_plugins(self) -> bool:
         """
         Unload all plugins
@@ -181,6 +249,59 @@ class PluginManager:
         except Exception as e:
             self.logger.error(f"Error unloading plugins: {e}")
             return False
+        
+        finally:
+            self._quarantined.clear()
+            self._rebuild_subscriptions()
+    
+    def _rebuild_subscriptions(self) -> None:
+        """Recompute the per-event handler tuples from the loaded plugins"""
+        self._mouse_subs = {}
+        
+        event_index: Dict[str, List[Tuple[str, Callable]]] = {}
+        for plugin_name, plugin in self.plugins.items():
+            if plugin.enabled:
+                for event_name, method_names in type(plugin)._event_handlers.items():
+                    event_index.setdefault(event_name, []).extend(
+                        (plugin_name, getattr(plugin, method_name)) for method_name in method_names
+                    )
+        self._event_index = {event_name: tuple(subs) for event_name, subs in event_index.items()}
+        for event, method in _EVENT_HANDLERS.items():
+            default = getattr(BasePlugin, method)
+            skipped = self._quarantined if event in _FRAME_EVENTS else ()
+            self._subs[event] = tuple(
+                (plugin_name, getattr(plugin, method))
+                for plugin_name, plugin in self.plugins.items()
+                if plugin.enabled and plugin_name not in skipped
+                and getattr(type(plugin), method) is not default
+            )
+    
+    def _dispatch_frame_event(self, event: str, *args: Any) -> None:
+        """
+        Call every per-frame handler of an event
+        
+        The loop runs under a single try. When a handler raises, its plugin
+        is quarantined from the per-frame events and the remaining handlers
+        still run this frame.
+        
+        Args:
+            event: Per-frame event name ('update' or 'render')
+            *args: Handler arguments
+        """
+        subs = self._subs[event]
+        start = 0
+        while start < len(subs):
+            index = start
+            try:
+                for index in range(start, len(subs)):
+                    subs[index][1](*args)
+                return
+            except Exception as e:
+                plugin_name = subs[index][0]
+                self.logger.error(f"Error in plugin '{plugin_name}' {event} handler, disabling its per-frame handlers: {e}")
+                self._quarantined.add(plugin_name)
+                self._rebuild_subscriptions()
+                start = index + 1
     
     def handle_mouse_click(self, button: int, pos: tuple) -> bool:
         """
@@ -195,11 +316,19 @@ class PluginManager:
         """
         handled = False
         
-        for plugin_name, plugin in self.plugins.items():
+        subs = self._mouse_subs.get(button)
+        if subs is None:
+            subs = self._mouse_subs[button] = tuple(
+                (plugin_name, handler) for plugin_name, handler in self._subs['mouse_click']
+                if self.plugins[plugin_name].info.mouse_buttons is None
+                or button in self.plugins[plugin_name].info.mouse_buttons
+            )
+        
+        for plugin_name, handler in subs:
             try:
-                if plugin.on_mouse_click(button, pos, self.app_context):
+                if handler(button, pos):
                     handled = True
-                    self.logger.debug(f"Plugin '{plugin_name}' handled mouse click")
+                    self.logger.debug("Plugin '%s' handled mouse click", plugin_name)
             except Exception as e:
                 self.logger.error(f"Error in plugin '{plugin_name}' mouse click handler: {e}")
         
@@ -217,11 +346,11 @@ class PluginManager:
         """
         handled = False
         
-        for plugin_name, plugin in self.plugins.items():
+        for plugin_name, handler in self._subs['key_press']:
             try:
-                if plugin.on_key_press(key, self.app_context):
+                if handler(key):
                     handled = True
-                    self.logger.debug(f"Plugin '{plugin_name}' handled key press")
+                    self.logger.debug("Plugin '%s' handled key press", plugin_name)
             except Exception as e:
                 self.logger.error(f"Error in plugin '{plugin_name}' key press handler: {e}")
         
@@ -234,11 +363,7 @@ class PluginManager:
         Args:
             dt: Delta time
         """
-        for plugin_name, plugin in self.plugins.items():
-            try:
-                plugin.on_update(dt, self.app_context)
-            except Exception as e:
-                self.logger.error(f"Error updating plugin '{plugin_name}': {e}")
+        self._dispatch_frame_event('update', dt)
     
     def render_plugins(self, surface) -> None:
         """
@@ -247,11 +372,7 @@ class PluginManager:
         Args:
             surface: Pygame surface to render on
         """
-        for plugin_name, plugin in self.plugins.items():
-            try:
-                plugin.on_render(surface, self.app_context)
-            except Exception as e:
-                self.logger.error(f"Error rendering plugin '{plugin_name}': {e}")
+        self._dispatch_frame_event('render', surface)
     
     def handle_event(self, event_name: str, event_data: Dict[str, Any]) -> bool:
         """
@@ -266,11 +387,21 @@ class PluginManager:
         """
         handled = False
         
-        for plugin_name, plugin in self.plugins.items():
+        # Handlers registered for this event with @on
+        for plugin_name, handler in self._event_index.get(event_name, ()):
+            try:
+                if handler(event_data):
+                    handled = True
+                    self.logger.debug("Plugin '%s' handled event '%s'", plugin_name, event_name)
+            except Exception as e:
+                self.logger.error(f"Error in plugin '{plugin_name}' event handler: {e}")
+        
+        # Plugins that still switch on the event name in on_event
+        for plugin_name, handler in self._subs['event']:
             try:
-                if plugin.on_event(event_name, event_data):
+                if handler(event_name, event_data):
                     handled = True
-                    self.logger.debug(f"Plugin '{plugin_name}' handled event '{event_name}'")
+                    self.logger.debug("Plugin '%s' handled event '%s'", plugin_name, event_name)
             except Exception as e:
                 self.logger.error(f"Error in plugin '{plugin_name}' event handler: {e}")
         
@@ -309,7 +440,11 @@ class PluginManager:
         """
         plugin = self.plugins.get(name)
         if plugin:
-            return plugin.on_enable()
+            # Re-enabling gives a quarantined plugin another chance
+            self._quarantined.discard(name)
+            enabled = plugin.on_enable()
+            self._rebuild_subscriptions()
+            return enabled
         return False
     
     def disable_plugin(self, name: str) -> bool:
@@ -324,7 +459,9 @@ class PluginManager:
         """
         plugin = self.plugins.get(name)
         if plugin:
-            return plugin.on_disable()
+            disabled = plugin.on_disable()
+            self._rebuild_subscriptions()
+            return disabled
         return False
     
     def reload_plugins(self) -> bool:
@@ -12,16 +12,23 @@ Version: 1.0.0
 """
 
 import os
+import re
 import sys
+import json
+import logging
 import platform
 import psutil
 import threading
 import time
+import functools
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 
 
+logger = logging.getLogger(__name__)
+
 class PlatformType(Enum):
     """Enumeration of supported platforms"""
     WINDOWS = "windows"
@@ -48,6 +55,139 @@ class HardwareInfo:
     architecture: ArchitectureType
     platform: PlatformType
     is_high_performance: bool
+    simd_level: str = "scalar"
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory: %LOCALAPPDATA% on Windows, else $XDG_CACHE_HOME, else ~/.cache"""
+    base = os.environ.get("LOCALAPPDATA" if sys.platform == "win32" else "XDG_CACHE_HOME")
+    return Path(base) if base else Path.home() / ".cache"
+
+
+# Detected hardware is cached between runs so startup skips the psutil probes
+_CACHE_FILE = _user_cache_dir() / "cursordemo" / "platform.json"
+# Bump when HardwareInfo or the cached fields change so older cache files
+# are re-detected
+_CACHE_VERSION = 3
+# Fields that do not change while the machine stays the same; memory
+# availability and the current CPU frequency are re-read on every run
+_CACHED_FIELDS = ("cpu_count", "memory_total", "architecture", "platform", "simd_level")
+
+# Widest SIMD extension first, as named in NumPy's CPU feature table
+_SIMD_LEVELS = (
+    ("AVX512F", "avx512"),
+    ("AVX2", "avx2"),
+    ("SSE2", "sse2"),
+    ("SVE", "sve"),
+    ("ASIMD", "neon"),
+    ("NEON", "neon"),
+)
+
+
+def _cache_key() -> str:
+    """Identify the machine the cached hardware info was detected on"""
+    uname = platform.uname()
+    return f"{uname.system}|{uname.release}|{uname.machine}|{os.cpu_count()}"
+
+
+_CPU_MHZ_PATTERN = re.compile(r'^cpu MHz\s*:\s*([\d.]+)', re.MULTILINE)
+
+
+def _cpu_frequency() -> float:
+    """
+    Get the average current CPU frequency in MHz
+    
+    On Linux this reads /proc/cpuinfo once instead of letting psutil open
+    a cpufreq file per logical CPU.
+    """
+    if sys.platform.startswith('linux'):
+        try:
+            with open('/proc/cpuinfo', 'r', encoding='utf-8') as f:
+                speeds = _CPU_MHZ_PATTERN.findall(f.read())
+            if speeds:
+                return sum(map(float, speeds)) / len(speeds)
+        except (OSError, ValueError):
+            pass
+    cpu_freq = psutil.cpu_freq()
+    return cpu_freq.current if cpu_freq else 0.0
+
+
+def _simd_level() -> str:
+    """
+    Get the widest SIMD extension the CPU supports
+    
+    Uses the runtime feature table NumPy builds for its own kernel
+    dispatch, which covers x86 and ARM on every platform.
+    
+    Returns:
+        One of 'avx512', 'avx2', 'sse2', 'sve', 'neon' or 'scalar'
+    """
+    try:
+        from numpy._core._multiarray_umath import __cpu_features__ as features
+    except ImportError:
+        try:
+            # NumPy 1.x location
+            from numpy.core._multiarray_umath import __cpu_features__ as features
+        except ImportError:
+            return "scalar"
+    for feature, level in _SIMD_LEVELS:
+        if features.get(feature):
+            return level
+    return "scalar"
+
+
+def _is_high_performance(cpu_count: int, cpu_frequency: float, memory_total: int) -> bool:
+    """Decide whether the hardware qualifies for the high-performance profile"""
+    return (
+        cpu_count >= 4 and 
+        cpu_frequency >= 2000.0 and 
+        memory_total >= 8 * (1024**3)  # 8 GB
+    )
+
+
+def _load_cached_hardware(key: str) -> Optional[HardwareInfo]:
+    """
+    Return hardware info built from the cached static fields
+    
+    The volatile values (available memory, current CPU frequency) are read
+    fresh and is_high_performance is recomputed from them.
+    
+    Returns:
+        Hardware info, or None if the cache is missing, stale or unreadable
+    """
+    try:
+        with open(_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get("version") != _CACHE_VERSION or cached.get("key") != key:
+            return None
+        data = {field: cached["hardware"][field] for field in _CACHED_FIELDS}
+        data["architecture"] = ArchitectureType(data["architecture"])
+        data["platform"] = PlatformType(data["platform"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    
+    cpu_frequency = _cpu_frequency()
+    return HardwareInfo(
+        cpu_frequency=cpu_frequency,
+        memory_available=psutil.virtual_memory().available,
+        is_high_performance=_is_high_performance(data["cpu_count"], cpu_frequency, data["memory_total"]),
+        **data
+    )
+
+
+def _store_cached_hardware(key: str, info: HardwareInfo) -> None:
+    """Write the static hardware fields to the cache file; failures are ignored"""
+    data = {field: getattr(info, field) for field in _CACHED_FIELDS}
+    data["architecture"] = info.architecture.value
+    data["platform"] = info.platform.value
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = _CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({"version": _CACHE_VERSION, "key": key, "hardware": data}, f)
+        os.replace(tmp_file, _CACHE_FILE)
+    except OSError:
+        pass
 
 
 class PlatformDetector:
@@ -58,17 +198,22 @@ class PlatformDetector:
     and optimization recommendations for cross-platform applications.
     """
     
-    def __init__(self):
-        """Initialize the platform detector with comprehensive analysis"""
+    def __init__(self, force: bool = False):
+        """
+        Initialize the platform detector with comprehensive analysis
+        
+        Args:
+            force: Probe the hardware even if a cached result exists
+        """
         self._hardware_info: Optional[HardwareInfo] = None
         self._optimization_settings: Dict[str, Any] = {}
         self._detection_complete = False
         self._detection_lock = threading.Lock()
         
         # Perform initial detection
-        self._detect_platform_and_hardware()
+        self._detect_platform_and_hardware(force)
     
-    def _detect_platform_and_hardware(self) -> None:
+    def _detect_platform_and_hardware(self, force: bool = False) -> None:
         """
         Perform comprehensive platform and hardware detection
         
@@ -77,9 +222,21 @@ class PlatformDetector:
         - CPU architecture and capabilities
         - Memory availability
         - Performance characteristics
+        
+        A result cached by a previous run on the same machine is reused
+        unless force is set.
         """
         try:
-            print("🔍 [PLATFORM] Starting comprehensive platform detection...")
+            logger.debug("Starting platform detection")
+            
+            cache_key = _cache_key()
+            cached = None if force else _load_cached_hardware(cache_key)
+            if cached is not None:
+                self._hardware_info = cached
+                self._generate_optimization_settings()
+                self._detection_complete = True
+                logger.debug("Loaded cached platform detection from %s", _CACHE_FILE)
+                return
             
             # Detect platform
             system = platform.system().lower()
@@ -92,7 +249,7 @@ class PlatformDetector:
             else:
                 platform_type = PlatformType.UNKNOWN
             
-            print(f"📱 [PLATFORM] Detected platform: {platform_type.value}")
+            logger.debug("Detected platform: %s", platform_type.value)
             
             # Detect architecture
             machine = platform.machine().lower()
@@ -105,31 +262,29 @@ class PlatformDetector:
             else:
                 architecture = ArchitectureType.UNKNOWN
             
-            print(f"🔧 [PLATFORM] Detected architecture: {architecture.value}")
+            logger.debug("Detected architecture: %s", architecture.value)
             
             # Get CPU information
             cpu_count = psutil.cpu_count(logical=True)
-            cpu_freq = psutil.cpu_freq()
-            cpu_frequency = cpu_freq.current if cpu_freq else 0.0
+            cpu_frequency = _cpu_frequency()
             
-            print(f"🖥️ [PLATFORM] CPU cores: {cpu_count}, Frequency: {cpu_frequency:.2f} MHz")
+            logger.debug("CPU cores: %d, Frequency: %.2f MHz", cpu_count, cpu_frequency)
+            
+            simd_level = _simd_level()
+            logger.debug("SIMD level: %s", simd_level)
             
             # Get memory information
             memory = psutil.virtual_memory()
             memory_total = memory.total
             memory_available = memory.available
             
-            print(f"💾 [PLATFORM] Total memory: {memory_total // (1024**3):.1f} GB")
-            print(f"💾 [PLATFORM] Available memory: {memory_available // (1024**3):.1f} GB")
+            logger.debug("Total memory: %.1f GB, Available memory: %.1f GB",
+                         memory_total // (1024**3), memory_available // (1024**3))
             
             # Determine if this is a high-performance system
-            is_high_performance = (
-                cpu_count >= 4 and 
-                cpu_frequency >= 2000.0 and 
-                memory_total >= 8 * (1024**3)  # 8 GB
-            )
+            is_high_performance = _is_high_performance(cpu_count, cpu_frequency, memory_total)
             
-            print(f"⚡ [PLATFORM] High performance system: {is_high_performance}")
+            logger.debug("High performance system: %s", is_high_performance)
             
             # Create hardware info object
             self._hardware_info = HardwareInfo(
@@ -139,17 +294,20 @@ class PlatformDetector:
                 memory_available=memory_available,
                 architecture=architecture,
                 platform=platform_type,
-                is_high_performance=is_high_performance
+                is_high_performance=is_high_performance,
+                simd_level=simd_level
             )
             
+            _store_cached_hardware(cache_key, self._hardware_info)
+            
             # Generate optimization settings
             self._generate_optimization_settings()
             
             self._detection_complete = True
-            print("✅ [PLATFORM] Platform detection completed successfully!")
+            logger.debug("Platform detection completed")
             
         except Exception as e:
-            print(f"❌ [PLATFORM] Error during platform detection: {e}")
+            logger.error("Error during platform detection: %s", e)
             # Fallback to basic detection
             self._hardware_info = HardwareInfo(
                 cpu_count=1,
@@ -193,7 +351,7 @@ class PlatformDetector:
                 "input_driver": "directinput",
                 "window_flags": ["HIDDEN", "RESIZABLE", "DOUBLEBUF"]
             })
-            print("🪟 [OPTIMIZATION] Applied Windows-specific optimizations")
+            logger.debug("Applied Windows-specific optimizations")
             
         elif self._hardware_info.platform == PlatformType.LINUX:
             settings.update({
@@ -202,7 +360,7 @@ class PlatformDetector:
                 "input_driver": "x11",
                 "window_flags": ["HIDDEN", "RESIZABLE", "DOUBLEBUF"]
             })
-            print("🐧 [OPTIMIZATION] Applied Linux-specific optimizations")
+            logger.debug("Applied Linux-specific optimizations")
             
         elif self._hardware_info.platform == PlatformType.MACOS:
             settings.update({
@@ -211,7 +369,7 @@ class PlatformDetector:
                 "input_driver": "cocoa",
                 "window_flags": ["HIDDEN", "RESIZABLE", "DOUBLEBUF", "OPENGL"]
             })
-            print("🍎 [OPTIMIZATION] Applied macOS-specific optimizations")
+            logger.debug("Applied macOS-specific optimizations")
         
         # Hardware-specific optimizations
         if self._hardware_info.is_high_performance:
@@ -222,7 +380,7 @@ class PlatformDetector:
                 "audio_quality": "ultra",
                 "multithreading": True
             })
-            print("🚀 [OPTIMIZATION] Applied high-performance optimizations")
+            logger.debug("Applied high-performance optimizations")
         else:
             settings.update({
                 "target_fps": 30,
@@ -231,7 +389,7 @@ class PlatformDetector:
                 "audio_quality": "medium",
                 "multithreading": False
             })
-            print("⚙️ [OPTIMIZATION] Applied performance-balanced optimizations")
+            logger.debug("Applied performance-balanced optimizations")
         
         # Architecture-specific optimizations
         if self._hardware_info.architecture == ArchitectureType.ARM64:
@@ -240,7 +398,7 @@ class PlatformDetector:
                 "hardware_acceleration": False,  # Some ARM systems have issues
                 "particle_count": int(settings["particle_count"] * 0.8)
             })
-            print("🔧 [OPTIMIZATION] Applied ARM64-specific optimizations")
+            logger.debug("Applied ARM64-specific optimizations")
         
         self._optimization_settings = settings
     
@@ -272,7 +430,8 @@ class PlatformDetector:
             f"CPU Cores: {info.cpu_count}\n"
             f"CPU Frequency: {info.cpu_frequency:.1f} MHz\n"
             f"Memory: {info.memory_total // (1024**3):.1f} GB\n"
-            f"High Performance: {info.is_high_performance}"
+            f"High Performance: {info.is_high_performance}\n"
+            f"SIMD: {info.simd_level}"
         )
     
     def is_detection_complete(self) -> bool:
@@ -280,16 +439,10 @@ class PlatformDetector:
         return self._detection_complete
 
 
-# Global platform detector instance
-_platform_detector: Optional[PlatformDetector] = None
-
-
+@functools.cache
 def get_platform_detector() -> PlatformDetector:
-    """Get the global platform detector instance"""
-    global _platform_detector
-    if _platform_detector is None:
-        _platform_detector = PlatformDetector()
-    return _platform_detector
+    """Get the global platform detector instance, created on first use"""
+    return PlatformDetector()
 
 
 def get_optimization_settings() -> Dict[str, Any]:
@@ -309,6 +462,7 @@ def get_platform_summary() -> str:
 
 if __name__ == "__main__":
     # Test the platform detector
+    logging.basicConfig(level=logging.DEBUG, format="%(name)s: %(message)s")
     print("🧪 Testing Platform Detector...")
     detector = PlatformDetector()
     print("\n" + "="*50)
@@ -12,29 +12,139 @@ Version: 1.0.0
 
 import colorsys
 import random
+import re
+from functools import lru_cache
+import numpy as np
 from typing import Tuple, List, Optional, Union
 from dataclasses import dataclass
-
-
-@dataclass
+from types import MappingProxyType
+
+try:
+    from .jit import njit
+except ImportError:
+    # Fallback for direct script execution
+    from jit import njit
+
+
+# Off the per-frame path, so compiled lazily on first use rather than at import
+@njit(cache=True)
+def _blend_kernel(r1, g1, b1, a1, r2, g2, b2, a2, factor):
+    """Linearly interpolate two RGBA colors, truncating like int()"""
+    inv = 1 - factor
+    return (int(r1 * inv + r2 * factor), int(g1 * inv + g2 * factor),
+            int(b1 * inv + b2 * factor), int(a1 * inv + a2 * factor))
+
+
+@njit(cache=True)
+def _rotate_hue_kernel(r, g, b, angle):
+    """Rotate the hue of an RGB color, matching colorsys round trips"""
+    rf, gf, bf = r / 255.0, g / 255.0, b / 255.0
+    maxc = max(rf, gf, bf)
+    minc = min(rf, gf, bf)
+    v = maxc
+    if minc == maxc:
+        # Grays have no hue; colorsys gives (0, 0, v) both ways
+        return (int(v * 255), int(v * 255), int(v * 255))
+    rangec = maxc - minc
+    s = rangec / maxc
+    rc = (maxc - rf) / rangec
+    gc = (maxc - gf) / rangec
+    bc = (maxc - bf) / rangec
+    if rf == maxc:
+        h = bc - gc
+    elif gf == maxc:
+        h = 2.0 + rc - bc
+    else:
+        h = 4.0 + gc - rc
+    h = ((h / 6.0) % 1.0 + angle) % 1.0
+    
+    i = int(h * 6.0)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+    if i == 0:
+        rf, gf, bf = v, t, p
+    elif i == 1:
+        rf, gf, bf = q, v, p
+    elif i == 2:
+        rf, gf, bf = p, v, t
+    elif i == 3:
+        rf, gf, bf = p, q, v
+    elif i == 4:
+        rf, gf, bf = t, p, v
+    else:
+        rf, gf, bf = v, p, q
+    return (int(rf * 255), int(gf * 255), int(bf * 255))
+
+
+def _clip01(value: float) -> float:
+    """Clamp a factor to 0.0-1.0 with comparisons instead of min()/max() calls"""
+    if value < 0.0:
+        return 0.0
+    if value > 1.0:
+        return 1.0
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _rgb_to_hsv(r: int, g: int, b: int) -> Tuple[float, float, float]:
+    """Convert RGB components to HSV, cached since palettes reuse base colors"""
+    return colorsys.rgb_to_hsv(r / 255.0, g / 255.0, b / 255.0)
+
+
+# Stores fields on frozen Color instances
+_set_field = object.__setattr__
+
+
+@dataclass(slots=True, frozen=True, init=False)
 class Color:
     """
     Color class with RGB components
     
     This class provides color manipulation and conversion capabilities
-    with support for RGB, HSV, and HSL color spaces.
+    with support for RGB, HSV, and HSL color spaces. Colors are immutable
+    and hashable, so instances can be shared and used as dict keys.
     """
     r: int
     g: int
     b: int
     a: int = 255
     
-    def __post_init__(self):
-        """Validate color components after initialization"""
-        self.r = max(0, min(255, int(self.r)))
-        self.g = max(0, min(255, int(self.g)))
-        self.b = max(0, min(255, int(self.b)))
-        self.a = max(0, min(255, int(self.a)))
+    def __init__(self, r: int, g: int, b: int, a: int = 255):
+        """Create a color, clamping components to 0-255"""
+        # Components that are already in-range ints need no conversion
+        if not (type(r) is int and type(g) is int and type(b) is int and type(a) is int
+                and 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255 and 0 <= a <= 255):
+            r = max(0, min(255, int(r)))
+            g = max(0, min(255, int(g)))
+            b = max(0, min(255, int(b)))
+            a = max(0, min(255, int(a)))
+        _set_field(self, 'r', r)
+        _set_field(self, 'g', g)
+        _set_field(self, 'b', b)
+        _set_field(self, 'a', a)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def intern(r: int, g: int, b: int, a: int = 255) -> 'Color':
+        """Get a shared color instance, for hot spots that keep recreating the same colors"""
+        return Color(r, g, b, a)
+    
+    @classmethod
+    def from_rgba_array(cls, components: np.ndarray) -> List['Color']:
+        """
+        Create colors from an array of components, clamped in one pass
+        
+        Args:
+            components: (N, 3) RGB or (N, 4) RGBA array
+            
+        Returns:
+            List of N colors (alpha defaults to 255 for RGB input)
+        """
+        components = np.clip(np.asarray(components), 0, 255).astype(np.int64)
+        return [cls(*row) for row in components.tolist()]
     
     def to_tuple(self) -> Tuple[int, int, int, int]:
         """Convert to RGBA tuple"""
@@ -44,6 +154,15 @@ class Color:
         """Convert to RGB tuple"""
         return (self.r, self.g, self.b)
     
+    def pack32(self) -> int:
+        """Pack into a single 0xAARRGGBB integer"""
+        return (self.a << 24) | (self.r << 16) | (self.g << 8) | self.b
+    
+    @classmethod
+    def unpack32(cls, value: int) -> 'Color':
+        """Create a color from a packed 0xAARRGGBB integer"""
+        return cls((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF, (value >> 24) & 0xFF)
+    
     def to_hex(self) -> str:
         """Convert to hexadecimal string"""
         return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
@@ -54,8 +173,7 @@ class Color:
     
     def to_hsv(self) -> Tuple[float, float, float]:
         """Convert to HSV tuple"""
-        h, s, v = colorsys.rgb_to_hsv(self.r / 255.0, self.g / 255.0, self.b / 255.0)
-        return (h, s, v)
+        return _rgb_to_hsv(self.r, self.g, self.b)
     
     def to_hsl(self) -> Tuple[float, float, float]:
         """Convert to HSL tuple"""
@@ -76,31 +194,29 @@ class Color:
     
     def contrast_color(self) -> 'Color':
         """Get contrasting color (black or white)"""
-        return Color(0, 0, 0) if self.is_light() else Color(255, 255, 255)
+        return _BLACK if self.is_light() else _WHITE
     
     def blend(self, other: 'Color', factor: float = 0.5) -> 'Color':
         """Blend with another color"""
-        factor = max(0.0, min(1.0, factor))
-        r = int(self.r * (1 - factor) + other.r * factor)
-        g = int(self.g * (1 - factor) + other.g * factor)
-        b = int(self.b * (1 - factor) + other.b * factor)
-        a = int(self.a * (1 - factor) + other.a * factor)
-        return Color(r, g, b, a)
+        factor = float(_clip01(factor))
+        return Color(*_blend_kernel(self.r, self.g, self.b, self.a,
+                                    other.r, other.g, other.b, other.a, factor))
     
     def darken(self, factor: float = 0.2) -> 'Color':
         """Darken the color"""
-        factor = max(0.0, min(1.0, factor))
-        r = int(self.r * (1 - factor))
-        g = int(self.g * (1 - factor))
-        b = int(self.b * (1 - factor))
-        return Color(r, g, b, self.a)
+        factor = _clip01(factor)
+        # 8.8 fixed point: keep 256 - weight parts of each channel
+        keep = 256 - int(factor * 256 + 0.5)
+        return Color((self.r * keep) >> 8, (self.g * keep) >> 8, (self.b * keep) >> 8, self.a)
     
     def lighten(self, factor: float = 0.2) -> 'Color':
         """Lighten the color"""
-        factor = max(0.0, min(1.0, factor))
-        r = int(self.r + (255 - self.r) * factor)
-        g = int(self.g + (255 - self.g) * factor)
-        b = int(self.b + (255 - self.b) * factor)
+        factor = _clip01(factor)
+        # 8.8 fixed point: move weight/256 of the way towards white
+        weight = int(factor * 256 + 0.5)
+        r = self.r + (((255 - self.r) * weight) >> 8)
+        g = self.g + (((255 - self.g) * weight) >> 8)
+        b = self.b + (((255 - self.b) * weight) >> 8)
         return Color(r, g, b, self.a)
     
     def saturate(self, factor: float = 0.2) -> 'Color':
@@ -119,10 +235,8 @@ class Color:
     
     def rotate_hue(self, angle: float) -> 'Color':
         """Rotate hue by angle (0.0 to 1.0)"""
-        h, s, v = self.to_hsv()
-        h = (h + angle) % 1.0
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        return Color(int(r * 255), int(g * 255), int(b * 255), self.a)
+        r, g, b = _rotate_hue_kernel(self.r, self.g, self.b, float(angle))
+        return Color(r, g, b, self.a)
     
     def __str__(self) -> str:
         return f"Color({self.r}, {self.g}, {self.b}, {self.a})"
@@ -131,6 +245,15 @@ class Color:
         return self.__str__() # Explain __str__: This is a special method in Python that is used to define the string representation of an object. It is called when the object is converted to a string, such as when it is printed or used in a string concatenation.
 
 
+# Shared instances of the most common colors
+_BLACK = Color(0, 0, 0)
+_WHITE = Color(255, 255, 255)
+
+
+# Plain hex digits, as accepted by hex_to_rgb
+_HEX_DIGITS = re.compile(r'[0-9a-fA-F]+')
+
+
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
     """
     Convert hexadecimal color to RGB tuple
@@ -142,8 +265,15 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
         RGB tuple
     """
     hex_color = hex_color.lstrip('#')
-    if len(hex_color) == 3:
-        hex_color = ''.join([c * 2 for c in hex_color])
+    # Parse the digits once and pick the channels out with shifts. int() also
+    # takes signs, underscores and whitespace, so check for plain digits first.
+    if len(hex_color) in (3, 6):
+        if not _HEX_DIGITS.fullmatch(hex_color):
+            raise ValueError(f"Invalid hex color: {hex_color!r}")
+        value = int(hex_color, 16)
+        if len(hex_color) == 6:
+            return ((value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF)
+        return (((value >> 8) & 0xF) * 0x11, ((value >> 4) & 0xF) * 0x11, (value & 0xF) * 0x11)
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 
@@ -162,6 +292,71 @@ def rgb_to_hex(r: int, g: int, b: int) -> str:
     return f"#{r:02x}{g:02x}{b:02x}"
 
 
+# Which of (v, t, p, q) supplies R, G and B in each of the six hue sectors
+_HSV_SECTORS = np.array([
+    [0, 1, 2],
+    [3, 0, 2],
+    [2, 0, 1],
+    [2, 3, 0],
+    [1, 2, 0],
+    [0, 2, 3],
+])
+
+
+def pack32_array(components: np.ndarray) -> np.ndarray:
+    """
+    Pack an array of RGBA components into 0xAARRGGBB integers
+    
+    Args:
+        components: (N, 4) RGBA array with values in 0-255
+        
+    Returns:
+        (N,) uint32 array, the bulk counterpart of Color.pack32
+    """
+    rgba = np.asarray(components).astype(np.uint32)
+    # Shifts rather than viewing the bytes, which would give the host's
+    # byte order (0xAABBGGRR on little-endian machines)
+    return (rgba[:, 3] << 24) | (rgba[:, 0] << 16) | (rgba[:, 1] << 8) | rgba[:, 2]
+
+
+def _store_components(values: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+    """Truncate float components to uint8, into out when one is given"""
+    if out is None:
+        return values.astype(np.uint8)
+    np.copyto(out, values, casting='unsafe')
+    return out
+
+
+def hsv_to_rgb_array(h: np.ndarray, s: Union[float, np.ndarray],
+                     v: Union[float, np.ndarray],
+                     out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert an array of HSV values to RGB components
+    
+    Args:
+        h: Hues (0.0 to 1.0)
+        s: Saturation(s) (0.0 to 1.0), broadcast against h
+        v: Value(s) (0.0 to 1.0), broadcast against h
+        out: Optional (N, 3) array to write the components into
+        
+    Returns:
+        (N, 3) uint8 array of RGB components (out if given), matching
+        colorsys.hsv_to_rgb
+    """
+    h6 = np.asarray(h, dtype=np.float64) * 6.0
+    sector = h6.astype(np.int64)
+    f = h6 - sector
+    s = np.broadcast_to(np.asarray(s, dtype=np.float64), h6.shape)
+    v = np.broadcast_to(np.asarray(v, dtype=np.float64), h6.shape)
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    components = np.stack((v, t, p, q))
+    rgb = components[_HSV_SECTORS[sector % 6], np.arange(h6.size)[:, None]]
+    rgb *= 255
+    return _store_components(rgb, out)
+
+
 def blend_colors(color1: Color, color2: Color, factor: float = 0.5) -> Color:
     """
     Blend two colors
@@ -174,7 +369,30 @@ def blend_colors(color1: Color, color2: Color, factor: float = 0.5) -> Color:
     Returns:
         Blended color
     """
-    return color1.blend(color2, factor)
+    # Same as color1.blend(color2, factor), without the extra method frame
+    factor = float(_clip01(factor))
+    return Color(*_blend_kernel(color1.r, color1.g, color1.b, color1.a,
+                                color2.r, color2.g, color2.b, color2.a, factor))
+
+
+# Saturation and value ranges of the random_*_color styles
+_RANDOM_STYLES = {
+    'bright': ((0.5, 1.0), (0.7, 1.0)),
+    'pastel': ((0.2, 0.5), (0.8, 1.0)),
+    'dark': ((0.3, 0.8), (0.1, 0.4)),
+}
+
+_rng = np.random.default_rng()
+
+
+def _random_styled_color(style: str) -> Color:
+    """Generate one random color with a style's saturation and value ranges"""
+    (s_min, s_max), (v_min, v_max) = _RANDOM_STYLES[style]
+    h = random.random()
+    s = random.uniform(s_min, s_max)
+    v = random.uniform(v_min, v_max)
+    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    return Color(int(r * 255), int(g * 255), int(b * 255))
 
 
 def random_color() -> Color:
@@ -188,29 +406,44 @@ def random_color() -> Color:
 
 def random_bright_color() -> Color:
     """Generate a random bright color"""
-    h = random.random()
-    s = random.uniform(0.5, 1.0)
-    v = random.uniform(0.7, 1.0)
-    r, g, b = colorsys.hsv_to_rgb(h, s, v)
-    return Color(int(r * 255), int(g * 255), int(b * 255))
+    return _random_styled_color('bright')
 
 
 def random_pastel_color() -> Color:
     """Generate a random pastel color"""
-    h = random.random()
-    s = random.uniform(0.2, 0.5)
-    v = random.uniform(0.8, 1.0)
-    r, g, b = colorsys.hsv_to_rgb(h, s, v)
-    return Color(int(r * 255), int(g * 255), int(b * 255))
+    return _random_styled_color('pastel')
 
 
 def random_dark_color() -> Color:
     """Generate a random dark color"""
-    h = random.random()
-    s = random.uniform(0.3, 0.8)
-    v = random.uniform(0.1, 0.4)
-    r, g, b = colorsys.hsv_to_rgb(h, s, v)
-    return Color(int(r * 255), int(g * 255), int(b * 255))
+    return _random_styled_color('dark')
+
+
+def random_colors(count: int, style: str = 'bright',
+                  rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Generate many random colors at once
+    
+    Args:
+        count: Number of colors to generate
+        style: 'bright', 'pastel' or 'dark' (as the random_*_color
+            functions), or 'any' for uniform RGB like random_color
+        rng: NumPy generator to draw from (defaults to a module-level one)
+        
+    Returns:
+        (count, 3) uint8 array of RGB components
+    """
+    rng = _rng if rng is None else rng
+    if style == 'any':
+        return rng.integers(0, 256, size=(count, 3), dtype=np.uint8)
+    try:
+        (s_min, s_max), (v_min, v_max) = _RANDOM_STYLES[style]
+    except KeyError:
+        raise ValueError(f"Unknown color style: {style!r}") from None
+    h = rng.random(count)
+    s = rng.uniform(s_min, s_max, count)
+    v = rng.uniform(v_min, v_max, count)
+    return hsv_to_rgb_array(h, s, v)
 
 
 def color_gradient(color1: Color, color2: Color, steps: int) -> List[Color]:
@@ -225,11 +458,31 @@ def color_gradient(color1: Color, color2: Color, steps: int) -> List[Color]:
     Returns:
         List of colors forming the gradient
     """
-    colors = []
-    for i in range(steps):
-        factor = i / (steps - 1) if steps > 1 else 0
-        colors.append(color1.blend(color2, factor))
-    return colors
+    return Color.from_rgba_array(color_gradient_array(color1, color2, steps))
+
+
+def color_gradient_array(color1: Color, color2: Color, steps: int,
+                         out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Generate a gradient between two colors as an array
+    
+    Args:
+        color1: Start color
+        color2: End color
+        steps: Number of steps in gradient
+        out: Optional (steps, 4) array to write the gradient into
+        
+    Returns:
+        (steps, 4) uint8 array of RGBA components (out if given)
+    """
+    factors = np.arange(steps, dtype=np.float64)
+    if steps > 1:
+        factors /= steps - 1
+    factors = factors[:, None]
+    start = np.array(color1.to_tuple(), dtype=np.float64)
+    end = np.array(color2.to_tuple(), dtype=np.float64)
+    # Same lerp as Color.blend, evaluated for every step at once
+    return _store_components(start * (1 - factors) + end * factors, out)
 
 
 def rainbow_colors(steps: int) -> List[Color]:
@@ -242,12 +495,22 @@ def rainbow_colors(steps: int) -> List[Color]:
     Returns:
         List of rainbow colors
     """
-    colors = []
-    for i in range(steps):
-        h = i / steps
-        r, g, b = colorsys.hsv_to_rgb(h, 1.0, 1.0)
-        colors.append(Color(int(r * 255), int(g * 255), int(b * 255)))
-    return colors
+    return Color.from_rgba_array(rainbow_colors_array(steps))
+
+
+def rainbow_colors_array(steps: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Generate rainbow colors as an array
+    
+    Args:
+        steps: Number of colors to generate
+        out: Optional (steps, 3) array to write the colors into
+        
+    Returns:
+        (steps, 3) uint8 array of RGB components (out if given)
+    """
+    hues = np.arange(steps, dtype=np.float64) / steps
+    return hsv_to_rgb_array(hues, 1.0, 1.0, out)
 
 
 def complementary_color(color: Color) -> Color:
@@ -278,16 +541,9 @@ def analogous_colors(color: Color, count: int = 3) -> List[Color]:
         List of analogous colors
     """
     h, s, v = color.to_hsv()
-    colors = []
     step = 0.0833  # 30 degrees in hue space
-    
-    for i in range(count):
-        offset = (i - count // 2) * step
-        new_h = (h + offset) % 1.0
-        r, g, b = colorsys.hsv_to_rgb(new_h, s, v)
-        colors.append(Color(int(r * 255), int(g * 255), int(b * 255)))
-    
-    return colors
+    offsets = (np.arange(count) - count // 2) * step
+    return Color.from_rgba_array(hsv_to_rgb_array((h + offsets) % 1.0, s, v))
 
 
 def triadic_colors(color: Color) -> List[Color]:
@@ -301,14 +557,8 @@ def triadic_colors(color: Color) -> List[Color]:
         List of triadic colors
     """
     h, s, v = color.to_hsv()
-    colors = []
-    
-    for i in range(3):
-        new_h = (h + i * 0.3333) % 1.0
-        r, g, b = colorsys.hsv_to_rgb(new_h, s, v)
-        colors.append(Color(int(r * 255), int(g * 255), int(b * 255)))
-    
-    return colors
+    hues = (h + np.arange(3) * 0.3333) % 1.0
+    return Color.from_rgba_array(hsv_to_rgb_array(hues, s, v))
 
 
 def tetradic_colors(color: Color) -> List[Color]:
@@ -322,14 +572,33 @@ def tetradic_colors(color: Color) -> List[Color]:
         List of tetradic colors
     """
     h, s, v = color.to_hsv()
-    colors = []
-    
-    for i in range(4):
-        new_h = (h + i * 0.25) % 1.0
-        r, g, b = colorsys.hsv_to_rgb(new_h, s, v)
-        colors.append(Color(int(r * 255), int(g * 255), int(b * 255)))
-    
-    return colors
+    hues = (h + np.arange(4) * 0.25) % 1.0
+    return Color.from_rgba_array(hsv_to_rgb_array(hues, s, v))
+
+
+# Built once at import; lookups return these shared instances
+_NAMED_COLORS = MappingProxyType({
+    'red': Color(255, 0, 0),
+    'green': Color(0, 255, 0),
+    'blue': Color(0, 0, 255),
+    'yellow': Color(255, 255, 0),
+    'cyan': Color(0, 255, 255),
+    'magenta': Color(255, 0, 255),
+    'white': _WHITE,
+    'black': _BLACK,
+    'gray': Color(128, 128, 128),
+    'orange': Color(255, 165, 0),
+    'purple': Color(128, 0, 128),
+    'pink': Color(255, 192, 203),
+    'brown': Color(165, 42, 42),
+    'lime': Color(0, 255, 0),
+    'navy': Color(0, 0, 128),
+    'teal': Color(0, 128, 128),
+    'olive': Color(128, 128, 0),
+    'maroon': Color(128, 0, 0),
+    'silver': Color(192, 192, 192),
+    'gold': Color(255, 215, 0)
+})
 
 
 def color_from_name(name: str) -> Optional[Color]:
@@ -342,30 +611,8 @@ def color_from_name(name: str) -> Optional[Color]:
     Returns:
         Color object or None if not found
     """
-    color_map = {
-        'red': Color(255, 0, 0),
-        'green': Color(0, 255, 0),
-        'blue': Color(0, 0, 255),
-        'yellow': Color(255, 255, 0),
-        'cyan': Color(0, 255, 255),
-        'magenta': Color(255, 0, 255),
-        'white': Color(255, 255, 255),
-        'black': Color(0, 0, 0),
-        'gray': Color(128, 128, 128),
-        'orange': Color(255, 165, 0),
-        'purple': Color(128, 0, 128),
-        'pink': Color(255, 192, 203),
-        'brown': Color(165, 42, 42),
-        'lime': Color(0, 255, 0),
-        'navy': Color(0, 0, 128),
-        'teal': Color(0, 128, 128),
-        'olive': Color(128, 128, 0),
-        'maroon': Color(128, 0, 0),
-        'silver': Color(192, 192, 192),
-        'gold': Color(255, 215, 0)
-    }
-    
-    return color_map.get(name.lower())
+    # Lowercase names hit directly without allocating a lowered copy
+    return _NAMED_COLORS.get(name) or _NAMED_COLORS.get(name.lower())
 
 
 def color_distance(color1: Color, color2: Color) -> float:
@@ -385,30 +632,75 @@ def color_distance(color1: Color, color2: Color) -> float:
     return (dr * dr + dg * dg + db * db) ** 0.5
 
 
-def find_closest_color(target: Color, colors: List[Color]) -> Color:
+def perceptual_distance_sq(color1: Color, color2: Color) -> int:
+    """
+    Calculate squared "redmean" perceptual color distance
+    
+    Weights the channels by how sensitive the eye is to them, using only
+    integer arithmetic. Suitable for ordering colors, not as a metric.
+    
+    Args:
+        color1: First color
+        color2: Second color
+        
+    Returns:
+        Weighted squared distance
+    """
+    rmean = (color1.r + color2.r) // 2
+    dr = color1.r - color2.r
+    dg = color1.g - color2.g
+    db = color1.b - color2.b
+    return (((512 + rmean) * dr * dr) >> 8) + 4 * dg * dg + (((767 - rmean) * db * db) >> 8)
+
+
+def color_distances_sq(target: Color, palette: np.ndarray) -> np.ndarray:
+    """
+    Calculate squared RGB distances from a color to every palette entry
+    
+    Args:
+        target: Color to measure from
+        palette: (N, 3) RGB array, e.g. from palette_array()
+        
+    Returns:
+        (N,) int32 array of squared distances
+    """
+    diff = palette.astype(np.int32, copy=False) - np.array((target.r, target.g, target.b), dtype=np.int32)
+    return np.einsum('ij,ij->i', diff, diff)
+
+
+def palette_array(colors: List[Color]) -> np.ndarray:
+    """
+    Pack colors into an (N, 3) int32 RGB array for find_closest_color
+    
+    Args:
+        colors: List of colors
+        
+    Returns:
+        Array of RGB components, one row per color
+    """
+    return np.array([(c.r, c.g, c.b) for c in colors], dtype=np.int32).reshape(-1, 3)
+
+
+def find_closest_color(target: Color, colors: List[Color],
+                       palette: Optional[np.ndarray] = None) -> Color:
     """
     Find the closest color from a list
     
     Args:
         target: Target color
         colors: List of colors to search
+        palette: palette_array(colors), for callers searching the same list repeatedly
         
     Returns:
-        Closest color
+        Closest color (the first one on ties)
     """
     if not colors:
         return target
     
-    closest = colors[0]
-    min_distance = color_distance(target, closest)
-    
-    for color in colors[1:]:
-        distance = color_distance(target, color)
-        if distance < min_distance:
-            min_distance = distance
-            closest = color
-    
-    return closest
+    if palette is None:
+        palette = palette_array(colors)
+    # Squared distance orders candidates the same as color_distance
+    return colors[int(color_distances_sq(target, palette).argmin())]
 
 
 if __name__ == "__main__":
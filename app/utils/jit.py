@@ -0,0 +1,60 @@
+"""
+JIT Compilation Helpers
+======================
+
+This module wraps the optional Numba dependency for the Cursor IDE demo
+application. When Numba is installed its decorators are re-exported;
+otherwise they become no-ops and callers fall back to their NumPy paths.
+
+Author: Cursor IDE Demo
+Version: 1.0.0
+"""
+
+from typing import Any, Callable
+
+try:
+    from numba import njit as _numba_njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+
+def _namespace_cache(func: Callable) -> Callable:
+    """
+    Make a function's on-disk cache entry specific to its import name
+
+    Numba names cache files after the source file and qualname only, but a
+    cached entry re-imports the module it was compiled in. Modules here are
+    imported both as 'utils.x' and 'app.utils.x', so without this the cache
+    written by one layout breaks loading under the other.
+    """
+    prefix = f"{func.__module__}."
+    if not func.__qualname__.startswith(prefix):
+        func.__qualname__ = prefix + func.__qualname__
+    return func
+
+
+if NUMBA_AVAILABLE:
+    def njit(*args: Any, **kwargs: Any) -> Callable:
+        """numba.njit with per-import-name caching when cache=True"""
+        if not kwargs.get('cache'):
+            return _numba_njit(*args, **kwargs)
+        if args and callable(args[0]):
+            return _numba_njit(_namespace_cache(args[0]), *args[1:], **kwargs)
+
+        def decorator(func: Callable) -> Callable:
+            return _numba_njit(*args, **kwargs)(_namespace_cache(func))
+        return decorator
+else:
+    def njit(*args: Any, **kwargs: Any) -> Callable:
+        """Fallback for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable) -> Callable:
+            return func
+        return decorator
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
@@ -10,17 +10,46 @@ Author: Cursor IDE Demo
 Version: 1.0.0
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Callable, Optional, Dict, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
 
 
-class ColoredFormatter(logging.Formatter):
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that renders each second's timestamp only once
+    
+    With an explicit datefmt the timestamp has one-second resolution, so
+    consecutive records in the same second reuse the last strftime result.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._last_time = (None, None, '')
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record time, reusing the previous result within a second"""
+        if datefmt is None:
+            # The default format includes milliseconds
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        last_second, last_datefmt, text = self._last_time
+        if second != last_second or datefmt != last_datefmt:
+            text = time.strftime(datefmt, self.converter(second))
+            self._last_time = (second, datefmt, text)
+        return text
+
+
+class ColoredFormatter(_CachedTimeFormatter):
     """
     Custom formatter that adds colors to log messages
     
@@ -49,18 +78,84 @@ class ColoredFormatter(logging.Formatter):
         """
         super().__init__(fmt, datefmt)
         self.use_colors = use_colors
+        # Decided once: isatty() is a syscall, too costly to repeat per record
+        self._color_active = bool(use_colors and hasattr(sys.stderr, 'isatty') and sys.stderr.isatty())
+        self._level_colors = {
+            level: f"{color}{level}{self.COLORS['RESET']}"
+            for level, color in self.COLORS.items() if level != 'RESET'
+        }
     
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record with colors"""
         # Add colors if enabled and output is to terminal
-        if self.use_colors and hasattr(sys.stderr, 'isatty') and sys.stderr.isatty():
+        if self._color_active:
             levelname = record.levelname
-            if levelname in self.COLORS:
-                record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+            colored = self._level_colors.get(levelname)
+            if colored is not None:
+                # Restored afterwards so other handlers see the plain name
+                record.levelname = colored
+                try:
+                    return super().format(record)
+                finally:
+                    record.levelname = levelname
         
         return super().format(record)
 
 
+@lru_cache(maxsize=None)
+def _file_handlers(name: str) -> Tuple[logging.Handler, logging.Handler]:
+    """
+    Create the rotating log and error file handlers for a logger name
+    
+    Cached, so the logs directory is created and each file is opened once
+    per name even if a DemoLogger for it is set up again.
+    
+    Args:
+        name: Logger name
+        
+    Returns:
+        Tuple of (file handler, error file handler)
+    """
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+    
+    # File handler with rotation
+    log_file = log_dir / f"{name.lower()}.log"
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file,
+        maxBytes=10*1024*1024,  # 10MB
+        backupCount=5,
+        encoding='utf-8'
+    )
+    file_handler.setLevel(logging.DEBUG)
+    
+    # Error file handler
+    error_file = log_dir / f"{name.lower()}_errors.log"
+    error_handler = logging.handlers.RotatingFileHandler(
+        error_file,
+        maxBytes=5*1024*1024,  # 5MB
+        backupCount=3,
+        encoding='utf-8'
+    )
+    error_handler.setLevel(logging.ERROR)
+    
+    return file_handler, error_handler
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that enqueues records without formatting them
+    
+    The stock QueueHandler merges the message and arguments in the logging
+    thread so records can be pickled. The queue here never leaves the
+    process, so the %-formatting is left to the listener thread's handlers.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through unchanged"""
+        return record
+
+
 class DemoLogger:
     """
     Advanced logging system for the Cursor IDE demo
@@ -98,30 +193,27 @@ class DemoLogger:
         console_handler.setLevel(logging.INFO)
         self.logger.addHandler(console_handler)
         
-        # File handler with rotation
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
+        file_handler, error_handler = _file_handlers(self.name)
         
-        log_file = log_dir / f"{self.name.lower()}.log"
-        file_handler = logging.handlers.RotatingFileHandler(
-            log_file,
-            maxBytes=10*1024*1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
+        # Batch routine records into one write; errors flush immediately.
+        # The error handler only sees errors, so it is not buffered
+        self._file_buffer = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler
         )
-        file_handler.setLevel(logging.DEBUG)
-        self.logger.addHandler(file_handler)
+        self._file_buffer.setLevel(logging.DEBUG)
         
-        # Error file handler
-        error_file = log_dir / f"{self.name.lower()}_errors.log"
-        error_handler = logging.handlers.RotatingFileHandler(
-            error_file,
-            maxBytes=5*1024*1024,  # 5MB
-            backupCount=3,
-            encoding='utf-8'
+        # File writes happen on a listener thread; logging calls only enqueue
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(_InProcessQueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, self._file_buffer, error_handler, respect_handler_level=True
         )
-        error_handler.setLevel(logging.ERROR)
-        self.logger.addHandler(error_handler)
+        self._listener.start()
+        
+        # Bound how long buffered records wait to reach the file
+        self._flush_stop = threading.Event()
+        threading.Thread(target=self._flush_periodically, name=f"{self.name}-log-flush", daemon=True).start()
+        atexit.register(self._stop_file_logging)
         
         self.handlers = {
             'console': console_handler,
@@ -129,6 +221,17 @@ class DemoLogger:
             'error': error_handler
         }
     
+    def _flush_periodically(self, interval: float = 1.0) -> None:
+        """Flush the file buffer every interval seconds until stopped"""
+        while not self._flush_stop.wait(interval):
+            self._file_buffer.flush()
+    
+    def _stop_file_logging(self) -> None:
+        """Drain queued records and flush the file buffer at exit"""
+        self._listener.stop()
+        self._flush_stop.set()
+        self._file_buffer.flush()
+    
     def _setup_formatters(self) -> None:
         """Set up log formatters"""
         # Console formatter with colors
@@ -148,7 +251,7 @@ class DemoLogger:
             "%(asctime)s | %(levelname)-8s | %(name)s | "
             "%(filename)s:%(lineno)d | %(funcName)s | %(message)s"
         )
-        file_formatter = logging.Formatter(
+        file_formatter = _CachedTimeFormatter(
             file_format,
             datefmt='%Y-%m-%d %H:%M:%S'
         )
@@ -157,38 +260,64 @@ class DemoLogger:
     
     def debug(self, message: str, **kwargs: Any) -> None:
         """Log debug message"""
-        self.logger.debug(message, extra=kwargs)
+        if kwargs:
+            self.logger.debug(message, extra=kwargs)
+        else:
+            self.logger.debug(message)
     
     def info(self, message: str, **kwargs: Any) -> None:
         """Log info message"""
-        self.logger.info(message, extra=kwargs)
+        if kwargs:
+            self.logger.info(message, extra=kwargs)
+        else:
+            self.logger.info(message)
     
     def warning(self, message: str, **kwargs: Any) -> None:
         """Log warning message"""
-        self.logger.warning(message, extra=kwargs)
+        if kwargs:
+            self.logger.warning(message, extra=kwargs)
+        else:
+            self.logger.warning(message)
     
     def error(self, message: str, **kwargs: Any) -> None:
         """Log error message"""
-        self.logger.error(message, extra=kwargs)
+        if kwargs:
+            self.logger.error(message, extra=kwargs)
+        else:
+            self.logger.error(message)
     
     def critical(self, message: str, **kwargs: Any) -> None:
         """Log critical message"""
-        self.logger.critical(message, extra=kwargs)
+        if kwargs:
+            self.logger.critical(message, extra=kwargs)
+        else:
+            self.logger.critical(message)
     
     def performance(self, operation: str, duration: float, **kwargs: Any) -> None:
         """Log performance information"""
-        message = f"PERFORMANCE | {operation} | {duration:.3f}s"
-        self.logger.info(message, extra=kwargs)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        # Formatted by logging only if the record is emitted
+        if kwargs:
+            self.logger.info("PERFORMANCE | %s | %.3fs", operation, duration, extra=kwargs)
+        else:
+            self.logger.info("PERFORMANCE | %s | %.3fs", operation, duration)
     
     def platform_info(self, info: Dict[str, Any]) -> None:
         """Log platform information"""
-        message = f"PLATFORM | {info}"
-        self.logger.info(message)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        # The info dict is only stringified if the record is emitted
+        self.logger.info("PLATFORM | %s", info)
     
     def demo_event(self, event: str, **kwargs: Any) -> None:
         """Log demo-specific events"""
-        message = f"DEMO | {event}"
-        self.logger.info(message, extra=kwargs)
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if kwargs:
+            self.logger.info("DEMO | %s", event, extra=kwargs)
+        else:
+            self.logger.info("DEMO | %s", event)
 
 
 # Global logger instance
@@ -244,6 +373,21 @@ def get_logger(name: str = "CursorDemo") -> DemoLogger:
     return _logger
 
 
+# Bound methods of the global stdlib logger, resolved on first use so the
+# log_* helpers below skip the DemoLogger layer on every call
+_log_info: Optional[Callable[..., None]] = None
+_is_enabled_for: Optional[Callable[[int], bool]] = None
+
+
+def _bind_info_methods() -> None:
+    """Cache the global logger's info and isEnabledFor bound methods"""
+    global _log_info, _is_enabled_for
+    
+    stdlib_logger = get_logger().logger
+    _log_info = stdlib_logger.info
+    _is_enabled_for = stdlib_logger.isEnabledFor
+
+
 def log_performance(operation: str, duration: float) -> None:
     """
     Log performance information
@@ -252,8 +396,10 @@ def log_performance(operation: str, duration: float) -> None:
         operation: Operation name
         duration: Duration in seconds
     """
-    logger = get_logger()
-    logger.performance(operation, duration)
+    if _log_info is None:
+        _bind_info_methods()
+    if _is_enabled_for(logging.INFO):
+        _log_info("PERFORMANCE | %s | %.3fs", operation, duration)
 
 
 def log_platform_info(info: Dict[str, Any]) -> None:
@@ -263,8 +409,10 @@ def log_platform_info(info: Dict[str, Any]) -> None:
     Args:
         info: Platform information dictionary
     """
-    logger = get_logger()
-    logger.platform_info(info)
+    if _log_info is None:
+        _bind_info_methods()
+    if _is_enabled_for(logging.INFO):
+        _log_info("PLATFORM | %s", info)
 
 
 def log_demo_event(event: str, **kwargs: Any) -> None:
@@ -275,8 +423,14 @@ def log_demo_event(event: str, **kwargs: Any) -> None:
         event: Event description
         **kwargs: Additional event data
     """
-    logger = get_logger()
-    logger.demo_event(event, **kwargs)
+    if _log_info is None:
+        _bind_info_methods()
+    if not _is_enabled_for(logging.INFO):
+        return
+    if kwargs:
+        _log_info("DEMO | %s", event, extra=kwargs)
+    else:
+        _log_info("DEMO | %s", event)
 
 
 if __name__ == "__main__":
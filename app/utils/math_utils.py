@@ -11,9 +11,16 @@ Version: 1.0.0
 
 import math
 import random
-from typing import Tuple, List, Union, Optional
+import threading
+from typing import Callable, Tuple, List, Union, Optional
 import numpy as np
 
+try:
+    from .jit import njit, prange, NUMBA_AVAILABLE
+except ImportError:
+    # Fallback for direct script execution
+    from jit import njit, prange, NUMBA_AVAILABLE
+
 
 def clamp(value: float, min_val: float, max_val: float) -> float:
     """
@@ -30,6 +37,18 @@ def clamp(value: float, min_val: float, max_val: float) -> float:
     return max(min_val, min(value, max_val))
 
 
+@njit('float64(float64, float64, float64)', cache=True)
+def _clamp(value, min_val, max_val):
+    """Float64 clamp kernel behind lerp and ease_in_out"""
+    return max(min_val, min(value, max_val))
+
+
+def _clamp01(t: float) -> float:
+    """Clamp to 0.0-1.0 for the pure-Python helpers, without a JIT dispatch"""
+    return 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+
+
+@njit('float64(float64, float64, float64)', cache=True, fastmath=True)
 def lerp(start: float, end: float, t: float) -> float:
     """
     Linear interpolation between two values
@@ -42,7 +61,7 @@ def lerp(start: float, end: float, t: float) -> float:
     Returns:
         Interpolated value
     """
-    return start + (end - start) * clamp(t, 0.0, 1.0)
+    return start + (end - start) * _clamp(t, 0.0, 1.0)
 
 
 def smooth_step(edge0: float, edge1: float, x: float) -> float:
@@ -57,10 +76,20 @@ def smooth_step(edge0: float, edge1: float, x: float) -> float:
     Returns:
         Smooth step value
     """
-    t = clamp((x - edge0) / (edge1 - edge0), 0.0, 1.0)
+    t = _clamp01((x - edge0) / (edge1 - edge0))
     return t * t * (3.0 - 2.0 * t)
 
 
+class _ThreadRandom(threading.local):
+    """Per-thread random.Random, so threads never share generator state"""
+    
+    def __init__(self):
+        self.rng = random.Random()
+
+
+_thread_random = _ThreadRandom()
+
+
 def random_range(min_val: float, max_val: float) -> float:
     """
     Generate a random float between min and max
@@ -72,7 +101,7 @@ def random_range(min_val: float, max_val: float) -> float:
     Returns:
         Random value
     """
-    return random.uniform(min_val, max_val)
+    return _thread_random.rng.uniform(min_val, max_val)
 
 
 def random_int_range(min_val: int, max_val: int) -> int:
@@ -86,7 +115,7 @@ def random_int_range(min_val: int, max_val: int) -> int:
     Returns:
         Random integer
     """
-    return random.randint(min_val, max_val)
+    return _thread_random.rng.randint(min_val, max_val)
 
 
 def random_choice(choices: List) -> any:
@@ -99,7 +128,7 @@ def random_choice(choices: List) -> any:
     Returns:
         Random choice
     """
-    return random.choice(choices)
+    return _thread_random.rng.choice(choices)
 
 
 def random_weighted_choice(choices: List, weights: List[float]) -> any:
@@ -113,7 +142,7 @@ def random_weighted_choice(choices: List, weights: List[float]) -> any:
     Returns:
         Random choice based on weights
     """
-    return random.choices(choices, weights=weights, k=1)[0]
+    return _thread_random.rng.choices(choices, weights=weights, k=1)[0]
 
 
 def distance(point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
@@ -127,9 +156,7 @@ def distance(point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
     Returns:
         Distance between points
     """
-    dx = point2[0] - point1[0]
-    dy = point2[1] - point1[1]
-    return math.sqrt(dx * dx + dy * dy)
+    return math.dist(point1, point2)
 
 
 def distance_squared(point1: Tuple[float, float], point2: Tuple[float, float]) -> float:
@@ -158,7 +185,7 @@ def normalize_vector(vector: Tuple[float, float]) -> Tuple[float, float]:
     Returns:
         Normalized vector
     """
-    length = math.sqrt(vector[0] * vector[0] + vector[1] * vector[1])
+    length = math.hypot(vector[0], vector[1])
     if length == 0:
         return (0, 0)
     return (vector[0] / length, vector[1] / length)
@@ -216,6 +243,94 @@ def rotate_point(point: Tuple[float, float], center: Tuple[float, float], angle:
     return (new_x, new_y)
 
 
+def make_rotator(angle: float) -> Callable[[Tuple[float, float], Tuple[float, float]], Tuple[float, float]]:
+    """
+    Create a rotate_point specialized for a fixed angle
+    
+    The sine and cosine are computed once here instead of on every call.
+    
+    Args:
+        angle: Rotation angle in radians
+        
+    Returns:
+        Function taking (point, center) and returning the rotated point
+    """
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    
+    def rotate(point: Tuple[float, float], center: Tuple[float, float]) -> Tuple[float, float]:
+        dx = point[0] - center[0]
+        dy = point[1] - center[1]
+        return (center[0] + dx * cos_a - dy * sin_a, center[1] + dx * sin_a + dy * cos_a)
+    
+    return rotate
+
+
+def distance_batch(points1: np.ndarray, points2: np.ndarray) -> np.ndarray:
+    """
+    Calculate Euclidean distances between pairs of points
+    
+    Args:
+        points1: (N, 2) array of first points
+        points2: (N, 2) array of second points, or a single (2,) point
+        
+    Returns:
+        (N,) array of distances
+    """
+    d = np.asarray(points2, dtype=np.float64) - np.asarray(points1, dtype=np.float64)
+    return np.hypot(d[..., 0], d[..., 1])
+
+
+def dot_batch(vectors1: np.ndarray, vectors2: np.ndarray) -> np.ndarray:
+    """
+    Calculate dot products of pairs of 2D vectors
+    
+    Args:
+        vectors1: (N, 2) array of first vectors
+        vectors2: (N, 2) array of second vectors
+        
+    Returns:
+        (N,) array of dot products
+    """
+    return np.einsum('ij,ij->i', np.asarray(vectors1, dtype=np.float64),
+                     np.asarray(vectors2, dtype=np.float64))
+
+
+def normalize_batch(vectors: np.ndarray) -> np.ndarray:
+    """
+    Normalize 2D vectors
+    
+    Args:
+        vectors: (N, 2) array of vectors
+        
+    Returns:
+        (N, 2) array of unit vectors; zero vectors stay (0, 0)
+    """
+    vectors = np.asarray(vectors, dtype=np.float64)
+    lengths = np.hypot(vectors[:, 0], vectors[:, 1])[:, None]
+    return np.divide(vectors, lengths, out=np.zeros_like(vectors), where=lengths != 0)
+
+
+def rotate_points(points: np.ndarray, center: Tuple[float, float], angle: float) -> np.ndarray:
+    """
+    Rotate points around a center by an angle
+    
+    Args:
+        points: (N, 2) array of points
+        center: Center of rotation (x, y)
+        angle: Rotation angle in radians
+        
+    Returns:
+        (N, 2) array of rotated points
+    """
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    center = np.asarray(center, dtype=np.float64)
+    d = np.asarray(points, dtype=np.float64) - center
+    return center + np.column_stack((d[:, 0] * cos_a - d[:, 1] * sin_a,
+                                     d[:, 0] * sin_a + d[:, 1] * cos_a))
+
+
 def angle_between_vectors(vector1: Tuple[float, float], vector2: Tuple[float, float]) -> float:
     """
     Calculate angle between two 2D vectors
@@ -244,7 +359,27 @@ def point_in_circle(point: Tuple[float, float], center: Tuple[float, float], rad
     Returns:
         True if point is inside circle
     """
-    return distance_squared(point, center) <= radius * radius
+    return point_in_circle_sq(point, center, radius * radius)
+
+
+def point_in_circle_sq(point: Tuple[float, float], center: Tuple[float, float], radius_sq: float) -> bool:
+    """
+    Check if a point is inside a circle given its squared radius
+    
+    For loops testing many points against one circle, square the radius
+    once outside the loop and call this instead of point_in_circle.
+    
+    Args:
+        point: Point to check (x, y)
+        center: Circle center (x, y)
+        radius_sq: Squared circle radius
+        
+    Returns:
+        True if point is inside circle
+    """
+    dx = point[0] - center[0]
+    dy = point[1] - center[1]
+    return dx * dx + dy * dy <= radius_sq
 
 
 def point_in_rect(point: Tuple[float, float], rect: Tuple[float, float, float, float]) -> bool:
@@ -280,6 +415,27 @@ def circles_intersect(center1: Tuple[float, float], radius1: float,
     return dist <= radius1 + radius2
 
 
+def circles_intersect_sq(center1: Tuple[float, float], center2: Tuple[float, float],
+                         radius_sum_sq: float) -> bool:
+    """
+    Check if two circles intersect given the square of their radius sum
+    
+    Takes no square root; hoist (radius1 + radius2) ** 2 out of loops that
+    reuse the same pair of radii.
+    
+    Args:
+        center1: First circle center (x, y)
+        center2: Second circle center (x, y)
+        radius_sum_sq: Squared sum of the two radii
+        
+    Returns:
+        True if circles intersect
+    """
+    dx = center2[0] - center1[0]
+    dy = center2[1] - center1[1]
+    return dx * dx + dy * dy <= radius_sum_sq
+
+
 def rects_intersect(rect1: Tuple[float, float, float, float],
                    rect2: Tuple[float, float, float, float]) -> bool:
     """
@@ -298,6 +454,70 @@ def rects_intersect(rect1: Tuple[float, float, float, float],
                 rect2[1] + rect2[3] < rect1[1])
 
 
+def point_in_rects(points: np.ndarray, rects: np.ndarray) -> np.ndarray:
+    """
+    Check points against rectangles, as point_in_rect does for one pair
+    
+    Inputs broadcast, so points[:, None] against rects[None] tests every
+    point against every rectangle.
+    
+    Args:
+        points: (..., 2) array of points (x, y)
+        rects: (..., 4) array of rectangles (x, y, width, height)
+        
+    Returns:
+        Boolean array, True where the point is inside the rectangle
+    """
+    points = np.asarray(points)
+    rects = np.asarray(rects)
+    x, y = points[..., 0], points[..., 1]
+    return ((rects[..., 0] <= x) & (x <= rects[..., 0] + rects[..., 2]) &
+            (rects[..., 1] <= y) & (y <= rects[..., 1] + rects[..., 3]))
+
+
+def rects_intersect_batch(rects1: np.ndarray, rects2: np.ndarray) -> np.ndarray:
+    """
+    Check pairs of rectangles for intersection, as rects_intersect does
+    
+    Inputs broadcast, so rects1[:, None] against rects2[None] tests all pairs.
+    
+    Args:
+        rects1: (..., 4) array of rectangles (x, y, width, height)
+        rects2: (..., 4) array of rectangles (x, y, width, height)
+        
+    Returns:
+        Boolean array, True where the rectangles intersect
+    """
+    a = np.asarray(rects1)
+    b = np.asarray(rects2)
+    return ~((a[..., 0] + a[..., 2] < b[..., 0]) |
+             (b[..., 0] + b[..., 2] < a[..., 0]) |
+             (a[..., 1] + a[..., 3] < b[..., 1]) |
+             (b[..., 1] + b[..., 3] < a[..., 1]))
+
+
+def circles_intersect_batch(centers1: np.ndarray, radii1: np.ndarray,
+                            centers2: np.ndarray, radii2: np.ndarray) -> np.ndarray:
+    """
+    Check pairs of circles for intersection, as circles_intersect does
+    
+    Compares squared distances, so no square roots are taken. Inputs
+    broadcast like rects_intersect_batch.
+    
+    Args:
+        centers1: (..., 2) array of first circle centers
+        radii1: (...) array of first circle radii
+        centers2: (..., 2) array of second circle centers
+        radii2: (...) array of second circle radii
+        
+    Returns:
+        Boolean array, True where the circles intersect
+    """
+    d = np.asarray(centers2, dtype=np.float64) - np.asarray(centers1, dtype=np.float64)
+    reach = np.asarray(radii1, dtype=np.float64) + np.asarray(radii2, dtype=np.float64)
+    return np.einsum('...i,...i->...', d, d) <= reach * reach
+
+
 def bezier_curve(p0: Tuple[float, float], p1: Tuple[float, float],
                 p2: Tuple[float, float], p3: Tuple[float, float], t: float) -> Tuple[float, float]:
     """
@@ -313,7 +533,7 @@ def bezier_curve(p0: Tuple[float, float], p1: Tuple[float, float],
     Returns:
         Point on curve
     """
-    t = clamp(t, 0.0, 1.0)
+    t = _clamp01(t)
     u = 1.0 - t
     tt = t * t
     uu = u * u
@@ -326,6 +546,29 @@ def bezier_curve(p0: Tuple[float, float], p1: Tuple[float, float],
     return (x, y)
 
 
+def bezier_curve_many(p0: Tuple[float, float], p1: Tuple[float, float],
+                      p2: Tuple[float, float], p3: Tuple[float, float],
+                      ts: np.ndarray) -> np.ndarray:
+    """
+    Calculate points on a cubic Bezier curve for many parameters at once
+    
+    Args:
+        p0: Start point (x, y)
+        p1: First control point (x, y)
+        p2: Second control point (x, y)
+        p3: End point (x, y)
+        ts: (N,) array of parameters (0.0 to 1.0)
+        
+    Returns:
+        (N, 2) array of points on the curve
+    """
+    t = np.clip(np.asarray(ts, dtype=np.float64), 0.0, 1.0)
+    u = 1.0 - t
+    basis = np.stack((u * u * u, 3 * u * u * t, 3 * u * t * t, t * t * t), axis=1)
+    return basis @ np.array((p0, p1, p2, p3), dtype=np.float64)
+
+
+@njit('float64(float64)', cache=True, fastmath=True)
 def ease_in_out(t: float) -> float:
     """
     Ease-in-out function for smooth transitions
@@ -336,7 +579,7 @@ def ease_in_out(t: float) -> float:
     Returns:
         Eased value
     """
-    t = clamp(t, 0.0, 1.0)
+    t = _clamp(t, 0.0, 1.0)
     return t * t * (3.0 - 2.0 * t)
 
 
@@ -350,7 +593,7 @@ def ease_in(t: float) -> float:
     Returns:
         Eased value
     """
-    t = clamp(t, 0.0, 1.0)
+    t = _clamp01(t)
     return t * t
 
 
@@ -364,10 +607,44 @@ def ease_out(t: float) -> float:
     Returns:
         Eased value
     """
-    t = clamp(t, 0.0, 1.0)
+    t = _clamp01(t)
     return 1.0 - (1.0 - t) * (1.0 - t)
 
 
+# The noise kernels are off the per-frame path, so they compile lazily on
+# first use; the wrappers coerce arguments so each gets one specialization
+@njit(cache=True)
+def _noise_2d(x, y, seed):
+    """Hash-based noise kernel behind noise_2d"""
+    # Simple hash-based noise
+    n = int(x + y * 57 + seed * 131)
+    n = (n << 13) ^ n
+    return (1.0 - ((n * (n * n * 15731 + 789221) + 1376312589) & 0x7fffffff) / 1073741824.0)
+
+
+@njit(cache=True)
+def _octave_weight(octaves, persistence):
+    """Sum of the octave amplitudes, persistence**i for i < octaves, in closed form"""
+    if persistence == 1.0:
+        return float(octaves)
+    return (1.0 - persistence ** octaves) / (1.0 - persistence)
+
+
+@njit(cache=True)
+def _perlin_noise_2d(x, y, octaves, persistence):
+    """Octave-summing kernel behind perlin_noise_2d"""
+    total = 0.0
+    frequency = 1.0
+    amplitude = 1.0
+    
+    for i in range(octaves):
+        total += _noise_2d(x * frequency, y * frequency, i) * amplitude
+        amplitude *= persistence
+        frequency *= 2.0
+    
+    return total / _octave_weight(octaves, persistence)
+
+
 def noise_2d(x: float, y: float, seed: int = 0) -> float:
     """
     Simple 2D noise function
@@ -380,10 +657,7 @@ def noise_2d(x: float, y: float, seed: int = 0) -> float:
     Returns:
         Noise value (-1.0 to 1.0)
     """
-    # Simple hash-based noise
-    n = int(x + y * 57 + seed * 131)
-    n = (n << 13) ^ n
-    return (1.0 - ((n * (n * n * 15731 + 789221) + 1376312589) & 0x7fffffff) / 1073741824.0)
+    return _noise_2d(float(x), float(y), int(seed))
 
 
 def perlin_noise_2d(x: float, y: float, octaves: int = 4, persistence: float = 0.5) -> float:
@@ -399,18 +673,18 @@ def perlin_noise_2d(x: float, y: float, octaves: int = 4, persistence: float = 0
     Returns:
         Noise value (-1.0 to 1.0)
     """
-    total = 0.0
-    frequency = 1.0
-    amplitude = 1.0
-    max_value = 0.0
-    
-    for i in range(octaves):
-        total += noise_2d(x * frequency, y * frequency, i) * amplitude
-        max_value += amplitude
-        amplitude *= persistence
-        frequency *= 2.0
-    
-    return total / max_value
+    return _perlin_noise_2d(float(x), float(y), int(octaves), float(persistence))
+
+
+@njit(cache=True, parallel=True)
+def _noise_map_kernel(width, height, scale, octaves):
+    """Evaluate perlin_noise_2d for every pixel, one row per thread"""
+    noise_map = np.empty((height, width))
+    for y in prange(height):
+        ny = y / scale
+        for x in range(width):
+            noise_map[y, x] = _perlin_noise_2d(x / scale, ny, octaves, 0.5)
+    return noise_map
 
 
 def generate_noise_map(width: int, height: int, scale: float = 50.0, octaves: int = 4) -> List[List[float]]:
@@ -426,16 +700,45 @@ def generate_noise_map(width: int, height: int, scale: float = 50.0, octaves: in
     Returns:
         2D noise map
     """
-    noise_map = []
-    for y in range(height):
-        row = []
-        for x in range(width):
-            nx = x / scale
-            ny = y / scale
-            value = perlin_noise_2d(nx, ny, octaves)
-            row.append(value)
-        noise_map.append(row)
-    return noise_map
+    return generate_noise_array(width, height, scale, octaves).tolist()
+
+
+def generate_noise_array(width: int, height: int, scale: float = 50.0, octaves: int = 4) -> np.ndarray:
+    """
+    Generate a 2D noise map as an array
+    
+    Uses the compiled per-pixel kernel when Numba is available; otherwise
+    computes every pixel at once with NumPy, one octave at a time.
+    
+    Args:
+        width: Map width
+        height: Map height
+        scale: Noise scale
+        octaves: Number of octaves
+        
+    Returns:
+        (height, width) float64 array of noise values
+    """
+    if NUMBA_AVAILABLE:
+        return _noise_map_kernel(int(width), int(height), float(scale), int(octaves))
+    
+    nx = np.arange(width) / scale
+    ny = np.arange(height) / scale
+    total = np.zeros((height, width))
+    frequency = 1.0
+    amplitude = 1.0
+    
+    for i in range(octaves):
+        # Same hash as noise_2d; int64 wraparound leaves the low 31 bits
+        # it keeps identical to Python's unbounded ints
+        n = ((nx * frequency)[None, :] + (ny * frequency * 57)[:, None] + i * 131).astype(np.int64)
+        n = (n << 13) ^ n
+        noise = 1.0 - ((n * (n * n * 15731 + 789221) + 1376312589) & 0x7fffffff) / 1073741824.0
+        total += noise * amplitude
+        amplitude *= 0.5
+        frequency *= 2.0
+    
+    return total / _octave_weight(octaves, 0.5)
 
 
 if __name__ == "__main__":
@@ -10,16 +10,20 @@ Author: Cursor IDE Demo
 Version: 1.0.0
 """
 
+import asyncio
+import functools
 import time
 import psutil
+import numpy as np
 import threading
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, Optional, Callable, Any, Tuple
 from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from .logger import get_logger
+from .jit import njit, NUMBA_AVAILABLE
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PerformanceMetrics:
     """Data class for performance metrics"""
     fps: float
@@ -30,6 +34,44 @@ class PerformanceMetrics:
     timestamp: float
 
 
+# Returned while there is no history yet; immutable, so one instance serves
+_EMPTY_METRICS = PerformanceMetrics(
+    fps=0.0,
+    frame_time=0.0,
+    cpu_usage=0.0,
+    memory_usage=0.0,
+    memory_available=0.0,
+    timestamp=0.0
+)
+
+# Row order of PerformanceMonitor's metrics history buffer
+_METRIC_FIELDS = tuple(field.name for field in fields(PerformanceMetrics))
+_TIMESTAMP_ROW = _METRIC_FIELDS.index('timestamp')
+
+# Bytes to GiB; a power of two, so multiplying is exact
+_INV_GIB = 1.0 / (1 << 30)
+
+
+# Only reached from get_stats(), so compiled lazily on first use
+@njit(cache=True, fastmath={'reassoc', 'contract'})
+def _fps_stats_kernel(frame_times_ns):
+    """
+    Min, max and mean FPS of positive nanosecond frame times, in one pass
+    
+    The array must not be empty: the first element is read without a
+    bounds check. Every caller checks for empty input first.
+    """
+    min_fps = max_fps = total = 1e9 / frame_times_ns[0]
+    for i in range(1, frame_times_ns.shape[0]):
+        fps = 1e9 / frame_times_ns[i]
+        total += fps
+        if fps < min_fps:
+            min_fps = fps
+        if fps > max_fps:
+            max_fps = fps
+    return min_fps, max_fps, total / frame_times_ns.shape[0]
+
+
 class FPSMonitor:
     """
     FPS (Frames Per Second) monitoring system
@@ -46,12 +88,21 @@ class FPSMonitor:
             sample_size: Number of frames to average for FPS calculation
         """
         self.sample_size = sample_size
+        # Frame times in integer nanoseconds, so the running total is exact
         self.frame_times = deque(maxlen=sample_size)
-        self.last_frame_time = time.time()
+        # Running total of frame_times, kept in step with the deque
+        self._sum = 0
+        # (fps, frame time in ms), published as one object for other threads
+        self._latest = (0.0, 0.0)
+        self.last_frame_time_ns = time.perf_counter_ns()
         self.fps = 0.0
         self.frame_count = 0
         self.start_time = time.time()
         
+        if sample_size == 1:
+            # The average is just the latest frame time; skip the bookkeeping
+            self.update = self._update_single
+        
         self.logger = get_logger("FPSMonitor")
     
     def update(self) -> float:
@@ -61,23 +112,51 @@ class FPSMonitor:
         Returns:
             Current FPS value
         """
-        current_time = time.time()
-        frame_time = current_time - self.last_frame_time
+        now = time.perf_counter_ns()
+        frame_time = now - self.last_frame_time_ns
         
         if frame_time > 0:
+            if len(self.frame_times) == self.sample_size:
+                # The append below evicts the oldest sample
+                self._sum -= self.frame_times[0]
             self.frame_times.append(frame_time)
+            self._sum += frame_time
             self.frame_count += 1
         
-        self.last_frame_time = current_time
+        self.last_frame_time_ns = now
         
         # Calculate FPS
-        if len(self.frame_times) > 0:
-            avg_frame_time = sum(self.frame_times) / len(self.frame_times)
-            self.fps = 1.0 / avg_frame_time if avg_frame_time > 0 else 0.0
+        n = len(self.frame_times)
+        if n:
+            # Every recorded frame time is positive, so the sum is too
+            fps = n * 1e9 / self._sum
+            frame_time_ms = self._sum / (n * 1e6)
         else:
-            self.fps = 0.0
+            fps = frame_time_ms = 0.0
         
-        return self.fps
+        self.fps = fps
+        # A single reference store: a reader on another thread sees either
+        # the previous pair or this one, never a mix of the two
+        self._latest = (fps, frame_time_ms)
+        return fps
+    
+    def _update_single(self) -> float:
+        """update() specialised for sample_size == 1"""
+        now = time.perf_counter_ns()
+        frame_time = now - self.last_frame_time_ns
+        self.last_frame_time_ns = now
+        
+        if frame_time <= 0:
+            return self.fps
+        
+        self.frame_times.append(frame_time)
+        self._sum = frame_time
+        self.frame_count += 1
+        
+        fps = 1e9 / frame_time
+        self.fps = fps
+        self._latest = (fps, frame_time / 1e6)
+        return fps
     
     def get_fps(self) -> float:
         """Get current FPS value"""
@@ -85,9 +164,11 @@ class FPSMonitor:
     
     def get_frame_time(self) -> float:
         """Get average frame time in milliseconds"""
-        if len(self.frame_times) > 0:
-            return (sum(self.frame_times) / len(self.frame_times)) * 1000.0
-        return 0.0
+        return self._latest[1]
+    
+    def get_latest(self) -> Tuple[float, float]:
+        """Get the current FPS and average frame time in ms as one consistent pair"""
+        return self._latest
     
     def get_stats(self) -> Dict[str, float]:
         """Get FPS statistics"""
@@ -100,24 +181,33 @@ class FPSMonitor:
                 'avg_fps': 0.0
             }
         
-        frame_times = list(self.frame_times)
-        fps_values = [1.0 / ft if ft > 0 else 0.0 for ft in frame_times]
+        # Only positive frame times are recorded, so no zero check is needed
+        frame_times = np.fromiter(self.frame_times, dtype=np.float64, count=len(self.frame_times))
+        if NUMBA_AVAILABLE:
+            min_fps, max_fps, avg_fps = _fps_stats_kernel(frame_times)
+        else:
+            fps_values = 1e9 / frame_times
+            min_fps = float(fps_values.min())
+            max_fps = float(fps_values.max())
+            avg_fps = float(fps_values.mean())
         
         return {
             'fps': self.fps,
             'frame_time': self.get_frame_time(),
-            'min_fps': min(fps_values),
-            'max_fps': max(fps_values),
-            'avg_fps': sum(fps_values) / len(fps_values)
+            'min_fps': min_fps,
+            'max_fps': max_fps,
+            'avg_fps': avg_fps
         }
     
     def reset(self) -> None:
         """Reset FPS monitor"""
         self.frame_times.clear()
+        self._sum = 0
+        self._latest = (0.0, 0.0)
         self.fps = 0.0
         self.frame_count = 0
         self.start_time = time.time()
-        self.last_frame_time = time.time()
+        self.last_frame_time_ns = time.perf_counter_ns()
 
 
 class PerformanceMonitor:
@@ -139,8 +229,18 @@ class PerformanceMonitor:
             update_interval: Update interval in seconds
         """
         self.update_interval = update_interval
-        self.metrics_history: List[PerformanceMetrics] = []
         self.max_history_size = 300  # 5 minutes at 1 second intervals
+        # Ring buffer with one row per PerformanceMetrics field and one column
+        # per sample, so averages reduce each field in a single pass. Every
+        # sample is stored twice, max_history_size columns apart, so the
+        # history in time order is always one contiguous slice
+        self._history = np.zeros((len(_METRIC_FIELDS), 2 * self.max_history_size))
+        self._history_next = 0
+        self._history_len = 0
+        self._history_count = 0  # Samples written since the last reset
+        self._history_lock = threading.Lock()
+        # Last averaging window, as (count, first sample number), and its means
+        self._average_cache = (None, None)
         
         self.fps_monitor = FPSMonitor()
         self.cpu_usage = 0.0
@@ -149,8 +249,15 @@ class PerformanceMonitor:
         
         self.running = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self.monitor_task: Optional[asyncio.Task] = None
+        self._stop_event = threading.Event()
+        # time.monotonic() deadline for the next on-demand sample, see poll()
+        self._next_sample = 0.0
         self.logger = get_logger("PerformanceMonitor")
         
+        # Prime the non-blocking CPU sampler; its first call always returns 0.0
+        psutil.cpu_percent(interval=None)
+        
         # Performance thresholds
         self.fps_threshold = 30.0
         self.cpu_threshold = 80.0
@@ -162,13 +269,31 @@ class PerformanceMonitor:
             return
         
         self.running = True
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self.monitor_thread.start()
+        self._stop_event.clear()
+        
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        
+        if loop is not None:
+            # Inside an event loop, sample from a task instead of a thread
+            self.monitor_task = loop.create_task(self._monitor_coro())
+        else:
+            self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+            self.monitor_thread.start()
         self.logger.info("Performance monitoring started")
     
     def stop(self) -> None:
-        """Stop performance monitoring"""
+        """Stop performance monitoring; does nothing if start() was not called"""
+        if not self.running:
+            return
+        
         self.running = False
+        self._stop_event.set()
+        if self.monitor_task:
+            self.monitor_task.cancel()
+            self.monitor_task = None
         if self.monitor_thread:
             self.monitor_thread.join(timeout=2.0)
         self.logger.info("Performance monitoring stopped")
@@ -178,53 +303,91 @@ class PerformanceMonitor:
         while self.running:
             try:
                 self._update_metrics()
-                time.sleep(self.update_interval)
             except Exception as e:
                 self.logger.error(f"Error in performance monitoring: {e}")
+            # Wakes early when stop() is called
+            self._stop_event.wait(self.update_interval)
+    
+    async def _monitor_coro(self) -> None:
+        """Monitoring loop for use inside a running asyncio event loop"""
+        while self.running:
+            try:
+                self._update_metrics()
+            except Exception as e:
+                self.logger.error(f"Error in performance monitoring: {e}")
+            await asyncio.sleep(self.update_interval)
+    
+    def poll(self) -> None:
+        """
+        Sample metrics if update_interval has passed since the last sample
+        
+        Lets a caller drive sampling from its own loop instead of running
+        the background sampler from start().
+        """
+        now = time.monotonic()
+        if now >= self._next_sample:
+            self._next_sample = now + self.update_interval
+            self._update_metrics()
     
     def _update_metrics(self) -> None:
         """Update performance metrics"""
-        # Get CPU usage
-        self.cpu_usage = psutil.cpu_percent(interval=0.1)
+        # Get CPU usage since the previous call, without blocking
+        self.cpu_usage = psutil.cpu_percent(interval=None)
         
         # Get memory usage
         memory = psutil.virtual_memory()
         self.memory_usage = memory.percent
-        self.memory_available = memory.available / (1024**3)  # GB
+        self.memory_available = memory.available * _INV_GIB  # GB
         
-        # Create metrics object
+        # Create metrics object; the FPS pair is read in one go because the
+        # render thread keeps updating it
+        fps, frame_time = self.fps_monitor.get_latest()
         metrics = PerformanceMetrics(
-            fps=self.fps_monitor.get_fps(),
-            frame_time=self.fps_monitor.get_frame_time(),
+            fps=fps,
+            frame_time=frame_time,
             cpu_usage=self.cpu_usage,
             memory_usage=self.memory_usage,
             memory_available=self.memory_available,
             timestamp=time.time()
         )
         
-        # Add to history
-        self.metrics_history.append(metrics)
-        if len(self.metrics_history) > self.max_history_size:
-            self.metrics_history.pop(0)
+        # Add to history, overwriting the oldest sample when full
+        sample = (
+            metrics.fps, metrics.frame_time, metrics.cpu_usage,
+            metrics.memory_usage, metrics.memory_available, metrics.timestamp
+        )
+        with self._history_lock:
+            self._history[:, self._history_next] = sample
+            self._history[:, self._history_next + self.max_history_size] = sample
+            self._history_next = (self._history_next + 1) % self.max_history_size
+            self._history_len = min(self._history_len + 1, self.max_history_size)
+            self._history_count += 1
         
         # Check for performance issues
         self._check_performance_alerts(metrics)
     
     def _check_performance_alerts(self, metrics: PerformanceMetrics) -> None:
         """Check for performance issues and log alerts"""
+        low_fps = metrics.fps < self.fps_threshold
+        high_cpu = metrics.cpu_usage > self.cpu_threshold
+        high_memory = metrics.memory_usage > self.memory_threshold
+        
+        # The common case: nothing to report, so nothing to build
+        if not (low_fps or high_cpu or high_memory):
+            return
+        
         alerts = []
         
-        if metrics.fps < self.fps_threshold:
+        if low_fps:
             alerts.append(f"Low FPS: {metrics.fps:.1f}")
         
-        if metrics.cpu_usage > self.cpu_threshold:
+        if high_cpu:
             alerts.append(f"High CPU: {metrics.cpu_usage:.1f}%")
         
-        if metrics.memory_usage > self.memory_threshold:
+        if high_memory:
             alerts.append(f"High Memory: {metrics.memory_usage:.1f}%")
         
-        if alerts:
-            self.logger.warning(f"Performance alerts: {' | '.join(alerts)}")
+        self.logger.warning(f"Performance alerts: {' | '.join(alerts)}")
     
     def update_fps(self) -> float:
         """Update FPS calculation"""
@@ -232,39 +395,41 @@ class PerformanceMonitor:
     
     def get_current_metrics(self) -> PerformanceMetrics:
         """Get current performance metrics"""
-        if not self.metrics_history:
-            return PerformanceMetrics(
-                fps=0.0,
-                frame_time=0.0,
-                cpu_usage=0.0,
-                memory_usage=0.0,
-                memory_available=0.0,
-                timestamp=time.time()
-            )
-        return self.metrics_history[-1]
+        if not self.running:
+            # No background sampler, so sample on demand
+            self.poll()
+        with self._history_lock:
+            if self._history_len:
+                column = self._history_next + self.max_history_size - 1
+                return PerformanceMetrics(*self._history[:, column].tolist())
+        return _EMPTY_METRICS
     
     def get_average_metrics(self, duration: float = 60.0) -> PerformanceMetrics:
         """Get average metrics over a time period"""
-        if not self.metrics_history:
-            return self.get_current_metrics()
-        
         cutoff_time = time.time() - duration
-        recent_metrics = [
-            m for m in self.metrics_history 
-            if m.timestamp >= cutoff_time
-        ]
+        with self._history_lock:
+            end = self._history_next + self.max_history_size
+            history = self._history[:, end - self._history_len:end]
+            # Timestamps are in time order, so the window starts at the first
+            # sample at or after the cutoff
+            start = int(np.searchsorted(history[_TIMESTAMP_ROW], cutoff_time))
+            if start == self._history_len:
+                means = None
+            else:
+                # The window only changes when a sample is added or ages out,
+                # so repeated calls in between reuse the previous means
+                window = (self._history_count, self._history_count - self._history_len + start)
+                cached_window, means = self._average_cache
+                if window != cached_window:
+                    means = history[:, start:].mean(axis=1)
+                    self._average_cache = (window, means)
         
-        if not recent_metrics:
+        if means is None:
             return self.get_current_metrics()
         
-        return PerformanceMetrics(
-            fps=sum(m.fps for m in recent_metrics) / len(recent_metrics),
-            frame_time=sum(m.frame_time for m in recent_metrics) / len(recent_metrics),
-            cpu_usage=sum(m.cpu_usage for m in recent_metrics) / len(recent_metrics),
-            memory_usage=sum(m.memory_usage for m in recent_metrics) / len(recent_metrics),
-            memory_available=sum(m.memory_available for m in recent_metrics) / len(recent_metrics),
-            timestamp=time.time()
-        )
+        averages = dict(zip(_METRIC_FIELDS, means.tolist()))
+        averages['timestamp'] = time.time()
+        return PerformanceMetrics(**averages)
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get a comprehensive performance summary"""
@@ -304,7 +469,11 @@ class PerformanceMonitor:
     
     def reset(self) -> None:
         """Reset performance monitor"""
-        self.metrics_history.clear()
+        with self._history_lock:
+            self._history_next = 0
+            self._history_len = 0
+            self._history_count = 0
+            self._average_cache = (None, None)
         self.fps_monitor.reset()
         self.logger.info("Performance monitor reset")
 
@@ -327,26 +496,27 @@ class PerformanceProfiler:
         """
         self.name = name
         self.logger = logger or get_logger("PerformanceProfiler")
-        self.start_time = None
-        self.end_time = None
+        # Monotonic perf_counter_ns() readings
+        self.start_ns: Optional[int] = None
+        self.end_ns: Optional[int] = None
     
     def __enter__(self):
         """Context manager entry"""
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        self.end_time = time.time()
-        duration = self.end_time - self.start_time
-        self.logger.performance(self.name, duration)
+        self.end_ns = time.perf_counter_ns()
+        # DemoLogger.performance skips all formatting when INFO is disabled
+        self.logger.performance(self.name, (self.end_ns - self.start_ns) / 1e9)
     
     def get_duration(self) -> float:
-        """Get profiling duration"""
-        if self.start_time is None:
+        """Get profiling duration in seconds"""
+        if self.start_ns is None:
             return 0.0
-        end_time = self.end_time or time.time()
-        return end_time - self.start_time
+        end_ns = self.end_ns if self.end_ns is not None else time.perf_counter_ns()
+        return (end_ns - self.start_ns) / 1e9
 
 
 # Global performance monitor instance
@@ -364,9 +534,14 @@ def get_performance_monitor() -> PerformanceMonitor:
 def profile_operation(name: str):
     """Decorator for profiling operations"""
     def decorator(func: Callable) -> Callable:
+        # Same timing as PerformanceProfiler, without a profiler object per call
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            with PerformanceProfiler(name):
+            start_ns = time.perf_counter_ns()
+            try:
                 return func(*args, **kwargs)
+            finally:
+                get_logger("PerformanceProfiler").performance(name, (time.perf_counter_ns() - start_ns) / 1e9)
         return wrapper
     return decorator
 
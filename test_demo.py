@@ -54,6 +54,55 @@ def test_configuration():
         print(f"❌ Configuration failed: {e}")
         return False
 
+def test_config_parser_parity():
+    """Test the fast INI reader against configparser"""
+    print("\n🧪 Testing Config Parser Parity...")
+    try:
+        import configparser
+        import tempfile
+        from config.config_manager import _fast_parse, _new_parser, _UNSUPPORTED
+        
+        samples = [
+            # Plain files the fast path handles itself
+            "; Demo settings\n\n[Display]\nWidth = 800\nheight=600\r\n# note\n[Audio]\nvolume = 0.5 \n",
+            "[ Spaced ]\nkey = a = b\nempty =\n",
+            # Files that must fall back to configparser
+            "[Display] ; window settings\nwidth = 800\n",
+            "[Display]\na:b = c\n",
+            "[Display]\n[x = 1\n",
+            "[DEFAULT]\nfps = 30\n[Display]\nwidth = 800\n",
+            "fps = 30\n[Display]\nwidth = 800\n",
+            "[Display]\nwidth = 800\n  continued\n",
+        ]
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "sample.ini"
+            for i, text in enumerate(samples):
+                path.write_text(text, encoding='utf-8')
+                parser = _new_parser()
+                try:
+                    parser.read_string(text)
+                    expected = {s: dict(parser.items(s, raw=True)) for s in parser.sections()}
+                except configparser.Error as e:
+                    expected = type(e)
+                try:
+                    actual = _fast_parse(path)
+                except configparser.Error as e:
+                    actual = type(e)
+                if actual != expected:
+                    print(f"❌ Sample {i}: {actual!r} != {expected!r}")
+                    return False
+        
+        if _UNSUPPORTED.search(samples[0]) or _UNSUPPORTED.search(samples[1]):
+            print("❌ Plain samples did not take the fast path")
+            return False
+        
+        print(f"✅ {len(samples)} samples match configparser")
+        return True
+    except Exception as e:
+        print(f"❌ Config parser parity failed: {e}")
+        return False
+
 def test_logging():
     """Test logging system"""
     print("\n🧪 Testing Logging System...")
@@ -120,6 +169,122 @@ def test_math_utils():
         print(f"❌ Math utilities failed: {e}")
         return False
 
+def test_color_helpers():
+    """Test color parsing, packing and batch helpers"""
+    print("\n🧪 Testing Color Helpers...")
+    try:
+        import colorsys
+        import numpy as np
+        from utils.color_utils import (Color, hex_to_rgb, pack32_array, hsv_to_rgb_array,
+                                       random_colors)
+        
+        # Hex parsing, including strings int(s, 16) would also accept
+        if hex_to_rgb("#FF8000") != (255, 128, 0) or hex_to_rgb("#abc") != (170, 187, 204):
+            print("❌ hex_to_rgb parsed a valid color wrongly")
+            return False
+        for bad in ("fff_ff", "+fffff", " fffff", "+ff", "#ggg"):
+            try:
+                hex_to_rgb(bad)
+            except ValueError:
+                continue
+            print(f"❌ hex_to_rgb accepted {bad!r}")
+            return False
+        print("✅ hex_to_rgb")
+        
+        # pack32 / unpack32 round trip, and the bulk packer against pack32
+        rng = np.random.default_rng(1)
+        rgba = rng.integers(0, 256, size=(64, 4))
+        colors = [Color(*map(int, c)) for c in rgba]
+        packed = [c.pack32() for c in colors]
+        if [Color.unpack32(p).pack32() for p in packed] != packed:
+            print("❌ pack32/unpack32 round trip changed a color")
+            return False
+        if pack32_array(rgba).tolist() != packed:
+            print("❌ pack32_array does not match pack32")
+            return False
+        print("✅ pack32 / unpack32 / pack32_array")
+        
+        # Batch HSV conversion against colorsys, and random_colors output
+        h, s, v = rng.random(64), rng.random(64), rng.random(64)
+        expected = [[int(c * 255) for c in colorsys.hsv_to_rgb(*hsv)] for hsv in zip(h, s, v)]
+        if hsv_to_rgb_array(h, s, v).tolist() != expected:
+            print("❌ hsv_to_rgb_array does not match colorsys")
+            return False
+        for style in ('bright', 'pastel', 'dark', 'any'):
+            batch = random_colors(32, style, rng=rng)
+            if batch.shape != (32, 3) or batch.dtype != np.uint8:
+                print(f"❌ random_colors({style!r}) returned {batch.shape} {batch.dtype}")
+                return False
+        print("✅ hsv_to_rgb_array / random_colors")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Color helpers failed: {e}")
+        return False
+
+def test_math_batch_helpers():
+    """Test the batch geometry and noise helpers against their scalar versions"""
+    print("\n🧪 Testing Math Batch Helpers...")
+    try:
+        import numpy as np
+        from utils import math_utils
+        from utils.math_utils import (point_in_rect, point_in_rects, rects_intersect,
+                                      rects_intersect_batch, circles_intersect,
+                                      circles_intersect_batch, bezier_curve,
+                                      bezier_curve_many, perlin_noise_2d,
+                                      generate_noise_map, generate_noise_array)
+        
+        rng = np.random.default_rng(2)
+        points = rng.uniform(0, 100, size=(40, 2))
+        rects = np.concatenate([rng.uniform(0, 80, size=(30, 2)), rng.uniform(0, 40, size=(30, 2))], axis=1)
+        centers = rng.uniform(0, 100, size=(30, 2))
+        radii = rng.uniform(0, 30, size=30)
+        
+        checks = {
+            'point_in_rects': (
+                point_in_rects(points[:, None], rects[None]),
+                [[point_in_rect(p, r) for r in rects] for p in points]),
+            'rects_intersect_batch': (
+                rects_intersect_batch(rects[:, None], rects[None]),
+                [[rects_intersect(a, b) for b in rects] for a in rects]),
+            'circles_intersect_batch': (
+                circles_intersect_batch(centers[:, None], radii[:, None], centers[None], radii[None]),
+                [[circles_intersect(c1, r1, c2, r2) for c2, r2 in zip(centers, radii)]
+                 for c1, r1 in zip(centers, radii)]),
+        }
+        for name, (batch, scalar) in checks.items():
+            if batch.tolist() != scalar:
+                print(f"❌ {name} does not match its scalar version")
+                return False
+        
+        curve = ((0, 0), (30, 80), (70, -20), (100, 50))
+        ts = np.linspace(-0.2, 1.2, 29)
+        if not np.allclose(bezier_curve_many(*curve, ts), [bezier_curve(*curve, t) for t in ts]):
+            print("❌ bezier_curve_many does not match bezier_curve")
+            return False
+        print("✅ Batch geometry matches the scalar helpers")
+        
+        # Noise maps with Numba on (when installed) and off, against the scalar noise
+        expected = [[perlin_noise_2d(x / 10.0, y / 10.0, 3) for x in range(24)] for y in range(16)]
+        modes = [True, False] if math_utils.NUMBA_AVAILABLE else [False]
+        try:
+            for enabled in modes:
+                math_utils.NUMBA_AVAILABLE = enabled
+                if not np.allclose(generate_noise_array(24, 16, 10.0, 3), expected):
+                    print(f"❌ generate_noise_array (numba={enabled}) does not match perlin_noise_2d")
+                    return False
+                if not np.allclose(generate_noise_map(24, 16, 10.0, 3), expected):
+                    print(f"❌ generate_noise_map (numba={enabled}) does not match perlin_noise_2d")
+                    return False
+        finally:
+            math_utils.NUMBA_AVAILABLE = modes[0]
+        print(f"✅ Noise maps match perlin_noise_2d (numba: {modes})")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Math batch helpers failed: {e}")
+        return False
+
 def test_particle_system():
     """Test particle system"""
     print("\n🧪 Testing Particle System...")
@@ -139,6 +304,17 @@ def test_particle_system():
         particle_count = particle_system.get_total_particles()
         print(f"✅ Particle count: {particle_count}")
         
+        # Run long enough for particles to be emitted and expire
+        for _ in range(150):
+            particle_system.update(0.016)
+        
+        buffer = fire_emitter.particles
+        alive = buffer.life[:len(buffer)]
+        if (alive <= 0).any():
+            print("❌ Dead particles left in buffer")
+            return False
+        print(f"✅ Particle count after 150 frames: {particle_system.get_total_particles()}")
+        
         return True
     except Exception as e:
         print(f"❌ Particle system failed: {e}")
@@ -152,9 +328,12 @@ def main():
     tests = [
         test_platform_detection,
         test_configuration,
+        test_config_parser_parity,
         test_logging,
         test_performance,
         test_math_utils,
+        test_color_helpers,
+        test_math_batch_helpers,
         test_particle_system
     ]
     